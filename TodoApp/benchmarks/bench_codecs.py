@@ -0,0 +1,66 @@
+"""File backend codecs: encode/decode throughput of the json and compact layouts.
+
+"records" is the text <-> record step alone; "entities" includes building
+Task objects, which is what repository reads pay.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_codecs [--size 50000]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.persistence.codecs import CODECS
+
+
+def make_tasks(size: int) -> list[Task]:
+
+    now = datetime.now(timezone.utc)
+    project_ids = [uuid4() for _ in range(100)]
+    tasks = []
+    for i in range(size):
+        task = Task(title=f"Task {i}", description="Something to do", project_id=project_ids[i % 100])
+        if i % 2:
+            task.due_date = Deadline(now + timedelta(days=1 + i % 30))
+        if i % 3 == 0:
+            task.complete(notes="done")
+        tasks.append(task)
+    return tasks
+
+
+def rate(size: int, fn) -> float:
+
+    start = time.perf_counter()
+    fn()
+    return size / (time.perf_counter() - start)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=50_000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.size)
+    print(f"{args.size:,} tasks, records per second")
+
+    for codec in CODECS.values():
+        records = [codec.encode_task(t) for t in tasks]
+        text = codec.dumps(records)
+
+        encode = rate(args.size, lambda: codec.dumps([codec.encode_task(t) for t in tasks]))
+        decode_records = rate(args.size, lambda: codec.loads(text))
+        decode_entities = rate(args.size, lambda: [codec.decode_task(r) for r in codec.loads(text)])
+
+        print(
+            f"{codec.name:<8} | {len(text) / 2**20:>6.1f} MiB | encode {encode:>10,.0f} | "
+            f"decode records {decode_records:>10,.0f} | decode entities {decode_entities:>9,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
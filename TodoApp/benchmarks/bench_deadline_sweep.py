@@ -0,0 +1,91 @@
+"""Deadline sweep: scanning every active task vs the due-date range query.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_deadline_sweep [--size 300000]
+"""
+import argparse
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+from todo_app.application.use_cases.deadline_use_cases import CheckDeadlinesUseCase
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.notifications.recorder import NotificationRecorder
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+from todo_app.infrastructure.persistence.sqlite import SqliteDatabase, SqliteTaskRepository
+
+WARNING_THRESHOLD = timedelta(days=1)
+
+
+class QuietRecorder(NotificationRecorder):
+
+    def notify_task_deadline_approaching(self, task: Task, days_remaining: int) -> None:
+        self.deadline_warnings.append((task.id, days_remaining))
+
+
+def make_tasks(size: int) -> list[Task]:
+
+    now = datetime.now(timezone.utc)
+    project_ids = [uuid4() for _ in range(100)]
+    tasks = []
+    for i in range(size):
+        # Deadlines spread over a year, so roughly 1/365 of them fall in the window.
+        due = Deadline(now + timedelta(minutes=5 + random.randrange(365 * 24 * 60)))
+        tasks.append(Task(title=f"Task {i}", description="", project_id=project_ids[i % 100], due_date=due))
+    return tasks
+
+
+def full_scan_sweep(repo) -> int:
+    """The sweep as it was before find_due_between."""
+
+    sent = 0
+    for task in repo.get_active_tasks():
+        if task.due_date and task.due_date.is_approaching(WARNING_THRESHOLD):
+            sent += 1
+    return sent
+
+
+def measure(name: str, repo) -> None:
+
+    start = time.perf_counter()
+    scanned = full_scan_sweep(repo)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = CheckDeadlinesUseCase(repo, QuietRecorder(), WARNING_THRESHOLD).execute()
+    range_time = time.perf_counter() - start
+
+    print(
+        f"{name:<7} | full scan: {scan_time * 1000:>8.1f} ms ({scanned} due) | "
+        f"range query: {range_time * 1000:>7.1f} ms ({result.value['notifications_sent']} due)"
+    )
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=300_000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.size)
+    print(f"{args.size:,} active tasks with deadlines")
+
+    memory_repo = InMemoryTaskRepository()
+    memory_repo.save_many(tasks)
+    measure("memory", memory_repo)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database = SqliteDatabase(Path(tmp) / "bench.db")
+        sqlite_repo = SqliteTaskRepository(database)
+        sqlite_repo.save_many(tasks)
+        measure("sqlite", sqlite_repo)
+        database.close()
+
+
+if __name__ == "__main__":
+    main()
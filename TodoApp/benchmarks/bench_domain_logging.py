@@ -0,0 +1,71 @@
+"""Domain hot paths with logging at INFO: ListProjectsUseCase and entity accessors.
+
+Debug events are disabled at INFO, so what is measured is the cost the
+entities pay for diagnostics nobody sees.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_domain_logging [--projects 200] [--tasks 50] [--rounds 50]
+"""
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from todo_app.application.use_cases.project_use_cases import ListProjectsUseCase
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+
+
+def timed(fn, rounds: int) -> float:
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    # INFO records are built and handed to a handler that drops them.
+    app_logger = logging.getLogger("todo_app")
+    app_logger.setLevel(logging.INFO)
+    app_logger.addHandler(logging.NullHandler())
+    app_logger.propagate = False
+
+    task_repo = InMemoryTaskRepository()
+    project_repo = InMemoryProjectRepository()
+    project_repo.set_task_repository(task_repo)
+    due = Deadline(datetime.now(timezone.utc) + timedelta(days=7))
+    for p in range(args.projects):
+        project = Project(name=f"Project {p}")
+        for t in range(args.tasks):
+            project.add_task(Task(title=f"Task {t}", description="", project_id=project.id, due_date=due))
+        project_repo.save(project)
+
+    use_case = ListProjectsUseCase(project_repo)
+    project = project_repo.get_all()[1]
+    task = project.tasks[0]
+
+    list_time = timed(use_case.execute, args.rounds)
+    accessor_rounds = args.rounds * 1000
+    tasks_time = timed(lambda: project.tasks, accessor_rounds)
+    incomplete_time = timed(lambda: project.incomplete_tasks, accessor_rounds)
+    overdue_time = timed(task.is_overdue, accessor_rounds)
+
+    print(f"ListProjectsUseCase ({args.projects} x {args.tasks}) {list_time * 1000:>8.2f} ms")
+    print(f"Project.tasks                         {tasks_time * 1e6:>8.2f} us")
+    print(f"Project.incomplete_tasks              {incomplete_time * 1e6:>8.2f} us")
+    print(f"Task.is_overdue                       {overdue_time * 1e6:>8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
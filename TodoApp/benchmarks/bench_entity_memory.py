@@ -0,0 +1,72 @@
+"""In-memory backend: traced memory per task held in InMemoryTaskRepository.
+
+Tasks are decoded from stored records, as the file backends load them, so
+every task gets its own strings and id objects. Half carry a deadline and
+a tenth are completed.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_entity_memory [--size 200000] [--projects 200]
+"""
+import argparse
+import gc
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.persistence.codecs import get_codec
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+
+
+def make_records(size: int, projects: int) -> list:
+
+    codec = get_codec("json")
+    project_ids = [uuid4() for _ in range(projects)]
+    due = datetime.now(timezone.utc) + timedelta(days=30)
+    records = []
+    for i in range(size):
+        task = Task(title=f"Task {i}", description="", project_id=project_ids[i % projects])
+        if i % 2:
+            task.due_date = Deadline(due + timedelta(minutes=i))
+        if i % 10 == 0:
+            task.complete()
+        records.append(codec.encode_task(task))
+    return records
+
+
+def measure(name: str, records: list, fill) -> None:
+
+    gc.collect()
+    tracemalloc.start()
+    held = fill(records)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<12} | {len(records):>9,} tasks | {current / 2**20:>8.1f} MiB | {current / len(records):>6.0f} B/task")
+    del held
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--projects", type=int, default=200)
+    args = parser.parse_args()
+
+    records = make_records(args.size, args.projects)
+    codec = get_codec("json")
+
+    measure("entities", records, lambda rs: [codec.decode_task(r) for r in rs])
+
+    def fill_repository(rs):
+        repo = InMemoryTaskRepository()
+        repo.save_many(codec.decode_task(r) for r in rs)
+        return repo
+
+    measure("repository", records, fill_repository)
+
+
+if __name__ == "__main__":
+    main()
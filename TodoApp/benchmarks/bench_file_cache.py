@@ -0,0 +1,57 @@
+"""File backend: re-parsing tasks.json on every read vs the mtime-checked cache.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_file_cache [--size 20000] [--lookups 200]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+
+
+def timed(repo: FileTaskRepository, lookups, cached: bool) -> float:
+
+    start = time.perf_counter()
+    for task_id, project_id in lookups:
+        if not cached:
+            repo._cache.invalidate()
+        repo.get(task_id)
+        repo.find_by_project(project_id)
+    return (time.perf_counter() - start) / len(lookups)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = FileTaskRepository(Path(tmp))
+        project_ids = [uuid4() for _ in range(100)]
+        tasks = [
+            Task(title=f"Task {i}", description="", project_id=project_ids[i % 100])
+            for i in range(args.size)
+        ]
+        repo.save_many(tasks)
+        lookups = [(t.id, t.project_id) for t in random.sample(tasks, args.lookups)]
+
+        uncached = timed(repo, lookups[:10], cached=False)
+        repo.get(lookups[0][0])
+        cached = timed(repo, lookups, cached=True)
+
+        print(
+            f"{args.size:,} tasks | get + find_by_project: re-parse {uncached * 1000:>8.1f} ms, "
+            f"cached {cached * 1000:>6.3f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Bulk task import into SQLite: CSV records through ImportTasksUseCase at several chunk sizes.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_import [--size 1000000] [--chunk-sizes 1000 10000 50000]
+"""
+import argparse
+import csv
+import io
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from todo_app.application.use_cases.task_use_cases import ImportTasksUseCase
+from todo_app.domain.value_objects import Priority
+from todo_app.infrastructure.cli.import_tasks import read_task_records
+from todo_app.infrastructure.persistence.sqlite import SqliteDatabase, SqliteProjectRepository, SqliteTaskRepository
+
+
+def make_csv(size: int) -> str:
+
+    now = datetime.now(timezone.utc)
+    priorities = [p.name for p in Priority] + [""]
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["title", "description", "due_date", "priority"])
+    for i in range(size):
+        # A third without a deadline; the rest spread over the next quarter.
+        due = (now + timedelta(days=1 + i % 90)).isoformat() if i % 3 else ""
+        writer.writerow([f"Task {i}", "imported", due, priorities[i % len(priorities)]])
+    return out.getvalue()
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--chunk-sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    args = parser.parse_args()
+
+    text = make_csv(args.size)
+    print(f"{args.size:,} CSV records")
+
+    for chunk_size in args.chunk_sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            database = SqliteDatabase(Path(tmp) / "bench.db")
+            task_repo = SqliteTaskRepository(database)
+            project_repo = SqliteProjectRepository(database)
+            use_case = ImportTasksUseCase(task_repo, project_repo, chunk_size=chunk_size)
+            summary = use_case.execute(read_task_records(io.StringIO(text), "csv")).value
+            database.close()
+        print(
+            f"chunk {chunk_size:>7,}: {summary['seconds']:>6.1f} s "
+            f"({summary['tasks_per_second']:>9,.0f} tasks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Inbox task creation at 10k projects: pinned inbox id vs a scan per lookup.
+
+Tasks go to an in-memory task store so the timings isolate the inbox
+lookup. The Inbox is re-saved after the other projects, so a scan has to
+pass every one of them, as it does in stores where the Inbox was
+recreated or imported late.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_inbox [--projects 10000] [--tasks 2000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from todo_app.application.dtos.task_dtos import CreateTaskRequest
+from todo_app.application.use_cases.task_use_cases import CreateTaskUseCase
+from todo_app.domain.entities.project import Project
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.journal import JournalProjectRepository, JournalTaskRepository
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+
+
+def fill(project_repo, project_count: int) -> None:
+
+    inbox = project_repo.get_inbox()
+    project_repo.delete(inbox.id)
+    project_repo.save_many(Project(name=f"Project {i}") for i in range(project_count))
+    project_repo.save(inbox)
+
+
+def unpin(project_repo) -> None:
+
+    for name in ("_inbox_id", "_inbox_key"):
+        if hasattr(project_repo, name):
+            setattr(project_repo, name, None)
+
+
+def create_inbox_tasks(project_repo, count: int, pinned: bool) -> float:
+
+    use_case = CreateTaskUseCase(InMemoryTaskRepository(), project_repo)
+    start = time.perf_counter()
+    for i in range(count):
+        if not pinned:
+            unpin(project_repo)
+        result = use_case.execute(CreateTaskRequest(title=f"Task {i}", description=""))
+        assert result.is_success
+    return time.perf_counter() - start
+
+
+def measure(name: str, project_repo, task_count: int) -> None:
+
+    scan = create_inbox_tasks(project_repo, task_count, pinned=False)
+    pinned = create_inbox_tasks(project_repo, task_count, pinned=True)
+    print(
+        f"{name:<8} | scan per lookup: {scan / task_count * 1e6:>8.1f} us/task | "
+        f"pinned: {pinned / task_count * 1e6:>6.1f} us/task"
+    )
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--tasks", type=int, default=2_000)
+    args = parser.parse_args()
+
+    print(f"{args.projects:,} projects, {args.tasks:,} inbox tasks")
+
+    memory_repo = InMemoryProjectRepository()
+    memory_repo.set_task_repository(InMemoryTaskRepository())
+    fill(memory_repo, args.projects)
+    measure("memory", memory_repo, args.tasks)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_repo = FileProjectRepository(Path(tmp))
+        file_repo.set_task_repository(FileTaskRepository(Path(tmp)))
+        fill(file_repo, args.projects)
+        measure("file", file_repo, args.tasks)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_repo = JournalProjectRepository(Path(tmp))
+        journal_tasks = JournalTaskRepository(Path(tmp))
+        journal_repo.set_task_repository(journal_tasks)
+        fill(journal_repo, args.projects)
+        measure("journal", journal_repo, args.tasks)
+        journal_repo.close()
+        journal_tasks.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""In-memory task lookups: linear scans vs the project/status indexes.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_memory_indexes [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+
+PROJECTS = 1000
+LOOKUPS = 100
+
+
+def timed(fn, repeat: int = 1) -> float:
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def run(size: int) -> None:
+
+    project_ids = [uuid4() for _ in range(PROJECTS)]
+    repo = InMemoryTaskRepository()
+    tasks = []
+    for i in range(size):
+        task = Task(title=f"Task {i}", description="", project_id=project_ids[i % PROJECTS])
+        if i % 5 == 0:
+            task.status = TaskStatus.DONE
+        tasks.append(task)
+    repo.save_many(tasks)
+
+    sample = random.sample(project_ids, LOOKUPS)
+    values = repo._tasks.values()
+
+    scan_project = timed(
+        lambda: [[t for t in values if t.project_id == pid] for pid in sample]
+    ) / LOOKUPS
+    index_project = timed(lambda: [repo.find_by_project(pid) for pid in sample]) / LOOKUPS
+
+    scan_active = timed(lambda: [t for t in values if t.status != TaskStatus.DONE], repeat=3)
+    index_active = timed(repo.get_active_tasks, repeat=3)
+
+    print(
+        f"{size:>9,} tasks | find_by_project: scan {scan_project * 1e3:>8.3f} ms, "
+        f"index {index_project * 1e3:>7.3f} ms | get_active_tasks: scan {scan_active * 1e3:>8.1f} ms, "
+        f"index {index_active * 1e3:>8.1f} ms"
+    )
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
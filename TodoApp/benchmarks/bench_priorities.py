@@ -0,0 +1,82 @@
+"""Priority recompute: per-task calculate_priority vs the columnar batch pass.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_priorities [--size 1000000]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from math import nan
+from uuid import uuid4
+
+from todo_app.application.use_cases.task_use_cases import RecomputePrioritiesUseCase
+from todo_app.domain import clock
+from todo_app.domain.entities.task import Task
+from todo_app.domain.services.task_priority_calculator import TaskPriorityCalculator
+from todo_app.domain.value_objects import Deadline, Priority
+from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository
+
+
+def make_tasks(size: int) -> list[Task]:
+
+    now = datetime.now(timezone.utc)
+    project_ids = [uuid4() for _ in range(100)]
+    priorities = list(Priority)
+    tasks = []
+    for i in range(size):
+        # A tenth without a deadline; the rest spread over the next week.
+        due = None if i % 10 == 0 else Deadline(now + timedelta(minutes=5 + random.randrange(7 * 24 * 60)))
+        tasks.append(
+            Task(
+                title=f"Task {i}",
+                description="",
+                project_id=project_ids[i % 100],
+                priority=priorities[i % len(priorities)],
+                due_date=due,
+            )
+        )
+    return tasks
+
+
+def timed(fn):
+
+    start = time.perf_counter()
+    value = fn()
+    return value, time.perf_counter() - start
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.size)
+    print(f"{args.size:,} active tasks")
+
+    with clock.frozen_now() as now:
+        per_task, per_task_time = timed(lambda: [TaskPriorityCalculator.calculate_priority(t) for t in tasks])
+        batch, batch_time = timed(lambda: TaskPriorityCalculator.calculate_priorities(tasks, now))
+    assert per_task == batch
+
+    due_timestamps = [t.due_date.due_date.timestamp() if t.due_date else nan for t in tasks]
+    base_priorities = [t.priority for t in tasks]
+    _, columns_time = timed(
+        lambda: TaskPriorityCalculator.calculate_from_columns(due_timestamps, base_priorities, now)
+    )
+
+    repo = InMemoryTaskRepository()
+    repo.save_many(tasks)
+    use_case = RecomputePrioritiesUseCase(repo)
+    result, use_case_time = timed(use_case.execute)
+
+    print(f"per task       : {per_task_time * 1000:>8.1f} ms")
+    print(f"batch (tasks)  : {batch_time * 1000:>8.1f} ms")
+    print(f"batch (columns): {columns_time * 1000:>8.1f} ms")
+    print(f"use case       : {use_case_time * 1000:>8.1f} ms ({len(result.value.adjusted):,} adjusted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Project listing on the file backend: per-project task loads vs one grouped load.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_project_listing
+"""
+import tempfile
+import time
+from pathlib import Path
+
+from todo_app.application.use_cases.project_use_cases import ListProjectsUseCase
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+
+
+class CountingFileTaskRepository(FileTaskRepository):
+
+    def __init__(self, data_dir: Path):
+        super().__init__(data_dir)
+        self.reads = 0
+
+    def _load_tasks(self):
+        self.reads += 1
+        return super()._load_tasks()
+
+
+def build_store(data_dir: Path, project_count: int, tasks_per_project: int):
+
+    task_repo = CountingFileTaskRepository(data_dir)
+    project_repo = FileProjectRepository(data_dir)
+    project_repo.set_task_repository(task_repo)
+
+    projects = [Project(name=f"Project {p}") for p in range(project_count)]
+    tasks = [
+        Task(title=f"Task {t}", description="", project_id=project.id)
+        for project in projects
+        for t in range(tasks_per_project)
+    ]
+    project_repo._save_projects(
+        project_repo._load_projects() + [project_repo.codec.encode_project(p) for p in projects]
+    )
+    task_repo._save_tasks([task_repo.codec.encode_task(t) for t in tasks])
+    return task_repo, project_repo
+
+
+def run(project_count: int, tasks_per_project: int) -> None:
+
+    with tempfile.TemporaryDirectory() as tmp:
+        task_repo, project_repo = build_store(Path(tmp), project_count, tasks_per_project)
+
+        # The previous get_all: one find_by_project (one full task-file read) per project.
+        projects = [project_repo.codec.decode_project(p) for p in project_repo._load_projects()]
+        task_repo.reads = 0
+        start = time.perf_counter()
+        for project in projects:
+            task_repo._cache.invalidate()  # without the read cache every load re-parsed the file
+            project_repo._load_project_tasks(project)
+        per_project_time = time.perf_counter() - start
+        per_project_reads = task_repo.reads
+
+        task_repo.reads = 0
+        task_repo._cache.invalidate()
+        start = time.perf_counter()
+        result = ListProjectsUseCase(project_repo).execute()
+        grouped_time = time.perf_counter() - start
+        grouped_reads = task_repo.reads
+        assert result.is_success
+
+        print(
+            f"{project_count:>5} projects x {tasks_per_project:>3} tasks | "
+            f"per-project: {per_project_reads:>4} reads {per_project_time * 1000:>9.1f} ms | "
+            f"grouped: {grouped_reads} read {grouped_time * 1000:>7.1f} ms"
+        )
+
+
+def main() -> None:
+
+    for project_count, tasks_per_project in [(50, 10), (200, 10), (200, 50)]:
+        run(project_count, tasks_per_project)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""File backend: updating and inserting one task in a single tasks.json vs per-project shards.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_sharded [--size 20000] [--projects 200] [--updates 50] [--inserts 50]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.sharded import ShardedTaskRepository
+
+
+def timed_inserts(repo, tasks) -> float:
+
+    start = time.perf_counter()
+    for task in tasks:
+        repo.save(task)
+    return (time.perf_counter() - start) / len(tasks)
+
+
+def timed(repo, tasks) -> float:
+
+    start = time.perf_counter()
+    for task in tasks:
+        task.description = "updated"
+        repo.save(task)
+        repo.find_by_project(task.project_id)
+    return (time.perf_counter() - start) / len(tasks)
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--updates", type=int, default=50)
+    parser.add_argument("--inserts", type=int, default=50)
+    args = parser.parse_args()
+
+    project_ids = [uuid4() for _ in range(args.projects)]
+    tasks = [
+        Task(title=f"Task {i}", description="", project_id=project_ids[i % args.projects])
+        for i in range(args.size)
+    ]
+    sample = random.sample(tasks, args.updates)
+    new_tasks = [
+        Task(title=f"New {i}", description="", project_id=random.choice(project_ids))
+        for i in range(args.inserts)
+    ]
+
+    for name, repo_class in (("single file", FileTaskRepository), ("sharded", ShardedTaskRepository)):
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = repo_class(Path(tmp))
+            repo.save_many(tasks)
+            per_update = timed(repo, sample)
+            per_insert = timed_inserts(repo, new_tasks)
+            print(
+                f"{args.size:,} tasks, {args.projects} projects | {name:<11} "
+                f"save + read {per_update * 1000:>7.2f} ms | insert {per_insert * 1000:>7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""File backend: materialized get_active_tasks vs streaming iter_active_tasks.
+
+Reports wall time and peak traced memory for one pass over the active tasks.
+
+Run from the TodoApp directory:
+
+    python -m benchmarks.bench_streaming [--size 100000]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from uuid import uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+
+
+def measure(name: str, fn) -> None:
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<18} | {count:>8,} tasks | {elapsed:>6.2f} s | peak {peak / 2**20:>7.1f} MiB")
+
+
+def main() -> None:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = FileTaskRepository(Path(tmp))
+        project_ids = [uuid4() for _ in range(100)]
+        repo.save_many(
+            Task(title=f"Task {i}", description="", project_id=project_ids[i % 100])
+            for i in range(args.size)
+        )
+        print(f"tasks.json: {repo.tasks_file.stat().st_size / 2**20:.1f} MiB")
+
+        measure("get_active_tasks", lambda: len(repo.get_active_tasks()))
+        measure("iter_active_tasks", lambda: sum(1 for _ in repo.iter_active_tasks()))
+
+
+if __name__ == "__main__":
+    main()
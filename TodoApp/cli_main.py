@@ -1,15 +1,33 @@
+import argparse
 import sys
+from typing import Optional, Sequence
 
 
 from todo_app.infrastructure.cli.click_cli_app import ClickCli
+from todo_app.infrastructure.cli.import_tasks import FORMATS, run_import
 from todo_app.infrastructure.configuration.container import create_application
 from todo_app.infrastructure.notifications.recorder import NotificationRecorder
 from todo_app.interfaces.presenters.cli import CliTaskPresenter, CliProjectPresenter
 from todo_app.infrastructure.logging.config import configure_logging
 
 
-def main() -> int:
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
 
+    parser = argparse.ArgumentParser(description="Todo app; runs interactively without a command.")
+    commands = parser.add_subparsers(dest="command")
+
+    import_parser = commands.add_parser("import", help="bulk-import tasks from CSV or NDJSON")
+    import_parser.add_argument("source", help="file to read, or - for stdin")
+    import_parser.add_argument(
+        "--format", choices=FORMATS, default=None, help="defaults to the file extension, CSV for stdin"
+    )
+    import_parser.add_argument("--chunk-size", type=int, default=None, help="tasks per bulk save")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+
+    args = parse_args(argv)
     try:
         configure_logging(app_context="CLI")
 
@@ -20,6 +38,9 @@ def main() -> int:
             app_context="CLI",
         )
 
+        if args.command == "import":
+            return run_import(app, args.source, args.format, args.chunk_size)
+
         cli = ClickCli(app)
         return cli.run()
     except KeyboardInterrupt:
@@ -31,4 +52,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
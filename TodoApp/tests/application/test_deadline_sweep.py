@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from freezegun import freeze_time
+
+from tests.application.conftest import InMemoryTaskRepository, NotificationRecorder
+from todo_app.application.use_cases.deadline_use_cases import CheckDeadlinesUseCase
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+
+
+@freeze_time("2024-01-01 12:00:00")
+def test_check_deadlines_notifies_only_tasks_in_window():
+
+    repo = InMemoryTaskRepository()
+    notifications = NotificationRecorder()
+    use_case = CheckDeadlinesUseCase(repo, notifications)
+    now = datetime.now(timezone.utc)
+    project_id = uuid4()
+
+    approaching = Task(title="Approaching", description="Test", project_id=project_id,
+                       due_date=Deadline(now + timedelta(hours=23)))
+    future = Task(title="Future", description="Test", project_id=project_id,
+                  due_date=Deadline(now + timedelta(days=5)))
+    completed = Task(title="Completed", description="Test", project_id=project_id,
+                     due_date=Deadline(now + timedelta(hours=2)))
+    completed.complete()
+    for task in (approaching, future, completed):
+        repo.save(task)
+
+    result = use_case.execute()
+
+    assert result.is_success
+    assert result.value["notifications_sent"] == 1
+    assert notifications.deadline_warnings == [(approaching.id, 0)]
+
+
+@freeze_time("2024-01-01 12:00:00")
+def test_check_deadlines_uses_custom_threshold():
+
+    repo = InMemoryTaskRepository()
+    notifications = NotificationRecorder()
+    use_case = CheckDeadlinesUseCase(repo, notifications, warning_threshold=timedelta(days=3))
+    now = datetime.now(timezone.utc)
+
+    task = Task(title="Two days", description="Test", project_id=uuid4(),
+                due_date=Deadline(now + timedelta(days=2, hours=1)))
+    repo.save(task)
+
+    result = use_case.execute()
+
+    assert result.value["notifications_sent"] == 1
+    assert notifications.deadline_warnings == [(task.id, 2)]
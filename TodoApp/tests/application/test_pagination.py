@@ -0,0 +1,94 @@
+from uuid import uuid4
+import pytest
+
+from tests.application.conftest import InMemoryTaskRepository
+from todo_app.application.common.pagination import DEFAULT_PAGE_SIZE, decode_cursor, encode_cursor
+from todo_app.application.dtos.project_dtos import ListProjectsRequest
+from todo_app.application.dtos.task_dtos import ListProjectTasksRequest
+from todo_app.application.use_cases.project_use_cases import ListProjectsUseCase
+from todo_app.application.use_cases.task_use_cases import ListProjectTasksUseCase
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence import memory
+
+
+def test_cursor_round_trip():
+    task_id = uuid4()
+
+    assert decode_cursor(encode_cursor(task_id)) == task_id
+
+
+def test_invalid_cursor_is_rejected():
+    with pytest.raises(ValueError, match="Invalid page cursor"):
+        ListProjectsRequest(limit=10, cursor="not-a-cursor")
+
+
+@pytest.mark.parametrize("limit", [0, 101])
+def test_page_size_is_bounded(limit):
+    with pytest.raises(ValueError, match="Page size"):
+        ListProjectsRequest(limit=limit)
+
+
+def test_cursor_without_limit_is_rejected():
+    with pytest.raises(ValueError, match="requires a page size"):
+        ListProjectsRequest(cursor=encode_cursor(uuid4()))
+
+
+def test_list_project_tasks_walks_every_page():
+    repo = InMemoryTaskRepository()
+    project_id = uuid4()
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(7)]
+    for task in tasks:
+        repo.save(task)
+    repo.save(Task(title="Other", description="", project_id=uuid4()))
+    use_case = ListProjectTasksUseCase(repo)
+
+    seen, cursor, pages = [], None, 0
+    while True:
+        result = use_case.execute(
+            ListProjectTasksRequest(project_id=str(project_id), limit=3, cursor=cursor)
+        )
+        assert result.is_success
+        seen.extend(task.id for task in result.value.items)
+        pages += 1
+        cursor = result.value.next_cursor
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert seen == sorted(str(task.id) for task in tasks)
+
+
+def test_list_project_tasks_reports_a_repository_failure():
+    class BrokenRepository(InMemoryTaskRepository):
+        def find_by_project_page(self, project_id, limit, after=None):
+            raise OSError("disk gone")
+
+    result = ListProjectTasksUseCase(BrokenRepository()).execute(
+        ListProjectTasksRequest(project_id=str(uuid4()))
+    )
+
+    assert not result.is_success
+    assert "disk gone" in result.error.message
+
+
+def test_a_page_of_projects_holds_the_first_page_of_each_ones_tasks(monkeypatch):
+    task_repo, project_repo = memory.InMemoryTaskRepository(), memory.InMemoryProjectRepository()
+    project_repo.set_task_repository(task_repo, lazy_tasks=True)
+    project = Project(name="Big")
+    project_repo.save(project)
+    tasks = [Task(title=f"Task {i}", description="", project_id=project.id) for i in range(DEFAULT_PAGE_SIZE + 5)]
+    tasks[0].complete()
+    task_repo.save_many(tasks)
+    monkeypatch.setattr(task_repo, "find_by_project", lambda project_id: pytest.fail("loaded every task"))
+
+    result = ListProjectsUseCase(project_repo, task_repo).execute(ListProjectsRequest(limit=10))
+
+    [response] = [r for r in result.value.items if r.id == str(project.id)]
+    assert len(response.tasks) == DEFAULT_PAGE_SIZE
+    assert (response.task_count, response.completed_task_count) == (DEFAULT_PAGE_SIZE + 5, 1)
+    rest = ListProjectTasksUseCase(task_repo).execute(
+        ListProjectTasksRequest(project_id=response.id, cursor=response.next_task_cursor)
+    )
+    seen = [t.id for t in response.tasks] + [t.id for t in rest.value.items]
+    assert seen == sorted(str(task.id) for task in tasks)
@@ -9,6 +9,7 @@ from todo_app.domain.entities.project import Project
 from todo_app.domain.entities.task import Task
 from todo_app.domain.exceptions import BusinessRuleViolation, ValidationError
 from todo_app.domain.value_objects import ProjectStatus, TaskStatus
+from todo_app.infrastructure.persistence import memory
 
 def test_create_project():
 
@@ -320,4 +321,32 @@ def test_complete_project_rolls_back_on_business_rule_violation():
         assert saved_task.completed_at is None
         assert saved_task.completion_notes is None
 
-    assert not notifications.completed_tasks
\ No newline at end of file
+    assert not notifications.completed_tasks
+
+def test_complete_project_restores_entities_in_place_on_failure():
+
+    project = Project(name="Test Project")
+    tasks = [Task(title=f"Task {i}", description="Test", project_id=project.id) for i in range(2)]
+    for task in tasks:
+        project.add_task(task)
+
+    class FailingProjectRepository(memory.InMemoryProjectRepository):
+        def save(self, project):
+            if project.status == ProjectStatus.COMPLETED:
+                raise BusinessRuleViolation("Cannot complete project")
+            super().save(project)
+
+    project_repo = FailingProjectRepository()
+    task_repo = memory.InMemoryTaskRepository()
+    project_repo.save(project)
+    for task in tasks:
+        task_repo.save(task)
+
+    result = CompleteProjectUseCase(project_repo, task_repo, NotificationRecorder()).execute(
+        CompleteProjectRequest(project_id=str(project.id), completion_notes="Done!")
+    )
+
+    assert not result.is_success
+    assert project_repo.get(project.id) is project
+    assert project.status == ProjectStatus.ACTIVE and project.completion_notes is None
+    assert all(task_repo.get(t.id).status == TaskStatus.TODO and t.completed_at is None for t in tasks)
@@ -1,14 +1,16 @@
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 import pytest
 
 from tests.application.conftest import InMemoryTaskRepository, InMemoryProjectRepository, NotificationRecorder
 from todo_app.application.common.result import ErrorCode
 from todo_app.application.dtos.task_dtos import CreateTaskRequest, CompleteTaskRequest, SetTaskPriorityRequest
-from todo_app.application.use_cases.task_use_cases import CreateTaskUseCase, CompleteTaskUseCase, SetTaskPriorityUseCase
+from todo_app.application.use_cases.task_use_cases import CreateTaskUseCase, CompleteTaskUseCase, ImportTasksUseCase, RecomputePrioritiesUseCase, SetTaskPriorityUseCase
 from todo_app.domain.entities.project import Project
 from todo_app.domain.entities.task import Task
 from todo_app.domain.exceptions import BusinessRuleViolation, ValidationError
-from todo_app.domain.value_objects import Priority, TaskStatus
+from todo_app.domain.value_objects import Deadline, Priority, TaskStatus
+from todo_app.infrastructure.persistence import memory
 
 
 def test_create_task_basic():
@@ -409,4 +411,90 @@ def test_set_task_priority_handles_validation_error():
     assert not result.is_success
     assert result.error.code == ErrorCode.VALIDATION_ERROR
     assert "Invalid priority state" in result.error.message
-    assert not notifications.high_priority_tasks
\ No newline at end of file
+    assert not notifications.high_priority_tasks
+
+
+def test_recompute_priorities_returns_effective_priorities_without_saving():
+
+    repo = memory.InMemoryTaskRepository()
+    project_id = uuid4()
+    now = datetime.now(timezone.utc)
+    urgent = Task(title="Urgent", description="", project_id=project_id, due_date=Deadline(now + timedelta(hours=1)))
+    distant = Task(title="Distant", description="", project_id=project_id, priority=Priority.HIGH, due_date=Deadline(now + timedelta(days=30)))
+    undated = Task(title="Undated", description="", project_id=project_id, priority=Priority.HIGH)
+    repo.save_many([urgent, distant, undated])
+
+    repo.save_many = repo.save = lambda *args: pytest.fail("recompute saved a task")
+    result = RecomputePrioritiesUseCase(repo).execute()
+
+    assert result.is_success
+    assert result.value.examined == 3
+    assert result.value.adjusted == {urgent.id: Priority.HIGH, distant.id: Priority.LOW}
+    assert urgent.priority == Priority.MEDIUM
+    assert distant.priority == Priority.HIGH
+
+
+def test_recompute_priorities_handles_business_rule_violation():
+
+    repo = memory.InMemoryTaskRepository()
+
+    def failing_iteration():
+        raise BusinessRuleViolation("Store is read-only")
+
+    repo.iter_active_tasks = failing_iteration
+    result = RecomputePrioritiesUseCase(repo).execute()
+
+    assert not result.is_success
+    assert result.error.code == ErrorCode.BUSINESS_RULE_VIOLATION
+
+
+def test_import_tasks_saves_in_chunks_and_defaults_to_the_inbox():
+
+    task_repo = memory.InMemoryTaskRepository()
+    project_repo = memory.InMemoryProjectRepository()
+    project = Project(name="Imported")
+    project_repo.save(project)
+    due = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    records = [
+        {"title": "First", "description": "", "priority": "high"},
+        {"title": "Second", "description": "notes", "due_date": due, "project_id": str(project.id)},
+        {"title": "Third", "description": "", "project_id": str(project.id)},
+    ]
+
+    chunks = []
+    save_many = task_repo.save_many
+    task_repo.save_many = lambda tasks: (chunks.append(len(tasks)), save_many(tasks))
+    result = ImportTasksUseCase(task_repo, project_repo, chunk_size=2).execute(iter(records))
+
+    assert result.is_success
+    assert result.value["imported"] == 3
+    assert result.value["rejected"] == 0
+    assert chunks == [2, 1]
+    inbox_tasks = task_repo.find_by_project(project_repo.get_inbox().id)
+    assert [task.priority for task in inbox_tasks] == [Priority.HIGH]
+    assert sorted(task.title for task in task_repo.find_by_project(project.id)) == ["Second", "Third"]
+
+
+def test_import_tasks_reports_rejected_records_by_position():
+
+    task_repo = memory.InMemoryTaskRepository()
+    project_repo = memory.InMemoryProjectRepository()
+    missing = uuid4()
+    records = [
+        {"title": "", "description": ""},
+        {"title": "Kept", "description": ""},
+        {"title": "Bad priority", "description": "", "priority": "urgent"},
+        {"title": "Orphan", "description": "", "project_id": str(missing)},
+        {"title": "Past", "description": "", "due_date": "2000-01-01T00:00:00+00:00"},
+    ]
+
+    result = ImportTasksUseCase(task_repo, project_repo, max_reported_errors=3).execute(records)
+
+    assert result.value["imported"] == 1
+    assert result.value["rejected"] == 4
+    assert result.value["errors"] == [
+        {"record": 1, "error": "Title is required"},
+        {"record": 3, "error": "Invalid priority: urgent"},
+        {"record": 4, "error": f"Project {missing} not found"},
+    ]
+
@@ -0,0 +1,130 @@
+from uuid import uuid4
+
+import pytest
+
+from todo_app.application.repositories.unit_of_work import UnitOfWork
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ValidationError
+from todo_app.domain.value_objects import ProjectStatus, TaskStatus
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+
+
+class CountingTaskRepository(InMemoryTaskRepository):
+
+    def __init__(self):
+        super().__init__()
+        self.writes = []
+
+    def save_many(self, tasks):
+        tasks = list(tasks)
+        self.writes.append(("save_many", len(tasks)))
+        super().save_many(tasks)
+
+    def delete_many(self, task_ids):
+        task_ids = list(task_ids)
+        self.writes.append(("delete_many", len(task_ids)))
+        super().delete_many(task_ids)
+
+
+@pytest.fixture
+def repos():
+    task_repo = CountingTaskRepository()
+    project_repo = InMemoryProjectRepository()
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
+
+
+def make_tasks(count, project_id=None):
+    project_id = project_id or uuid4()
+    return [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(count)]
+
+
+def test_commit_writes_each_kind_of_change_in_one_batch(repos):
+    task_repo, project_repo = repos
+    existing = make_tasks(3)
+    task_repo.save_many(existing)
+    task_repo.writes.clear()
+
+    with UnitOfWork(task_repo, project_repo) as uow:
+        for task in make_tasks(2):
+            uow.register_new(task)
+        for task in existing[:2]:
+            uow.register_dirty(task)
+            task.start()
+        uow.register_deleted(existing[2])
+
+    assert task_repo.writes == [("save_many", 4), ("delete_many", 1)]
+    assert not task_repo.exists(existing[2].id)
+    assert task_repo.get(existing[0].id).status == TaskStatus.IN_PROGRESS
+
+
+def test_tasks_of_a_saved_project_are_written_once(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Project")
+    tasks = make_tasks(3, project.id)
+    for task in tasks:
+        project.add_task(task)
+
+    with UnitOfWork(task_repo, project_repo) as uow:
+        uow.register_new(project)
+        for task in tasks:
+            uow.register_new(task)
+
+    assert task_repo.writes == [("save_many", 3)]
+    assert project_repo.get(project.id) is project
+
+
+def test_error_in_block_restores_entities_and_writes_nothing(repos):
+    task_repo, project_repo = repos
+    task = make_tasks(1)[0]
+
+    with pytest.raises(ValidationError):
+        with UnitOfWork(task_repo, project_repo) as uow:
+            uow.register_dirty(task)
+            task.complete(notes="done")
+            uow.register_new(make_tasks(1)[0])
+            raise ValidationError("rejected")
+
+    assert task.status == TaskStatus.TODO and task.completion_notes is None
+    assert task_repo.writes == []
+
+
+def test_failed_flush_writes_back_the_restored_state(repos):
+    task_repo, _ = repos
+    project = Project(name="Project")
+
+    class FailingProjectRepository(InMemoryProjectRepository):
+        def save(self, project):
+            if project.status == ProjectStatus.COMPLETED:
+                raise ValidationError("Cannot complete project")
+            super().save(project)
+
+    project_repo = FailingProjectRepository()
+    project_repo.set_task_repository(task_repo)
+    task = make_tasks(1, project.id)[0]
+    project.add_task(task)
+    project_repo.save(project)
+
+    uow = UnitOfWork(task_repo, project_repo)
+    uow.register_dirty(project)
+    uow.register_dirty(task)
+    task.complete()
+    project.mark_completed()
+    with pytest.raises(ValidationError):
+        uow.commit()
+
+    assert project.status == ProjectStatus.ACTIVE
+    assert task_repo.get(task.id).status == TaskStatus.TODO
+
+
+def test_deleting_a_new_entity_cancels_it(repos):
+    task_repo, project_repo = repos
+    task = make_tasks(1)[0]
+
+    with UnitOfWork(task_repo, project_repo) as uow:
+        uow.register_new(task)
+        uow.register_deleted(task)
+
+    assert task_repo.writes == []
+    assert not task_repo.exists(task.id)
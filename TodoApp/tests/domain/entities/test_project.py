@@ -0,0 +1,117 @@
+from copy import copy
+from uuid import uuid4
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+
+
+def test_deferred_tasks_load_on_first_access():
+    project = Project(name="Lazy")
+    task = Task(title="Task", description="", project_id=project.id)
+    calls = []
+    project.defer_tasks(lambda: calls.append(1) or [task])
+
+    assert not project.tasks_loaded
+    assert calls == []
+
+    assert project.tasks == [task]
+    assert project.get_task(task.id) is task
+    assert calls == [1]
+    assert project.tasks_loaded
+
+
+def test_add_task_keeps_deferred_tasks():
+    project = Project(name="Lazy")
+    existing = Task(title="Existing", description="", project_id=project.id)
+    project.defer_tasks(lambda: [existing])
+
+    added = Task(title="Added", description="", project_id=uuid4())
+    project.add_task(added)
+
+    assert {t.title for t in project.tasks} == {"Existing", "Added"}
+    assert added.project_id == project.id
+
+
+def test_entities_are_slotted_and_compare_by_id():
+    task = Task(title="Task", description="", project_id=uuid4())
+    renamed = copy(task)
+    renamed.title = "Renamed"
+
+    assert not hasattr(task, "__dict__")
+    assert renamed == task and hash(renamed) == hash(task)
+    assert {task, renamed} == {task}
+    assert Project(name="A") != Project(name="A")
+
+
+def test_restore_undoes_changes_since_snapshot():
+    project = Project(name="Project")
+    kept = Task(title="Kept", description="", project_id=project.id)
+    project.add_task(kept)
+    project_snapshot, task_snapshot = project.snapshot(), kept.snapshot()
+
+    kept.complete(notes="done")
+    project.add_task(Task(title="Added", description="", project_id=project.id))
+    project.mark_completed(notes="all done")
+
+    kept.restore(task_snapshot)
+    project.restore(project_snapshot)
+
+    assert project.tasks == [kept]
+    assert project.completed_at is None and project.completion_notes is None
+    assert kept.completed_at is None and kept.completion_notes is None
+    assert kept.status.value == "TODO"
+
+
+def test_counts_follow_task_status_changes():
+    project = Project(name="Project")
+    tasks = [Task(title=f"Task {i}", description="", project_id=project.id) for i in range(3)]
+    for task in tasks:
+        project.add_task(task)
+
+    tasks[0].complete()
+    tasks[1].start()
+
+    assert (project.task_count, project.completed_task_count, project.incomplete_task_count) == (3, 1, 2)
+    assert project.incomplete_tasks == tasks[1:]
+
+
+def test_counts_survive_rollback_in_any_order():
+    project = Project(name="Project")
+    task = Task(title="Task", description="", project_id=project.id)
+    project.add_task(task)
+
+    for restore_project_first in (True, False):
+        project_snapshot, task_snapshot = project.snapshot(), task.snapshot()
+        task.complete()
+        assert project.incomplete_task_count == 0
+
+        if restore_project_first:
+            project.restore(project_snapshot)
+            task.restore(task_snapshot)
+        else:
+            task.restore(task_snapshot)
+            project.restore(project_snapshot)
+        assert project.incomplete_tasks == [task]
+
+
+def test_copies_of_a_task_do_not_change_the_counts():
+    project = Project(name="Project")
+    task = Task(title="Task", description="", project_id=project.id)
+    project.add_task(task)
+
+    copy(task).complete()
+
+    assert project.incomplete_tasks == [task]
+
+
+def test_attached_and_deferred_tasks_are_counted():
+    project = Project(name="Project")
+    done = Task(title="Done", description="", project_id=project.id)
+    done.complete()
+    todo = Task(title="Todo", description="", project_id=project.id)
+
+    project.attach_tasks([done, todo])
+    assert (project.task_count, project.completed_task_count) == (2, 1)
+
+    project.defer_tasks(lambda: [done])
+    assert (project.task_count, project.completed_task_count) == (1, 1)
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from todo_app.domain import clock
+from todo_app.domain.entities.task import Task
+from todo_app.domain.services.task_priority_calculator import TaskPriorityCalculator
+from todo_app.domain.value_objects import Deadline, Priority
+from todo_app.interfaces.presenters.web import WebTaskPresenter
+
+
+class CountingClock(clock.Clock):
+
+    def __init__(self, instant: datetime):
+        self.instant = instant
+        self.reads = 0
+
+    def now(self) -> datetime:
+        self.reads += 1
+        return self.instant
+
+
+def test_frozen_now_pins_one_read_for_a_batch():
+    start = datetime.now(timezone.utc)
+    counting = CountingClock(start)
+    tasks = [
+        Task(title=f"Task {i}", description="", project_id=uuid4(),
+             due_date=Deadline(start + timedelta(hours=i + 1)))
+        for i in range(20)
+    ]
+
+    token = clock.use_clock(counting)
+    try:
+        with clock.frozen_now():
+            priorities = [TaskPriorityCalculator.calculate_priority(t) for t in tasks]
+    finally:
+        clock.reset_clock(token)
+
+    assert counting.reads == 1
+    assert priorities[:12] == [Priority.HIGH] * 12
+    assert priorities[12:] == [Priority.MEDIUM] * 8
+
+
+def test_deadlines_follow_the_current_clock():
+    deadline = Deadline(datetime.now(timezone.utc) + timedelta(hours=2))
+
+    with clock.frozen_now(deadline.due_date + timedelta(minutes=1)):
+        assert deadline.is_overdue()
+        assert deadline.time_remaining() == timedelta(0)
+    assert not deadline.is_overdue()
+
+
+def test_nested_frozen_now_keeps_the_outer_instant():
+    with clock.frozen_now() as outer:
+        with clock.frozen_now() as inner:
+            assert inner == outer
+        assert clock.now() == outer
+
+
+def test_presenter_labels_use_the_clock():
+    due = datetime.now(timezone.utc) + timedelta(days=1)
+    presenter = WebTaskPresenter()
+
+    with clock.frozen_now(due + timedelta(seconds=1)):
+        assert presenter._format_due_date(due).startswith("Overdue")
+    assert not presenter._format_due_date(due).startswith("Overdue")
@@ -0,0 +1,48 @@
+import logging
+
+import pytest
+
+from todo_app.domain.diagnostics import DomainLogger, set_sample_rate
+
+
+@pytest.fixture
+def events():
+    return DomainLogger("todo_app.tests.diagnostics")
+
+
+def test_context_not_built_when_level_disabled(events, caplog):
+    built = []
+    caplog.set_level(logging.INFO, logger="todo_app.tests.diagnostics")
+
+    events.debug("Hot path", lambda: built.append(1) or {"n": 1})
+
+    assert built == []
+    assert caplog.records == []
+
+
+def test_enabled_event_carries_context(events, caplog):
+    caplog.set_level(logging.DEBUG, logger="todo_app.tests.diagnostics")
+
+    events.debug("Hot path", lambda: {"n": 1})
+
+    (record,) = caplog.records
+    assert record.context == {"n": 1}
+    assert record.funcName == "test_enabled_event_carries_context"
+
+
+def test_sample_rate_override(events, caplog):
+    caplog.set_level(logging.DEBUG, logger="todo_app.tests.diagnostics")
+    set_sample_rate("Sampled", 0.0)
+    try:
+        for _ in range(20):
+            events.debug("Sampled")
+        events.debug("Not sampled")
+    finally:
+        set_sample_rate("Sampled", 1.0)
+
+    assert [r.getMessage() for r in caplog.records] == ["Not sampled"]
+
+
+def test_sample_rate_must_be_a_fraction():
+    with pytest.raises(ValueError):
+        set_sample_rate("Event", 2.0)
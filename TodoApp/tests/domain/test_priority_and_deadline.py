@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from uuid import uuid4
 
 import pytest
 from freezegun import freeze_time
@@ -123,4 +124,30 @@ class TestTaskPriorityCalculator:
             due_date=Deadline(due_date),
         )
         priority = TaskPriorityCalculator.calculate_priority(task)
-        assert priority == expected_priority
\ No newline at end of file
+        assert priority == expected_priority
+
+    @freeze_time("2024-01-01 12:00:00+00:00")
+    def test_batch_matches_per_task_calculation(self):
+        now = datetime.now(timezone.utc)
+        project_id = uuid4()
+        tasks = [Task(title="No deadline", description="", project_id=project_id, priority=Priority.LOW)] + [
+            Task(title=f"Task {hours}", description="", project_id=project_id, due_date=Deadline(now + timedelta(hours=hours)))
+            for hours in (0, 1, 12, 13, 47, 48, 49, 24 * 30)
+        ]
+
+        expected = [TaskPriorityCalculator.calculate_priority(task) for task in tasks]
+        assert TaskPriorityCalculator.calculate_priorities(tasks) == expected
+
+    def test_calculate_from_columns(self):
+        now = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        ts = now.timestamp()
+        priorities = TaskPriorityCalculator.calculate_from_columns(
+            [float("nan"), ts - 60, ts + 3600, ts + 86400, ts + 10 * 86400],
+            [Priority.LOW, Priority.LOW, Priority.LOW, Priority.HIGH, Priority.HIGH],
+            now,
+        )
+        assert priorities == [Priority.LOW, Priority.HIGH, Priority.HIGH, Priority.MEDIUM, Priority.LOW]
+
+    def test_calculate_from_columns_rejects_ragged_columns(self):
+        with pytest.raises(ValueError, match="Column lengths differ"):
+            TaskPriorityCalculator.calculate_from_columns([0.0], [], datetime.now(timezone.utc))
@@ -0,0 +1,66 @@
+import csv
+import io
+from pathlib import Path
+from types import SimpleNamespace
+
+from todo_app.application.dtos.task_dtos import RejectedRecord
+from todo_app.application.use_cases.task_use_cases import ImportTasksUseCase
+from todo_app.infrastructure.cli.import_tasks import guess_format, read_task_records, run_import
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+
+
+def test_csv_records_are_keyed_by_the_header():
+
+    stream = io.StringIO("title,description,priority\nWrite report,,HIGH\nCall Bob,about lunch,\n")
+
+    records = list(read_task_records(stream, "csv"))
+
+    assert records == [
+        {"title": "Write report", "description": "", "priority": "HIGH"},
+        {"title": "Call Bob", "description": "about lunch", "priority": ""},
+    ]
+
+
+def test_ndjson_skips_blank_lines_and_rejects_the_bad_ones():
+
+    stream = io.StringIO('{"title": "One"}\n\n{"title": \n[1, 2]\n{"title": "Two"}\n')
+
+    records = list(read_task_records(stream, "ndjson"))
+
+    assert records[0] == {"title": "One"}
+    assert isinstance(records[1], RejectedRecord) and records[1].reason.startswith("Line 3 is not valid JSON")
+    assert records[2] == RejectedRecord("Line 4 is not a JSON object")
+    assert records[3] == {"title": "Two"}
+
+
+def test_csv_reading_continues_past_an_unreadable_row():
+
+    stream = io.StringIO("title,description\nOne,\n" + "x" * (csv.field_size_limit() + 1) + ",\nTwo,\n")
+
+    records = list(read_task_records(stream, "csv"))
+
+    assert [r["title"] for r in (records[0], records[2])] == ["One", "Two"]
+    assert isinstance(records[1], RejectedRecord)
+
+
+def test_import_command_reports_what_landed(tmp_path, capsys):
+    task_repo, project_repo = InMemoryTaskRepository(), InMemoryProjectRepository()
+    shared = ImportTasksUseCase(task_repo, project_repo)
+    app = SimpleNamespace(task_repository=task_repo, project_repository=project_repo, import_tasks_use_case=shared)
+    source = tmp_path / "tasks.ndjson"
+    source.write_text('{"title": "One"}\n{"title": "Two"}\n{"title": \n{"title": "Three"}\n')
+
+    assert run_import(app, str(source), chunk_size=1) == 1
+
+    out, err = capsys.readouterr()
+    assert "Imported 3 tasks" in out and "1 rejected" in out
+    assert "record 3: Line 3 is not valid JSON" in err
+    assert len(task_repo.find_by_project(project_repo.get_inbox().id)) == 3
+    assert shared.chunk_size == ImportTasksUseCase.chunk_size
+
+
+def test_format_follows_the_file_extension():
+
+    assert guess_format(Path("tasks.ndjson")) == "ndjson"
+    assert guess_format(Path("tasks.JSONL")) == "ndjson"
+    assert guess_format(Path("tasks.csv")) == "csv"
@@ -0,0 +1,119 @@
+import os
+import stat
+import threading
+from uuid import uuid4
+
+import pytest
+
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence import atomic
+from todo_app.infrastructure.persistence.atomic import atomic_write_text
+from todo_app.infrastructure.persistence.file import FileTaskRepository
+from todo_app.infrastructure.persistence.group_commit import GroupCommitter
+
+
+def test_atomic_write_replaces_file(tmp_path):
+    path = tmp_path / "store.json"
+    path.write_text("old")
+
+    atomic_write_text(path, "new")
+
+    assert path.read_text() == "new"
+    assert [p.name for p in tmp_path.iterdir()] == ["store.json"]
+
+
+def test_failed_write_keeps_previous_store(tmp_path, monkeypatch):
+    task_repo = FileTaskRepository(tmp_path)
+    kept = Task(title="Kept", description="", project_id=uuid4())
+    task_repo.save(kept)
+
+    def crash(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(atomic.os, "replace", crash)
+    with pytest.raises(OSError):
+        task_repo.save(Task(title="Lost", description="", project_id=kept.project_id))
+
+    assert [t.title for t in FileTaskRepository(tmp_path).find_by_project(kept.project_id)] == ["Kept"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_group_commit_coalesces_concurrent_saves(tmp_path, monkeypatch):
+    task_repo = FileTaskRepository(tmp_path, group_commit_window=0.05)
+    project_id = uuid4()
+    writes = []
+    save_tasks = task_repo._save_tasks
+    monkeypatch.setattr(task_repo, "_save_tasks", lambda tasks: writes.append(1) or save_tasks(tasks))
+
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(20)]
+    threads = [threading.Thread(target=task_repo.save, args=(task,)) for task in tasks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(writes) < len(tasks)
+    assert {t.id for t in task_repo.find_by_project(project_id)} == {t.id for t in tasks}
+
+
+def test_group_commit_applies_changes_in_order(tmp_path):
+    task_repo = FileTaskRepository(tmp_path, group_commit_window=0.01)
+    task = Task(title="Short lived", description="", project_id=uuid4())
+
+    task_repo.save(task)
+    task_repo.delete(task.id)
+
+    assert task_repo.find_by_project(task.project_id) == []
+
+
+def test_group_commit_error_reaches_every_waiter():
+    started = threading.Event()
+
+    def apply(ops):
+        raise RuntimeError("write failed")
+
+    committer = GroupCommitter(apply, window=0.05)
+    errors = []
+
+    def submit(op):
+        started.set()
+        try:
+            committer.submit(op)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=submit, args=(1,))
+    leader.start()
+    started.wait()
+    follower = threading.Thread(target=submit, args=(2,))
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert len(errors) == 2
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+def test_atomic_write_keeps_the_file_mode(tmp_path):
+    existing = tmp_path / "store.json"
+    existing.write_text("old")
+    existing.chmod(0o604)
+    new = tmp_path / "new.json"
+    umask = os.umask(0o027)
+    try:
+        atomic_write_text(existing, "new")
+        atomic_write_text(new, "new")
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(existing.stat().st_mode) == 0o604
+    assert stat.S_IMODE(new.stat().st_mode) == 0o640
+
+
+def test_atomic_write_leaves_the_process_umask_alone(tmp_path, monkeypatch):
+    # Other threads may create files meanwhile; they must never see a cleared umask.
+    monkeypatch.setattr(os, "umask", lambda mask: pytest.fail("umask changed during a write"))
+
+    atomic_write_text(tmp_path / "new.json", "new")
+
+    assert (tmp_path / "new.json").read_text() == "new"
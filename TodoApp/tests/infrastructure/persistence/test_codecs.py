@@ -0,0 +1,106 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+from freezegun import freeze_time
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline, Priority, ProjectType, TaskStatus
+from todo_app.infrastructure.persistence.codecs import CompactCodec, JsonCodec, dict_to_task, get_codec, task_to_dict
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+
+
+def make_task() -> Task:
+    due = datetime.now(timezone(timedelta(hours=2))) + timedelta(days=2)
+    task = Task(title="Task", description="Desc", project_id=uuid4(),
+                due_date=Deadline(due), priority=Priority.HIGH)
+    task.complete(notes="done")
+    return task
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), CompactCodec()], ids=lambda c: c.name)
+def test_task_round_trip(codec):
+    task = make_task()
+
+    decoded = codec.decode_task(json.loads(codec.dumps([codec.encode_task(task)]))[0])
+
+    assert decoded.id == task.id
+    assert decoded.project_id == task.project_id
+    assert decoded.due_date.due_date == task.due_date.due_date
+    assert decoded.priority == Priority.HIGH
+    assert decoded.status == TaskStatus.DONE
+    assert decoded.completed_at == task.completed_at
+    assert decoded.completion_notes == "done"
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), CompactCodec()], ids=lambda c: c.name)
+def test_task_decodes_after_its_deadline_passed(codec):
+    with freeze_time("2024-01-01 12:00:00"):
+        task = Task(title="Task", description="", project_id=uuid4(),
+                    due_date=Deadline(datetime(2024, 1, 2, tzinfo=timezone.utc)))
+        record = json.loads(codec.dumps([codec.encode_task(task)]))[0]
+        row = task_to_dict(task)
+
+    with freeze_time("2024-02-01 12:00:00"):
+        decoded = codec.decode_task(record)
+        assert decoded.due_date.due_date == task.due_date.due_date
+        assert dict_to_task(row).due_date.is_overdue()
+        with pytest.raises(ValueError, match="in the past"):
+            Deadline(task.due_date.due_date)
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), CompactCodec()], ids=lambda c: c.name)
+def test_project_round_trip_and_accessors(codec):
+    inbox = Project.create_inbox()
+    record = json.loads(codec.dumps([codec.encode_project(inbox)]))[0]
+
+    decoded = codec.decode_project(record)
+
+    assert decoded.id == inbox.id
+    assert decoded.project_type == ProjectType.INBOX
+    assert codec.project_is_inbox(record)
+    assert codec.record_id(record) == codec.key(inbox.id)
+
+
+def test_compact_keys_sort_like_uuids():
+    codec = CompactCodec()
+    ids = [uuid4() for _ in range(50)]
+
+    assert sorted(ids, key=codec.key) == sorted(ids)
+
+
+def test_compact_encoding_has_no_indentation():
+    codec = CompactCodec()
+
+    text = codec.dumps([codec.encode_task(make_task())])
+
+    assert "\n" not in text
+    assert len(text) < len(JsonCodec().dumps([JsonCodec().encode_task(make_task())])) / 2
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        get_codec("msgpack")
+
+
+def test_compact_repository_reads_and_migrates_json_store(tmp_path):
+    legacy_tasks = FileTaskRepository(tmp_path, JsonCodec())
+    legacy_projects = FileProjectRepository(tmp_path, JsonCodec())
+    project = Project(name="Legacy")
+    task = Task(title="Old", description="", project_id=project.id)
+    project.add_task(task)
+    legacy_projects.set_task_repository(legacy_tasks)
+    legacy_projects.save(project)
+
+    tasks = FileTaskRepository(tmp_path, CompactCodec())
+    projects = FileProjectRepository(tmp_path, CompactCodec())
+    projects.set_task_repository(tasks)
+
+    assert [t.id for t in projects.get(project.id).tasks] == [task.id]
+    assert tasks.get(task.id).title == "Old"
+
+    tasks.save(Task(title="New", description="", project_id=project.id))
+
+    assert all(isinstance(r, list) for r in json.loads(tasks.tasks_file.read_text()))
+    assert {t.title for t in tasks.iter_by_project(project.id)} == {"Old", "New"}
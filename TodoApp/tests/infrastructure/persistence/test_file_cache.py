@@ -0,0 +1,34 @@
+from todo_app.infrastructure.persistence.cache import FileSignatureCache
+
+
+def test_value_is_rebuilt_when_file_changes(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[]")
+    cache = FileSignatureCache(path)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return path.read_text()
+
+    assert cache.get(build) == "[]"
+    assert cache.get(build) == "[]"
+    path.write_text("[1, 2]")
+
+    assert cache.get(build) == "[1, 2]"
+    assert len(builds) == 2
+
+
+def test_invalidate_during_build_is_not_cached(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[]")
+    cache = FileSignatureCache(path)
+
+    def racing_build():
+        cache.invalidate()
+        return "stale"
+
+    assert cache.get(racing_build) == "stale"
+    assert cache.fresh() is None
+    assert cache.get(lambda: "current") == "current"
+    assert cache.fresh() == "current"
@@ -0,0 +1,280 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline, TaskStatus
+from todo_app.infrastructure.persistence.codecs import get_codec
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository, iter_json_array
+
+
+@pytest.fixture(params=["json", "compact"])
+def repos(tmp_path, request):
+    codec = get_codec(request.param)
+    task_repo = FileTaskRepository(tmp_path, codec)
+    project_repo = FileProjectRepository(tmp_path, codec)
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
+
+
+def test_find_by_projects_groups_tasks(repos):
+    task_repo, _ = repos
+    first, second, empty = uuid4(), uuid4(), uuid4()
+    tasks = [
+        Task(title="A", description="", project_id=first),
+        Task(title="B", description="", project_id=second),
+        Task(title="C", description="", project_id=first),
+        Task(title="Unrelated", description="", project_id=uuid4()),
+    ]
+    for task in tasks:
+        task_repo.save(task)
+
+    grouped = task_repo.find_by_projects([first, second, empty])
+
+    assert {t.title for t in grouped[first]} == {"A", "C"}
+    assert [t.title for t in grouped[second]] == ["B"]
+    assert grouped[empty] == []
+
+
+def test_get_all_reads_task_file_once(repos, monkeypatch):
+    task_repo, project_repo = repos
+    for i in range(5):
+        project = Project(name=f"Project {i}")
+        project.add_task(Task(title=f"Task {i}", description="", project_id=project.id))
+        project_repo.save(project)
+
+    reads = []
+    load_tasks = task_repo._load_tasks
+    monkeypatch.setattr(task_repo, "_load_tasks", lambda: reads.append(1) or load_tasks())
+
+    projects = project_repo.get_all()
+
+    assert len(reads) == 1
+    assert all(len(p.tasks) == 1 for p in projects if p.name.startswith("Project"))
+
+
+def test_save_many_updates_and_inserts_in_one_write(repos, monkeypatch):
+    task_repo, _ = repos
+    project_id = uuid4()
+    existing = Task(title="Existing", description="", project_id=project_id)
+    task_repo.save(existing)
+
+    writes = []
+    save_tasks = task_repo._save_tasks
+    monkeypatch.setattr(task_repo, "_save_tasks", lambda tasks: writes.append(1) or save_tasks(tasks))
+
+    existing.complete()
+    new_tasks = [Task(title=f"New {i}", description="", project_id=project_id) for i in range(3)]
+    task_repo.save_many([existing, *new_tasks])
+
+    assert len(writes) == 1
+    stored = task_repo.find_by_project(project_id)
+    assert len(stored) == 4
+    assert task_repo.get(existing.id).completed_at is not None
+
+
+def test_project_save_writes_tasks_once(repos, monkeypatch):
+    task_repo, project_repo = repos
+    project = Project(name="Big Project")
+    for i in range(10):
+        project.add_task(Task(title=f"Task {i}", description="", project_id=project.id))
+
+    writes = []
+    save_tasks = task_repo._save_tasks
+    monkeypatch.setattr(task_repo, "_save_tasks", lambda tasks: writes.append(1) or save_tasks(tasks))
+
+    project_repo.save(project)
+
+    assert len(writes) == 1
+    assert len(task_repo.find_by_project(project.id)) == 10
+
+
+def test_batch_project_save_and_task_delete_write_once(repos, monkeypatch):
+    task_repo, project_repo = repos
+    projects = [Project(name=f"Project {i}") for i in range(3)]
+    for project in projects:
+        project.add_task(Task(title="Task", description="", project_id=project.id))
+
+    writes = []
+    save_tasks = task_repo._save_tasks
+    monkeypatch.setattr(task_repo, "_save_tasks", lambda tasks: writes.append(1) or save_tasks(tasks))
+
+    project_repo.save_many(projects)
+    assert len(writes) == 1
+    assert [len(project_repo.get(p.id).tasks) for p in projects] == [1, 1, 1]
+
+    task_repo.delete_many(t.id for p in projects for t in p.tasks)
+    assert len(writes) == 2
+    assert all(task_repo.count_by_project(p.id) == 0 for p in projects)
+
+
+def test_find_due_between_filters_window(repos):
+    task_repo, _ = repos
+    now = datetime.now(timezone.utc)
+    project_id = uuid4()
+    later = Task(title="Later", description="", project_id=project_id,
+                 due_date=Deadline(now + timedelta(hours=20)))
+    sooner = Task(title="Sooner", description="", project_id=project_id,
+                  due_date=Deadline(now + timedelta(hours=2)))
+    outside = Task(title="Outside", description="", project_id=project_id,
+                   due_date=Deadline(now + timedelta(days=5)))
+    task_repo.save_many([later, sooner, outside, Task(title="Undated", description="", project_id=project_id)])
+
+    due = task_repo.find_due_between(now, now + timedelta(days=1))
+
+    assert [t.title for t in due] == ["Sooner", "Later"]
+
+
+def test_get_page_returns_projects_after_cursor_with_tasks(repos):
+    _, project_repo = repos
+    for i in range(4):
+        project = Project(name=f"Project {i}")
+        project.add_task(Task(title=f"Task {i}", description="", project_id=project.id))
+        project_repo.save(project)
+    ids = sorted(p.id for p in project_repo.get_all())
+
+    page = project_repo.get_page(2, after=ids[0])
+
+    assert [p.id for p in page] == ids[1:3]
+    assert all(len(p.tasks) == 1 for p in page if p.name.startswith("Project"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 1 << 16])
+def test_iter_json_array_matches_json_load(tmp_path, chunk_size):
+    path = tmp_path / "data.json"
+    data = [{"id": "a", "n": 12345}, 67890, "x,]y", [1, [2]], {"nested": {"list": []}}, 3.5]
+    path.write_text(json.dumps(data, indent=2))
+
+    assert list(iter_json_array(path, chunk_size)) == data
+
+
+def test_iter_json_array_rejects_truncated_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('[{"id": "a"}, {"id": ')
+
+    with pytest.raises(ValueError):
+        list(iter_json_array(path, 4))
+
+
+def test_iterators_stream_matching_tasks(repos):
+    task_repo, _ = repos
+    project_id = uuid4()
+    done = Task(title="Done", description="", project_id=project_id)
+    done.complete()
+    open_task = Task(title="Open", description="", project_id=project_id)
+    other = Task(title="Other", description="", project_id=uuid4())
+    task_repo.save_many([done, open_task, other])
+
+    assert {t.title for t in task_repo.iter_by_project(project_id)} == {"Done", "Open"}
+    assert {t.title for t in task_repo.iter_active_tasks()} == {"Open", "Other"}
+    assert list(task_repo.iter_active_tasks())[0].id == task_repo.get_active_tasks()[0].id
+
+
+def test_repeated_reads_are_served_from_cache(repos, monkeypatch):
+    task_repo, _ = repos
+    project_id = uuid4()
+    task = Task(title="Cached", description="", project_id=project_id)
+    task_repo.save(task)
+
+    reads = []
+    load_tasks = task_repo._load_tasks
+    monkeypatch.setattr(task_repo, "_load_tasks", lambda: reads.append(1) or load_tasks())
+
+    for _ in range(3):
+        assert task_repo.get(task.id).title == "Cached"
+        assert len(task_repo.find_by_project(project_id)) == 1
+        assert len(task_repo.get_active_tasks()) == 1
+
+    assert len(reads) == 1
+
+
+def test_cached_entities_are_not_shared(repos):
+    task_repo, _ = repos
+    task = Task(title="Original", description="", project_id=uuid4())
+    task_repo.save(task)
+
+    loaded = task_repo.get(task.id)
+    loaded.title = "Unsaved change"
+
+    assert task_repo.get(task.id).title == "Original"
+    assert task_repo.get(task.id) is not task_repo.get(task.id)
+
+
+def test_cache_sees_writes_from_another_repository(tmp_path):
+    reader = FileTaskRepository(tmp_path)
+    writer = FileTaskRepository(tmp_path)
+    task = Task(title="Before", description="", project_id=uuid4())
+    writer.save(task)
+    assert reader.get(task.id).title == "Before"
+
+    task.title = "After, and longer"
+    writer.save(task)
+
+    assert reader.get(task.id).title == "After, and longer"
+
+
+def test_project_cache_keeps_tasks_per_caller(repos):
+    _, project_repo = repos
+    project = Project(name="Project")
+    project.add_task(Task(title="Task", description="", project_id=project.id))
+    project_repo.save(project)
+
+    first = project_repo.get(project.id)
+    first._tasks.clear()
+
+    assert len(project_repo.get(project.id).tasks) == 1
+
+
+def test_lazy_get_reads_tasks_only_when_used(repos, monkeypatch):
+    task_repo, project_repo = repos
+    project_repo.set_task_repository(task_repo, lazy_tasks=True)
+    project = Project(name="Lazy")
+    project.add_task(Task(title="Task", description="", project_id=project.id))
+    project_repo.save(project)
+
+    calls = []
+    find_by_project = task_repo.find_by_project
+    monkeypatch.setattr(task_repo, "find_by_project", lambda pid: calls.append(pid) or find_by_project(pid))
+    writes = []
+    save_tasks = task_repo._save_tasks
+    monkeypatch.setattr(task_repo, "_save_tasks", lambda tasks: writes.append(1) or save_tasks(tasks))
+
+    fetched = project_repo.get(project.id)
+    fetched.name = "Renamed"
+    project_repo.save(fetched)
+
+    assert calls == [] and writes == []
+    assert project_repo.get(project.id).name == "Renamed"
+    assert [t.title for t in project_repo.get(project.id).tasks] == ["Task"]
+    assert calls == [project.id]
+
+
+def test_pinned_inbox_notices_a_replacement_by_another_repository(tmp_path):
+    first = FileProjectRepository(tmp_path)
+    other = FileProjectRepository(tmp_path)
+    other.set_task_repository(FileTaskRepository(tmp_path))
+    old_inbox = first.get_inbox()
+
+    other.delete(old_inbox.id)
+    new_inbox = Project.create_inbox()
+    other.save(new_inbox)
+
+    assert first.get_inbox().id == new_inbox.id
+    assert first.get_inbox().id == new_inbox.id
+
+
+@pytest.mark.parametrize("codec_name", ["json", "compact"])
+def test_exists_and_counts_do_not_decode_tasks(tmp_path, monkeypatch, codec_name):
+    codec = get_codec(codec_name)
+    project_id = uuid4()
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(3)]
+    tasks[0].complete()
+    FileTaskRepository(tmp_path, codec).save_many(tasks)
+    task_repo = FileTaskRepository(tmp_path, codec)
+    monkeypatch.setattr(codec, "decode_task", lambda record: pytest.fail("decoded a task"))
+
+    assert task_repo.exists(tasks[2].id)
+    assert task_repo.count_by_project(project_id) == 3
+    assert task_repo.count_by_project(project_id, TaskStatus.DONE) == 1
@@ -0,0 +1,88 @@
+from uuid import uuid4
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.identity_map import (
+    IdentityMapProjectRepository,
+    IdentityMapTaskRepository,
+    current_identity_map,
+    identity_map_scope,
+)
+
+
+@pytest.fixture
+def repos(tmp_path):
+    task_repo = FileTaskRepository(tmp_path)
+    project_repo = FileProjectRepository(tmp_path)
+    project_repo.set_task_repository(task_repo)
+    return IdentityMapTaskRepository(task_repo), IdentityMapProjectRepository(project_repo)
+
+
+def test_reads_pass_through_outside_a_scope(repos):
+    task_repo, _ = repos
+    task = Task(title="Task", description="", project_id=uuid4())
+    task_repo.save(task)
+
+    assert current_identity_map() is None
+    assert task_repo.get(task.id) is not task_repo.get(task.id)
+
+
+def test_repeated_get_in_a_scope_loads_once(repos, monkeypatch):
+    task_repo, _ = repos
+    task = Task(title="Task", description="", project_id=uuid4())
+    task_repo.save(task)
+    loads = []
+    get = task_repo.inner.get
+    monkeypatch.setattr(task_repo.inner, "get", lambda task_id: loads.append(task_id) or get(task_id))
+
+    with identity_map_scope() as identity_map:
+        first = task_repo.get(task.id)
+        assert task_repo.get(task.id) is first
+        assert task_repo.exists(task.id)
+
+    assert loads == [task.id]
+    assert identity_map.stats() == {"hits": 2, "misses": 1, "entities": 1}
+    assert current_identity_map() is None
+
+
+def test_writes_keep_the_map_current(repos):
+    task_repo, _ = repos
+    task = Task(title="Task", description="", project_id=uuid4())
+
+    with identity_map_scope():
+        task_repo.save(task)
+        assert task_repo.get(task.id) is task
+
+        task_repo.delete(task.id)
+        with pytest.raises(TaskNotFoundError):
+            task_repo.get(task.id)
+
+
+def test_project_and_task_share_instances(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Project")
+    task = Task(title="Task", description="", project_id=project.id)
+    project.add_task(task)
+    project_repo.save(project)
+
+    with identity_map_scope():
+        loaded_task = task_repo.get(task.id)
+        loaded_project = project_repo.get(project.id)
+        assert loaded_project.get_task(task.id) is loaded_task
+        assert project_repo.get(project.id) is loaded_project
+        assert project_repo.get_inbox() is project_repo.get_inbox()
+
+
+def test_scopes_do_not_share_entities(repos):
+    task_repo, _ = repos
+    task = Task(title="Task", description="", project_id=uuid4())
+    task_repo.save(task)
+
+    with identity_map_scope():
+        first = task_repo.get(task.id)
+    with identity_map_scope():
+        assert task_repo.get(task.id) is not first
@@ -0,0 +1,171 @@
+from uuid import uuid4
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ProjectNotFoundError, TaskNotFoundError
+from todo_app.domain.value_objects import ProjectType, TaskStatus
+from todo_app.infrastructure.persistence.journal import JournalProjectRepository, JournalTaskRepository
+
+
+@pytest.fixture
+def repos(tmp_path):
+    task_repo = JournalTaskRepository(tmp_path)
+    project_repo = JournalProjectRepository(tmp_path)
+    project_repo.set_task_repository(task_repo)
+    yield task_repo, project_repo
+    task_repo.close()
+    project_repo.close()
+
+
+def test_task_save_and_get(repos):
+    task_repo, _ = repos
+    task = Task(title="Test Task", description="Test", project_id=uuid4())
+
+    task_repo.save(task)
+
+    loaded = task_repo.get(task.id)
+    assert loaded.id == task.id
+    assert loaded.title == "Test Task"
+    assert loaded.project_id == task.project_id
+
+
+def test_task_delete(repos):
+    task_repo, _ = repos
+    task = Task(title="Test Task", description="Test", project_id=uuid4())
+    task_repo.save(task)
+
+    task_repo.delete(task.id)
+
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+
+
+def test_task_delete_nonexistent_is_not_journaled(repos):
+    task_repo, _ = repos
+
+    task_repo.delete(uuid4())
+
+    assert task_repo._store.journal_entries == 0
+
+
+def test_find_by_project_and_active_tasks(repos):
+    task_repo, _ = repos
+    project_id = uuid4()
+    done = Task(title="Done", description="Test", project_id=project_id)
+    done.complete()
+    todo = Task(title="Todo", description="Test", project_id=project_id)
+    other = Task(title="Other", description="Test", project_id=uuid4())
+    for task in (done, todo, other):
+        task_repo.save(task)
+
+    assert {t.id for t in task_repo.find_by_project(project_id)} == {done.id, todo.id}
+    assert {t.id for t in task_repo.get_active_tasks()} == {todo.id, other.id}
+
+
+def test_index_rebuilt_on_reopen(tmp_path):
+    project_id = uuid4()
+    repo = JournalTaskRepository(tmp_path)
+    kept = Task(title="Kept", description="Test", project_id=project_id)
+    removed = Task(title="Removed", description="Test", project_id=project_id)
+    repo.save(kept)
+    repo.save(removed)
+    kept.complete(notes="finished")
+    repo.save(kept)
+    repo.delete(removed.id)
+    repo.close()
+
+    reopened = JournalTaskRepository(tmp_path)
+
+    loaded = reopened.get(kept.id)
+    assert loaded.status == TaskStatus.DONE
+    assert loaded.completion_notes == "finished"
+    with pytest.raises(TaskNotFoundError):
+        reopened.get(removed.id)
+    reopened.close()
+
+
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    repo = JournalTaskRepository(tmp_path, compaction_threshold=3)
+    tasks = [Task(title=f"Task {i}", description="Test", project_id=uuid4()) for i in range(4)]
+    for task in tasks:
+        repo.save(task)
+
+    assert repo._store.snapshot_file.exists()
+    assert repo._store.journal_entries == 1
+    repo.close()
+
+    reopened = JournalTaskRepository(tmp_path)
+    assert {t.id for t in reopened.get_active_tasks()} == {t.id for t in tasks}
+    reopened.close()
+
+
+def test_torn_journal_tail_is_discarded(tmp_path):
+    repo = JournalTaskRepository(tmp_path)
+    task = Task(title="Test Task", description="Test", project_id=uuid4())
+    repo.save(task)
+    repo.close()
+
+    with (tmp_path / "tasks.journal").open("a") as journal:
+        journal.write('{"op":"put","record":{"id"')
+
+    reopened = JournalTaskRepository(tmp_path)
+    assert reopened.get(task.id).title == "Test Task"
+
+    second = Task(title="Second", description="Test", project_id=uuid4())
+    reopened.save(second)
+    reopened.close()
+
+    assert JournalTaskRepository(tmp_path).get(second.id).title == "Second"
+
+
+def test_project_repository_creates_inbox_once(tmp_path):
+    JournalProjectRepository(tmp_path).close()
+    repo = JournalProjectRepository(tmp_path)
+
+    inbox_projects = [p for p in repo.get_all() if p.project_type == ProjectType.INBOX]
+    assert len(inbox_projects) == 1
+    assert repo.get_inbox().id == inbox_projects[0].id
+    repo.close()
+
+
+def test_project_save_persists_tasks(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Test Project")
+    task = Task(title="Test Task", description="Test", project_id=project.id)
+    project.add_task(task)
+
+    project_repo.save(project)
+
+    loaded = project_repo.get(project.id)
+    assert [t.id for t in loaded.tasks] == [task.id]
+    assert task_repo.get(task.id).project_id == project.id
+
+
+def test_project_delete_removes_tasks(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Test Project")
+    task = Task(title="Test Task", description="Test", project_id=project.id)
+    project.add_task(task)
+    project_repo.save(project)
+
+    project_repo.delete(project.id)
+
+    with pytest.raises(ProjectNotFoundError):
+        project_repo.get(project.id)
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+
+
+def test_find_by_project_page(repos):
+    task_repo, _ = repos
+    project_id = uuid4()
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(5)]
+    task_repo.save_many(tasks + [Task(title="Other", description="", project_id=uuid4())])
+    ids = sorted(t.id for t in tasks)
+
+    first = task_repo.find_by_project_page(project_id, 2)
+    rest = task_repo.find_by_project_page(project_id, 10, after=first[-1].id)
+
+    assert [t.id for t in first] == ids[:2]
+    assert [t.id for t in rest] == ids[2:]
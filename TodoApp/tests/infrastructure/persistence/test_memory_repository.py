@@ -0,0 +1,164 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+
+
+def test_find_by_project_uses_project_index():
+    repo = InMemoryTaskRepository()
+    project_id = uuid4()
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(3)]
+    repo.save_many(tasks)
+    repo.save(Task(title="Other", description="", project_id=uuid4()))
+
+    assert repo.find_by_project(project_id) == tasks
+    assert repo.find_by_project(uuid4()) == []
+
+
+def test_index_follows_project_change_on_save():
+    repo = InMemoryTaskRepository()
+    old_project, new_project = uuid4(), uuid4()
+    task = Task(title="Moving", description="", project_id=old_project)
+    repo.save(task)
+
+    task.project_id = new_project
+    repo.save(task)
+
+    assert repo.find_by_project(old_project) == []
+    assert repo.find_by_project(new_project) == [task]
+    assert old_project not in repo._by_project
+
+
+def test_index_follows_status_change_on_save():
+    repo = InMemoryTaskRepository()
+    task = Task(title="Task", description="", project_id=uuid4())
+    other = Task(title="Other", description="", project_id=uuid4())
+    repo.save_many([task, other])
+
+    task.start()
+    repo.save(task)
+    assert repo.get_active_tasks() == [other, task]
+
+    task.complete()
+    repo.save(task)
+    assert repo.get_active_tasks() == [other]
+
+
+def test_unsaved_completion_is_not_reported_active():
+    repo = InMemoryTaskRepository()
+    task = Task(title="Task", description="", project_id=uuid4())
+    repo.save(task)
+
+    task.complete()
+
+    assert repo.get_active_tasks() == []
+
+
+def test_delete_removes_index_entries():
+    repo = InMemoryTaskRepository()
+    project_id = uuid4()
+    task = Task(title="Task", description="", project_id=project_id)
+    repo.save(task)
+
+    repo.delete(task.id)
+    repo.delete(task.id)
+
+    assert repo.find_by_project(project_id) == []
+    assert repo.get_active_tasks() == []
+    assert repo._index_keys == {}
+
+
+def test_project_save_registers_tasks():
+    task_repo = InMemoryTaskRepository()
+    project_repo = InMemoryProjectRepository()
+    project_repo.set_task_repository(task_repo)
+    project = Project(name="Project")
+    task = Task(title="Task", description="", project_id=project.id)
+    project.add_task(task)
+
+    project_repo.save(project)
+
+    assert project_repo.get(project.id).tasks == [task]
+    assert task_repo.get(task.id) is task
+
+
+def test_find_due_between_uses_due_index():
+    repo = InMemoryTaskRepository()
+    now = datetime.now(timezone.utc)
+    project_id = uuid4()
+    soon = Task(title="Soon", description="", project_id=project_id, due_date=Deadline(now + timedelta(hours=2)))
+    sooner = Task(title="Sooner", description="", project_id=project_id, due_date=Deadline(now + timedelta(hours=1)))
+    later = Task(title="Later", description="", project_id=project_id, due_date=Deadline(now + timedelta(days=3)))
+    done = Task(title="Done", description="", project_id=project_id, due_date=Deadline(now + timedelta(hours=3)))
+    done.complete()
+    undated = Task(title="Undated", description="", project_id=project_id)
+    repo.save_many([soon, sooner, later, done, undated])
+
+    assert repo.find_due_between(now, now + timedelta(days=1)) == [sooner, soon]
+    assert len(repo._due_index) == 3
+
+    soon.due_date = Deadline(now + timedelta(days=2))
+    repo.save(soon)
+    later.complete()
+    repo.save(later)
+    repo.delete(sooner.id)
+
+    assert repo.find_due_between(now, now + timedelta(days=1)) == []
+    assert repo.find_due_between(now, now + timedelta(days=7)) == [soon]
+    assert len(repo._due_index) == 1
+
+
+def test_project_pages_follow_id_order():
+    repo = InMemoryProjectRepository()
+    for i in range(5):
+        repo.save(Project(name=f"Project {i}"))
+    ids = sorted(repo._projects)
+
+    first = repo.get_page(4)
+    rest = repo.get_page(4, after=first[-1].id)
+
+    assert [p.id for p in first + rest] == ids
+    repo.delete(ids[1])
+    assert [p.id for p in repo.get_page(10)] == ids[:1] + ids[2:]
+
+
+def test_iter_active_tasks_tolerates_saves_while_iterating():
+    repo = InMemoryTaskRepository()
+    project_id = uuid4()
+    repo.save_many([Task(title=f"Task {i}", description="", project_id=project_id) for i in range(3)])
+
+    for task in repo.iter_active_tasks():
+        task.complete()
+        repo.save(task)
+
+    assert repo.get_active_tasks() == []
+    assert len(list(repo.iter_by_project(project_id))) == 3
+
+
+class ScanCountingDict(dict):
+
+    scans = 0
+
+    def values(self):
+        self.scans += 1
+        return super().values()
+
+
+def test_inbox_lookup_is_pinned_until_the_inbox_changes():
+    repo = InMemoryProjectRepository()
+    repo.set_task_repository(InMemoryTaskRepository())
+    inbox = repo.get_inbox()
+    repo.save_many(Project(name=f"Project {i}") for i in range(5))
+    repo._projects = projects = ScanCountingDict(repo._projects)
+
+    assert repo.get_inbox() is inbox
+    assert projects.scans == 0
+
+    repo.delete(inbox.id)
+    replacement = Project.create_inbox()
+    repo.save(replacement)
+    assert repo.get_inbox() is replacement
+    assert projects.scans == 1
@@ -0,0 +1,51 @@
+from uuid import uuid4
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.infrastructure.persistence.codecs import get_codec
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.journal import JournalProjectRepository, JournalTaskRepository
+from todo_app.infrastructure.persistence.memory import InMemoryProjectRepository, InMemoryTaskRepository
+from todo_app.infrastructure.persistence.sharded import ShardedTaskRepository
+from todo_app.infrastructure.persistence.sqlite import SqliteDatabase, SqliteProjectRepository, SqliteTaskRepository
+
+
+@pytest.fixture(params=["memory", "file-json", "file-compact", "sharded", "journal", "sqlite"])
+def repos(tmp_path, request):
+    backend = request.param
+    if backend == "memory":
+        yield InMemoryTaskRepository(), InMemoryProjectRepository()
+    elif backend.startswith("file-"):
+        codec = get_codec(backend[len("file-"):])
+        yield FileTaskRepository(tmp_path, codec), FileProjectRepository(tmp_path, codec)
+    elif backend == "sharded":
+        yield ShardedTaskRepository(tmp_path), FileProjectRepository(tmp_path)
+    elif backend == "journal":
+        task_repo, project_repo = JournalTaskRepository(tmp_path), JournalProjectRepository(tmp_path)
+        yield task_repo, project_repo
+        task_repo.close()
+        project_repo.close()
+    else:
+        database = SqliteDatabase(tmp_path / "todo.db")
+        yield SqliteTaskRepository(database), SqliteProjectRepository(database)
+        database.close()
+
+
+def test_exists_and_count_by_project(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Counted")
+    project_repo.save(project)
+    tasks = [Task(title=f"Task {i}", description="", project_id=project.id) for i in range(3)]
+    tasks[0].complete()
+    task_repo.save_many(tasks)
+
+    assert task_repo.exists(tasks[1].id)
+    assert not task_repo.exists(uuid4())
+    assert project_repo.exists(project.id)
+    assert not project_repo.exists(uuid4())
+    assert task_repo.count_by_project(project.id) == 3
+    assert task_repo.count_by_project(project.id, TaskStatus.DONE) == 1
+    assert task_repo.count_by_project(uuid4()) == 0
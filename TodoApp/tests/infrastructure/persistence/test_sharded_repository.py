@@ -0,0 +1,213 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.domain.value_objects import Deadline
+from todo_app.infrastructure.cli.migrate import main as migrate_main
+from todo_app.infrastructure.persistence.codecs import get_codec
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence import sharded
+from todo_app.infrastructure.persistence.sharded import ShardedTaskRepository, migrate_to_shards
+
+
+@pytest.fixture(params=["json", "compact"])
+def task_repo(tmp_path, request):
+    return ShardedTaskRepository(tmp_path, get_codec(request.param))
+
+
+def test_tasks_are_stored_per_project(task_repo):
+    first, second = uuid4(), uuid4()
+    task_repo.save_many([
+        Task(title="A", description="", project_id=first),
+        Task(title="B", description="", project_id=second),
+        Task(title="C", description="", project_id=first),
+    ])
+
+    assert sorted(p.name for p in task_repo.shard_dir.glob("*.json")) == sorted(
+        [f"{first.hex}.json", f"{second.hex}.json"]
+    )
+    assert {t.title for t in task_repo.find_by_project(first)} == {"A", "C"}
+    assert task_repo.find_by_project(uuid4()) == []
+
+
+def test_save_rewrites_only_its_shard(task_repo):
+    first, second = uuid4(), uuid4()
+    task = Task(title="A", description="", project_id=first)
+    task_repo.save_many([task, Task(title="B", description="", project_id=second)])
+    other_shard = task_repo.shard_dir / f"{second.hex}.json"
+    before = other_shard.stat().st_ino
+
+    task.complete()
+    task_repo.save(task)
+
+    assert other_shard.stat().st_ino == before
+    assert task_repo.get(task.id).completed_at is not None
+
+
+def test_get_and_delete_use_the_directory(task_repo):
+    task = Task(title="A", description="", project_id=uuid4())
+    task_repo.save(task)
+
+    assert task_repo.get(task.id).title == "A"
+
+    task_repo.delete(task.id)
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+    assert task_repo.find_by_project(task.project_id) == []
+
+
+def test_moving_a_task_between_projects(task_repo):
+    source, target = uuid4(), uuid4()
+    task = Task(title="Moving", description="", project_id=source)
+    task_repo.save(task)
+
+    task.project_id = target
+    task_repo.save(task)
+
+    assert task_repo.find_by_project(source) == []
+    assert [t.id for t in task_repo.find_by_project(target)] == [task.id]
+    assert task_repo.get(task.id).project_id == target
+
+
+def test_due_between_merges_shards_in_due_order(task_repo):
+    now = datetime.now(timezone.utc)
+    tasks = [
+        Task(title=f"Due {hours}", description="", project_id=uuid4(),
+             due_date=Deadline(now + timedelta(hours=hours)))
+        for hours in (30, 5, 20)
+    ]
+    task_repo.save_many(tasks)
+
+    due = task_repo.find_due_between(now, now + timedelta(hours=24))
+
+    assert [t.title for t in due] == ["Due 5", "Due 20"]
+    assert {t.title for t in task_repo.iter_active_tasks()} == {"Due 30", "Due 5", "Due 20"}
+
+
+def test_project_repository_over_shards(tmp_path):
+    task_repo = ShardedTaskRepository(tmp_path)
+    project_repo = FileProjectRepository(tmp_path)
+    project_repo.set_task_repository(task_repo)
+    project = Project(name="Sharded")
+    project.add_task(Task(title="Task", description="", project_id=project.id))
+    project_repo.save(project)
+
+    assert [t.title for t in project_repo.get(project.id).tasks] == ["Task"]
+
+    project_repo.delete(project.id)
+    assert task_repo.find_by_project(project.id) == []
+
+
+def test_migration_moves_single_file_store(tmp_path):
+    single = FileTaskRepository(tmp_path)
+    tasks = [Task(title=f"Task {i}", description="", project_id=uuid4()) for i in range(3)]
+    single.save_many(tasks)
+
+    assert migrate_to_shards(tmp_path) == 3
+
+    assert not (tmp_path / "tasks.json").exists()
+    assert (tmp_path / "tasks.json.migrated").exists()
+    sharded = ShardedTaskRepository(tmp_path)
+    assert {sharded.get(t.id).title for t in tasks} == {t.title for t in tasks}
+    assert migrate_to_shards(tmp_path) == 0
+
+
+def test_migrate_command(tmp_path, capsys):
+    FileTaskRepository(tmp_path).save(Task(title="Task", description="", project_id=uuid4()))
+
+    assert migrate_main(["--data-dir", str(tmp_path)]) == 0
+
+    assert "Moved 1 tasks" in capsys.readouterr().out
+
+
+def test_interrupted_move_keeps_the_task_reachable(task_repo):
+    first, second = uuid4(), uuid4()
+    task = Task(title="A", description="", project_id=first)
+    task_repo.save(task)
+
+    # As if the process died after recording the move but before writing the new shard.
+    task_repo._directory.update({task.id.hex: second.hex})
+
+    assert task_repo.exists(task.id)
+    assert task_repo.get(task.id).project_id == first
+    assert task_repo._directory.entries()[task.id.hex] == first.hex
+
+
+def test_moved_tasks_leave_their_old_shard_in_one_write(task_repo, monkeypatch):
+    first, second = uuid4(), uuid4()
+    tasks = [Task(title=f"T{i}", description="", project_id=first) for i in range(3)]
+    task_repo.save_many(tasks)
+    old_shard = task_repo._shard(first.hex)
+    calls = []
+    monkeypatch.setattr(old_shard, "delete", lambda task_id: pytest.fail("per-task delete"))
+    delete_many = old_shard.delete_many
+    monkeypatch.setattr(old_shard, "delete_many", lambda ids: (calls.append(list(ids)), delete_many(calls[-1])))
+
+    for task in tasks:
+        task.project_id = second
+    task_repo.save_many(tasks)
+
+    assert [len(ids) for ids in calls] == [3]
+    assert task_repo.find_by_project(first) == []
+    assert len(task_repo.find_by_project(second)) == 3
+
+
+def test_directory_log_is_appended_and_replayed(tmp_path):
+    writer = ShardedTaskRepository(tmp_path)
+    reader = ShardedTaskRepository(tmp_path)
+    project_id = uuid4()
+    first = Task(title="A", description="", project_id=project_id)
+    writer.save(first)
+    assert reader.get(first.id).title == "A"
+    log = tmp_path / "task_directory.log"
+    size = log.stat().st_size
+
+    second = Task(title="B", description="", project_id=project_id)
+    writer.save(second)
+    writer.delete(first.id)
+
+    assert log.read_text().splitlines()[-2:] == [f"{second.id.hex} {project_id.hex}", f"{first.id.hex} -"]
+    assert log.stat().st_size > size
+    with log.open("a") as file:
+        file.write("torn")
+    assert reader.get(second.id).title == "B"
+    assert not reader.exists(first.id)
+
+
+def test_legacy_json_directory_is_converted(tmp_path):
+    task = Task(title="A", description="", project_id=uuid4())
+    (tmp_path / "tasks").mkdir()
+    FileTaskRepository(tmp_path / "tasks", filename=f"{task.project_id.hex}.json").save(task)
+    (tmp_path / "task_directory.json").write_text(json.dumps({task.id.hex: task.project_id.hex}))
+
+    repo = ShardedTaskRepository(tmp_path)
+
+    assert repo.get(task.id).title == "A"
+    assert not (tmp_path / "task_directory.json").exists()
+
+
+def test_directory_log_is_compacted(tmp_path, monkeypatch):
+    monkeypatch.setattr(sharded, "COMPACT_MIN_LINES", 4)
+    repo = ShardedTaskRepository(tmp_path)
+    kept = Task(title="Kept", description="", project_id=uuid4())
+    repo.save(kept)
+    for i in range(20):
+        task = Task(title=f"T{i}", description="", project_id=kept.project_id)
+        repo.save(task)
+        repo.delete(task.id)
+
+    lines = (tmp_path / "task_directory.log").read_text().splitlines()
+    assert len(lines) <= 6
+    assert ShardedTaskRepository(tmp_path).get(kept.id).title == "Kept"
+
+
+def test_counting_a_project_without_tasks_creates_no_shard(task_repo):
+    project_id = uuid4()
+
+    assert task_repo.count_by_project(project_id) == 0
+    assert not (task_repo.shard_dir / f"{project_id.hex}.json").exists()
@@ -0,0 +1,244 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import ProjectNotFoundError, TaskNotFoundError
+from todo_app.domain.value_objects import Deadline, ProjectType, TaskStatus
+from todo_app.infrastructure.persistence.sqlite import SqliteDatabase, SqliteProjectRepository, SqliteTaskRepository, SqliteUnitOfWork
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = SqliteDatabase(tmp_path / "todo.db")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def repos(database):
+    task_repo = SqliteTaskRepository(database)
+    project_repo = SqliteProjectRepository(database)
+    project_repo.set_task_repository(task_repo)
+    return task_repo, project_repo
+
+
+def test_database_uses_wal_mode(database):
+    assert database.connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_task_round_trip(repos):
+    task_repo, _ = repos
+    due = datetime.now(timezone.utc) + timedelta(days=3)
+    task = Task(title="Test Task", description="Test", project_id=uuid4(), due_date=Deadline(due))
+    task.complete(notes="done")
+
+    task_repo.save(task)
+
+    loaded = task_repo.get(task.id)
+    assert loaded.id == task.id
+    assert loaded.due_date.due_date == due
+    assert loaded.status == TaskStatus.DONE
+    assert loaded.completion_notes == "done"
+
+
+def test_task_save_updates_existing_row(repos):
+    task_repo, _ = repos
+    task = Task(title="Original", description="Test", project_id=uuid4())
+    task_repo.save(task)
+
+    task.title = "Renamed"
+    task_repo.save(task)
+
+    assert task_repo.get(task.id).title == "Renamed"
+    assert len(task_repo.find_by_project(task.project_id)) == 1
+
+
+def test_task_delete(repos):
+    task_repo, _ = repos
+    task = Task(title="Test Task", description="Test", project_id=uuid4())
+    task_repo.save(task)
+
+    task_repo.delete(task.id)
+
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+
+
+def test_find_by_project_and_active_tasks(repos):
+    task_repo, _ = repos
+    project_id = uuid4()
+    done = Task(title="Done", description="Test", project_id=project_id)
+    done.complete()
+    started = Task(title="Started", description="Test", project_id=project_id)
+    started.start()
+    other = Task(title="Other", description="Test", project_id=uuid4())
+    for task in (done, started, other):
+        task_repo.save(task)
+
+    assert {t.id for t in task_repo.find_by_project(project_id)} == {done.id, started.id}
+    assert {t.id for t in task_repo.get_active_tasks()} == {started.id, other.id}
+
+
+def test_project_repository_creates_inbox_once(database):
+    SqliteProjectRepository(database)
+    repo = SqliteProjectRepository(database)
+
+    inbox_projects = [p for p in repo.get_all() if p.project_type == ProjectType.INBOX]
+    assert len(inbox_projects) == 1
+    assert repo.get_inbox().id == inbox_projects[0].id
+
+
+def test_project_delete_removes_tasks(repos):
+    task_repo, project_repo = repos
+    project = Project(name="Test Project")
+    task = Task(title="Test Task", description="Test", project_id=project.id)
+    project.add_task(task)
+    project_repo.save(project)
+
+    assert [t.id for t in project_repo.get(project.id).tasks] == [task.id]
+
+    project_repo.delete(project.id)
+
+    with pytest.raises(ProjectNotFoundError):
+        project_repo.get(project.id)
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+
+
+def test_failed_transaction_rolls_back(repos, database):
+    task_repo, _ = repos
+    task = Task(title="Test Task", description="Test", project_id=uuid4())
+
+    with pytest.raises(RuntimeError):
+        with database.transaction():
+            task_repo.save(task)
+            raise RuntimeError("boom")
+
+    with pytest.raises(TaskNotFoundError):
+        task_repo.get(task.id)
+
+
+def test_concurrent_writers_use_separate_connections(repos, database):
+    task_repo, _ = repos
+    project_id = uuid4()
+    connections = set()
+    errors = []
+
+    def worker():
+        try:
+            connections.add(id(database.connection()))
+            for i in range(20):
+                task_repo.save(Task(title=f"Task {i}", description="Test", project_id=project_id))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(connections) == 4
+    assert len(task_repo.find_by_project(project_id)) == 80
+
+
+def test_find_due_between_queries_due_date_index(repos, database):
+    task_repo, _ = repos
+    now = datetime.now(timezone.utc)
+    est = timezone(timedelta(hours=-5))
+    project_id = uuid4()
+    inside = Task(title="Inside", description="", project_id=project_id,
+                  due_date=Deadline((now + timedelta(hours=5)).astimezone(est)))
+    first = Task(title="First", description="", project_id=project_id,
+                 due_date=Deadline(now + timedelta(hours=1)))
+    outside = Task(title="Outside", description="", project_id=project_id,
+                   due_date=Deadline(now + timedelta(days=2)))
+    done = Task(title="Done", description="", project_id=project_id,
+                due_date=Deadline(now + timedelta(hours=2)))
+    done.complete()
+    task_repo.save_many([inside, first, outside, done])
+
+    due = task_repo.find_due_between(now, now + timedelta(days=1))
+
+    assert [t.title for t in due] == ["First", "Inside"]
+    plan = database.connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE due_date > ? AND due_date <= ?", ("a", "b")
+    ).fetchall()
+    assert any("idx_tasks_due_date" in row["detail"] for row in plan)
+
+
+def test_task_pages_use_project_keyset_index(repos, database):
+    task_repo, _ = repos
+    project_id = uuid4()
+    tasks = [Task(title=f"Task {i}", description="", project_id=project_id) for i in range(5)]
+    task_repo.save_many(tasks + [Task(title="Other", description="", project_id=uuid4())])
+
+    first = task_repo.find_by_project_page(project_id, 3)
+    rest = task_repo.find_by_project_page(project_id, 3, after=first[-1].id)
+
+    assert [t.id for t in first + rest] == sorted(t.id for t in tasks)
+    plan = database.connection().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tasks WHERE project_id = ? AND id > ? ORDER BY id LIMIT ?",
+        ("a", "b", 1),
+    ).fetchall()
+    assert any("idx_tasks_project_id_id" in row["detail"] for row in plan)
+    assert not any("TEMP B-TREE" in row["detail"] for row in plan)
+
+
+def test_project_pages(repos):
+    _, project_repo = repos
+    for i in range(4):
+        project_repo.save(Project(name=f"Project {i}"))
+    ids = sorted(p.id for p in project_repo.get_all())
+
+    assert [p.id for p in project_repo.get_page(3)] == ids[:3]
+    assert [p.id for p in project_repo.get_page(3, after=ids[2])] == ids[3:]
+
+
+def test_lazy_project_tasks(repos):
+    task_repo, project_repo = repos
+    project_repo.set_task_repository(task_repo, lazy_tasks=True)
+    project = Project(name="Lazy")
+    project.add_task(Task(title="Task", description="", project_id=project.id))
+    project_repo.save(project)
+
+    fetched = project_repo.get(project.id)
+
+    assert not fetched.tasks_loaded
+    assert [t.title for t in fetched.tasks] == ["Task"]
+
+
+def test_unit_of_work_flushes_in_one_transaction(database, repos):
+    task_repo, project_repo = repos
+    project = Project(name="Project")
+    tasks = [Task(title=f"Task {i}", description="", project_id=project.id) for i in range(3)]
+    for task in tasks:
+        project.add_task(task)
+    project_repo.save(project)
+
+    original = project_repo.save_many
+
+    def failing_save_many(projects):
+        original(projects)
+        raise RuntimeError("disk full")
+
+    project_repo.save_many = failing_save_many
+    uow = SqliteUnitOfWork(task_repo, project_repo, database=database)
+    uow.register_dirty(project)
+    extra = Task(title="Extra", description="", project_id=uuid4())
+    uow.register_new(extra)
+    for task in tasks:
+        uow.register_dirty(task)
+        task.complete()
+    project.mark_completed()
+
+    with pytest.raises(RuntimeError):
+        uow.commit()
+
+    assert project_repo.get(project.id).status.name == "ACTIVE"
+    assert {t.status for t in task_repo.find_by_project(project.id)} == {TaskStatus.TODO}
+    assert not task_repo.exists(extra.id)
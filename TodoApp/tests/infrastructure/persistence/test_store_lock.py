@@ -0,0 +1,125 @@
+import os
+import multiprocessing
+import threading
+from uuid import uuid4
+
+import pytest
+
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.infrastructure.persistence.file import FileProjectRepository, FileTaskRepository
+from todo_app.infrastructure.persistence.locking import StoreLock
+
+
+def test_sequence_counts_writes(tmp_path):
+    lock = StoreLock(tmp_path / "tasks.json")
+
+    assert lock.sequence() == 0
+    with lock.exclusive():
+        lock.bump()
+        lock.bump()
+
+    assert lock.sequence() == 2
+
+
+def test_shared_lock_cannot_be_upgraded(tmp_path):
+    lock = StoreLock(tmp_path / "tasks.json")
+
+    with lock.shared(), pytest.raises(RuntimeError):
+        with lock.exclusive():
+            pass
+
+
+def test_exclusive_lock_blocks_other_holders(tmp_path):
+    lock = StoreLock(tmp_path / "tasks.json")
+    other = StoreLock(tmp_path / "tasks.json")
+    acquired = threading.Event()
+
+    def read():
+        with other.shared():
+            acquired.set()
+
+    with lock.exclusive():
+        reader = threading.Thread(target=read)
+        reader.start()
+        assert not acquired.wait(0.1)
+    reader.join()
+    assert acquired.is_set()
+
+
+def test_unchanged_sequence_skips_reparse(tmp_path, monkeypatch):
+    task_repo = FileTaskRepository(tmp_path)
+    task = Task(title="Task", description="", project_id=uuid4())
+    task_repo.save(task)
+    task_repo.get(task.id)
+
+    reads = []
+    load_tasks = task_repo._load_tasks
+    monkeypatch.setattr(task_repo, "_load_tasks", lambda: reads.append(1) or load_tasks())
+
+    task_repo.get(task.id)
+    assert reads == []
+
+    FileTaskRepository(tmp_path).save(Task(title="Other", description="", project_id=task.project_id))
+    assert len(task_repo.find_by_project(task.project_id)) == 2
+    assert reads == [1]
+
+
+def test_writers_on_separate_instances_lose_no_updates(tmp_path):
+    project_id = uuid4()
+    repos = [FileTaskRepository(tmp_path) for _ in range(4)]
+
+    def write(repo):
+        for i in range(10):
+            repo.save(Task(title=f"Task {i}", description="", project_id=project_id))
+
+    threads = [threading.Thread(target=write, args=(repo,)) for repo in repos]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FileTaskRepository(tmp_path).find_by_project(project_id)) == 40
+
+
+def _save_tasks_in_process(data_dir, project_id, count):
+    repo = FileTaskRepository(data_dir)
+    for i in range(count):
+        repo.save(Task(title=f"Task {i}", description="", project_id=project_id))
+
+
+def test_writers_in_separate_processes_lose_no_updates(tmp_path):
+    project_id = uuid4()
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_save_tasks_in_process, args=(tmp_path, project_id, 10)) for _ in range(3)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert len(FileTaskRepository(tmp_path).find_by_project(project_id)) == 30
+
+
+def test_one_inbox_for_repositories_sharing_a_directory(tmp_path):
+    threads = [threading.Thread(target=FileProjectRepository, args=(tmp_path,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    projects = FileProjectRepository(tmp_path).get_all()
+    assert [p.name for p in projects] == [Project.create_inbox().name]
+
+
+def test_sequence_does_not_need_positional_io(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "pread", raising=False)
+    monkeypatch.delattr(os, "pwrite", raising=False)
+    lock = StoreLock(tmp_path / "tasks.json")
+
+    for _ in range(10):
+        lock.bump()
+
+    assert lock.sequence() == 10
@@ -0,0 +1,49 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, Sequence, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(last_id: UUID) -> str:
+    """Opaque cursor pointing just past ``last_id`` in id order."""
+    return base64.urlsafe_b64encode(last_id.bytes).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> UUID:
+
+    try:
+        return UUID(bytes=base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, ValueError):
+        raise ValueError("Invalid page cursor")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    Listings are ordered by id, so the cursor only has to carry the last id
+    seen and the next query starts right after it, whatever the page depth.
+    ``next_cursor`` is None on the last page.
+    """
+
+    items: Sequence[T]
+    next_cursor: Optional[str] = None
+
+    @classmethod
+    def from_lookahead(cls, entities: Sequence[T], limit: int) -> "Page[T]":
+        """Build a page from a query that asked for ``limit + 1`` rows."""
+
+        if len(entities) > limit:
+            entities = entities[:limit]
+            return cls(items=entities, next_cursor=encode_cursor(entities[-1].id))
+        return cls(items=entities)
+
+    def map(self, fn: Callable[[T], U]) -> "Page[U]":
+        return Page(items=[fn(item) for item in self.items], next_cursor=self.next_cursor)
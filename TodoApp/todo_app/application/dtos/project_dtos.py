@@ -4,6 +4,7 @@ from typing import Optional, Sequence, Self
 from uuid import UUID
 
 from todo_app.domain.exceptions import BusinessRuleViolation
+from todo_app.application.common.pagination import MAX_PAGE_SIZE, Page, decode_cursor
 from todo_app.domain.value_objects import ProjectStatus, ProjectType
 from todo_app.application.dtos.task_dtos import TaskResponse
 from todo_app.domain.entities.project import Project
@@ -51,6 +52,30 @@ class CompleteProjectRequest:
             "completion_notes": self.completion_notes,
         } 
 
+@dataclass(frozen=True)
+class ListProjectsRequest:
+    """Listing parameters; without a limit every project is returned."""
+
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+
+    def __post_init__(self) -> None:
+
+        if self.limit is None:
+            if self.cursor:
+                raise ValueError("A page cursor requires a page size")
+            return
+        if not 1 <= self.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+        if self.cursor:
+            decode_cursor(self.cursor)
+
+    def to_execution_params(self) -> dict:
+        return {
+            "limit": self.limit,
+            "after": decode_cursor(self.cursor) if self.cursor else None,
+        }
+
 @dataclass(frozen=True)
 class ProjectResponse:
 
@@ -61,6 +86,10 @@ class ProjectResponse:
     project_type: ProjectType
     completion_date: Optional[datetime]
     tasks: Sequence[TaskResponse]
+    task_count: int = 0
+    completed_task_count: int = 0
+    # Set when ``tasks`` is only the first page of the project's tasks.
+    next_task_cursor: Optional[str] = None
 
     @classmethod
     def from_entity(cls, project: Project) -> Self:
@@ -72,6 +101,26 @@ class ProjectResponse:
             project_type=project.project_type,
             completion_date=project.completed_at if project.completed_at else None,
             tasks=[TaskResponse.from_entity(task) for task in project.tasks],           
+            task_count=project.task_count,
+            completed_task_count=project.completed_task_count,
+        )
+
+    @classmethod
+    def from_task_page(
+        cls, project: Project, tasks: Page[TaskResponse], task_count: int, completed_task_count: int
+    ) -> Self:
+        """A response holding one page of tasks, with the counts supplied rather than read off ``project.tasks``."""
+        return cls(
+            id=str(project.id),
+            name=project.name,
+            description=project.description,
+            status=project.status,
+            project_type=project.project_type,
+            completion_date=project.completed_at if project.completed_at else None,
+            tasks=tasks.items,
+            task_count=task_count,
+            completed_task_count=completed_task_count,
+            next_task_cursor=tasks.next_cursor,
         )
     
 @dataclass(frozen=True)
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Self
+from typing import Dict, Optional, Self
 from uuid import UUID
 from dateutil import tz
 from datetime import timezone
 
+from todo_app.application.common.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor
 from todo_app.domain.entities.task import Task
 from todo_app.domain.value_objects import Deadline, Priority, TaskStatus
 
@@ -79,6 +80,13 @@ class CreateTaskRequest:
         return params
 
 
+@dataclass(frozen=True)
+class RejectedRecord:
+    """Stands in for an import record that could not even be read, e.g. a malformed line."""
+
+    reason: str
+
+
 @dataclass(frozen=True)
 class TaskResponse:
 
@@ -108,6 +116,44 @@ class TaskResponse:
         )
 
 
+@dataclass(frozen=True)
+class EffectivePrioritiesResponse:
+    """How many active tasks were examined, and those whose deadline changes their priority.
+
+    ``adjusted`` maps task id to the effective priority, for tasks where it
+    differs from the priority the task was given.
+    """
+
+    examined: int
+    adjusted: Dict[UUID, Priority]
+
+
+@dataclass(frozen=True)
+class ListProjectTasksRequest:
+
+    project_id: str
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Optional[str] = None
+
+    def __post_init__(self) -> None:
+
+        try:
+            UUID(self.project_id)
+        except ValueError:
+            raise ValueError("Invalid project ID format")
+        if not 1 <= self.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"Page size must be between 1 and {MAX_PAGE_SIZE}")
+        if self.cursor:
+            decode_cursor(self.cursor)
+
+    def to_execution_params(self) -> dict:
+        return {
+            "project_id": UUID(self.project_id),
+            "limit": self.limit,
+            "after": decode_cursor(self.cursor) if self.cursor else None,
+        }
+
+
 @dataclass(frozen=True)
 class SetTaskPriorityRequest:
 
@@ -1,18 +1,50 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Optional, Sequence
 from uuid import UUID
 
 from todo_app.domain.entities.project import Project
+from todo_app.domain.exceptions import ProjectNotFoundError
 
 class ProjectRepository(ABC):
+    """Store of projects.
+
+    Backends keeping tasks apart are handed the task store through
+    ``set_task_repository(task_repo, lazy_tasks)``. With ``lazy_tasks`` a
+    fetched project defers reading its tasks until first use (see
+    ``Project.defer_tasks``). Saving a project saves its tasks too, except for
+    deferred tasks that were never loaded and so cannot have changed.
+    """
 
     @abstractmethod
     def get(self, project_id: UUID) -> Project:
         pass
 
+    @abstractmethod
+    def get_all(self) -> Sequence[Project]:
+        pass
+
+    def exists(self, project_id: UUID) -> bool:
+        """Whether the project is stored, without loading it or its tasks where the backend can avoid it."""
+        try:
+            self.get(project_id)
+        except ProjectNotFoundError:
+            return False
+        return True
+
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> Sequence[Project]:
+        """Up to ``limit`` projects in id order, starting after the ``after`` id."""
+        projects = sorted(self.get_all(), key=lambda project: project.id)
+        return [p for p in projects if after is None or p.id > after][:limit]
+
     @abstractmethod
     def save(self, project: Project) -> None:
         pass
 
+    def save_many(self, projects: Iterable[Project]) -> None:
+        """Persist several projects, and their loaded tasks, as one write where the backend can."""
+        for project in projects:
+            self.save(project)
+
     @abstractmethod
     def delete(self, project_id: UUID) -> None:
         pass
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Sequence
+from datetime import datetime
+from typing import Iterable, Iterator, Mapping, Optional, Sequence
 from uuid import UUID
 
 from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.domain.value_objects import TaskStatus
 
 class TaskRepository(ABC):
 
@@ -14,14 +17,68 @@ class TaskRepository(ABC):
     def save(self, task: Task) -> None:
         pass
 
+    def save_many(self, tasks: Iterable[Task]) -> None:
+        """Persist several tasks as one write; backends override the per-task fallback."""
+        for task in tasks:
+            self.save(task)
+
     @abstractmethod
     def delete(self, task_id: UUID) -> None:
         pass
 
+    def delete_many(self, task_ids: Iterable[UUID]) -> None:
+        """Remove several tasks as one write; backends override the per-task fallback."""
+        for task_id in task_ids:
+            self.delete(task_id)
+
+    def exists(self, task_id: UUID) -> bool:
+        """Whether the task is stored, without building it where the backend can avoid it."""
+        try:
+            self.get(task_id)
+        except TaskNotFoundError:
+            return False
+        return True
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+        """Number of a project's tasks, optionally only those with ``status``."""
+        return sum(
+            1 for task in self.iter_by_project(project_id) if status is None or task.status == status
+        )
+
     @abstractmethod
     def find_by_project(self, project_id: UUID) -> Sequence[Task]:
         pass
 
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+        """Up to ``limit`` of a project's tasks in id order, starting after the ``after`` id."""
+        tasks = sorted(self.find_by_project(project_id), key=lambda task: task.id)
+        return [t for t in tasks if after is None or t.id > after][:limit]
+
     @abstractmethod
     def get_active_tasks(self) -> Sequence[Task]:
-        pass
\ No newline at end of file
+        pass
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        """Yield a project's tasks one at a time instead of building the whole list."""
+        yield from self.find_by_project(project_id)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        """Yield active tasks one at a time; the default just wraps ``get_active_tasks``."""
+        yield from self.get_active_tasks()
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Mapping[UUID, Sequence[Task]]:
+        """Group the tasks of several projects in one call; every id gets an entry."""
+        return {project_id: self.find_by_project(project_id) for project_id in project_ids}
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+        """Active tasks due after ``start`` and no later than ``end``, earliest first."""
+        return sorted(
+            (
+                task
+                for task in self.iter_active_tasks()
+                if task.due_date and start < task.due_date.due_date <= end
+            ),
+            key=lambda task: task.due_date.due_date,
+        )
@@ -0,0 +1,136 @@
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.domain.entities.entity import Entity, Snapshot
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _save(repository, entities: List[Entity]) -> None:
+    # A lone entity goes through the plain save, which some backends keep cheaper.
+    if len(entities) == 1:
+        repository.save(entities[0])
+    else:
+        repository.save_many(entities)
+
+
+class UnitOfWork:
+    """Collects the changes of one use case and writes them in one batch per repository.
+
+    Register an entity before changing it. ``commit`` then saves every new and
+    dirty entity with one ``save_many`` per repository and applies the
+    deletions; ``rollback`` drops the pending changes and puts the registered
+    entities back as they were at registration. As a context manager it
+    commits when the block succeeds and rolls back when it raises.
+
+    Backends with transactions override ``transaction`` so the whole flush
+    is atomic. Without one, a flush that fails part-way is undone by saving
+    the restored entities again.
+    """
+
+    atomic = False
+
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        project_repository: Optional[ProjectRepository] = None,
+    ):
+        self.task_repository = task_repository
+        self.project_repository = project_repository
+        self._new: Dict[UUID, Entity] = {}
+        self._dirty: Dict[UUID, Entity] = {}
+        self._deleted: Dict[UUID, Entity] = {}
+        self._snapshots: Dict[UUID, Tuple[Entity, Snapshot]] = {}
+
+    def register_new(self, entity: Entity) -> None:
+        self._new[entity.id] = entity
+
+    def register_dirty(self, entity: Entity) -> None:
+        """Track ``entity`` for saving; call it before the first change."""
+        if entity.id not in self._new:
+            self._snapshots.setdefault(entity.id, (entity, entity.snapshot()))
+            self._dirty[entity.id] = entity
+
+    def register_deleted(self, entity: Entity) -> None:
+        if self._new.pop(entity.id, None) is None:
+            self._dirty.pop(entity.id, None)
+            self._deleted[entity.id] = entity
+
+    def transaction(self) -> ContextManager:
+        return nullcontext()
+
+    def commit(self) -> None:
+
+        try:
+            with self.transaction():
+                self._flush(list(self._new.values()), list(self._dirty.values()), list(self._deleted.values()))
+        except BaseException:
+            self.rollback(flushed=not self.atomic)
+            raise
+        self._clear()
+
+    def rollback(self, flushed: bool = False) -> None:
+        """Restore the registered entities; with ``flushed``, also undo a partial write."""
+
+        for entity, snapshot in self._snapshots.values():
+            entity.restore(snapshot)
+        if flushed:
+            try:
+                # Write back what was changed or deleted and remove what was added.
+                restored = list(self._dirty.values()) + list(self._deleted.values())
+                self._flush([], restored, list(self._new.values()))
+            except Exception:
+                logger.exception(
+                    "Failed to undo a partial unit of work",
+                    extra={"context": {"entities": len(restored) + len(self._new)}},
+                )
+        self._clear()
+
+    def _flush(self, new: List[Entity], dirty: List[Entity], deleted: List[Entity]) -> None:
+
+        saved = new + dirty
+        projects = [e for e in saved if isinstance(e, Project)]
+        # A saved project writes its loaded tasks too, so they are left to it.
+        cascaded = {task.id for project in projects if project.tasks_loaded for task in project.tasks}
+        tasks = [e for e in saved if isinstance(e, Task) and e.id not in cascaded]
+
+        if tasks:
+            _save(self.task_repository, tasks)
+        if deleted_tasks := [e.id for e in deleted if isinstance(e, Task)]:
+            self.task_repository.delete_many(deleted_tasks)
+        if projects:
+            _save(self._projects(), projects)
+        for project in (e for e in deleted if isinstance(e, Project)):
+            self._projects().delete(project.id)
+
+    def _projects(self) -> ProjectRepository:
+
+        if self.project_repository is None:
+            raise RuntimeError("This unit of work has no project repository")
+        return self.project_repository
+
+    def _clear(self) -> None:
+
+        self._new.clear()
+        self._dirty.clear()
+        self._deleted.clear()
+        self._snapshots.clear()
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+
+UnitOfWorkFactory = Callable[[TaskRepository, Optional[ProjectRepository]], UnitOfWork]
@@ -4,6 +4,7 @@ from datetime import timedelta
 from todo_app.application.common.result import Result, Error
 from todo_app.application.service_ports.notifications import NotificationPort
 from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.domain import clock
 from todo_app.domain.exceptions import TaskNotFoundError, ValidationError, BusinessRuleViolation
 
 import logging
@@ -24,12 +25,13 @@ class CheckDeadlinesUseCase:
                 extra={"context": {"warning_threshold_days": self.warning_threshold.days}},
             )
 
-            tasks = self.task_repository.get_active_tasks()
-            notifications_sent = 0
+            # One instant for the whole sweep, also seen by anything the notifier evaluates.
+            with clock.frozen_now() as now:
+                tasks = self.task_repository.find_due_between(now, now + self.warning_threshold)
+                notifications_sent = 0
 
-            for task in tasks:
-                if task.due_date and task.due_date.is_approaching(self.warning_threshold):
-                    remaining_days = int(task.due_date.time_remaining().total_seconds() / (24*3600))
+                for task in tasks:
+                    remaining_days = int((task.due_date.due_date - now).total_seconds() / (24*3600))
                     logger.info(
                         "Task deadline approaching",
                         extra={
@@ -1,13 +1,16 @@
-from copy import deepcopy
 from dataclasses import dataclass
+from typing import Optional
 from uuid import UUID
 
-from todo_app.domain.value_objects import ProjectType
+from todo_app.domain.value_objects import ProjectType, TaskStatus
+from todo_app.application.common.pagination import DEFAULT_PAGE_SIZE, Page
 from todo_app.application.common.result import Result, Error
-from todo_app.application.dtos.project_dtos import CreateProjectRequest, ProjectResponse, CompleteProjectRequest, CompleteProjectResponse, UpdateProjectRequest
+from todo_app.application.dtos.project_dtos import CreateProjectRequest, ListProjectsRequest, ProjectResponse, CompleteProjectRequest, CompleteProjectResponse, UpdateProjectRequest
+from todo_app.application.dtos.task_dtos import TaskResponse
 from todo_app.application.service_ports.notifications import NotificationPort
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from todo_app.domain.entities.project import Project
 from todo_app.domain.exceptions import ValidationError, BusinessRuleViolation, ProjectNotFoundError
 
@@ -50,6 +53,7 @@ class CompleteProjectUseCase:
     project_repository: ProjectRepository
     task_repository: TaskRepository
     notification_service: NotificationPort
+    unit_of_work: UnitOfWorkFactory = UnitOfWork
 
     def execute(self, request: CompleteProjectRequest) -> Result:
         try:
@@ -57,18 +61,18 @@ class CompleteProjectUseCase:
             logger.info("Completing project", extra={"context": {"project_id": str(params["project_id"])}})
             project = self.project_repository.get(params["project_id"])
 
-            project_snapshot = deepcopy(project)
-            task_snapshots = {task.id: deepcopy(task) for task in project.incomplete_tasks}
+            incomplete_tasks = project.incomplete_tasks
 
             try:
-                for task in project.incomplete_tasks:
-                    task.complete()
-                    self.task_repository.save(task)
-
-                project.mark_completed(notes=params["completion_notes"],)
-                self.project_repository.save(project)
+                # The project and its tasks are written together when the block ends.
+                with self.unit_of_work(self.task_repository, self.project_repository) as uow:
+                    uow.register_dirty(project)
+                    for task in incomplete_tasks:
+                        uow.register_dirty(task)
+                        task.complete()
+                    project.mark_completed(notes=params["completion_notes"],)
                 
-                for task in project_snapshot.incomplete_tasks:
+                for task in incomplete_tasks:
                     self.notification_service.notify_task_completed(task)
                
                 logger.info(
@@ -76,7 +80,7 @@ class CompleteProjectUseCase:
                     extra={
                         "context": {
                             "project_id": str(project.id),
-                            "tasks_completed": len(project_snapshot.incomplete_tasks),
+                            "tasks_completed": len(incomplete_tasks),
                         }
                     },
                 )
@@ -87,10 +91,6 @@ class CompleteProjectUseCase:
                     "Failed to complete project",
                     extra={"context": {"project_id": str(project.id), "error": str(e)}},
                 )
-
-                for task_id, task_snapshot in task_snapshots.items():
-                    self.task_repository.save(task_snapshot)
-                self.project_repository.save(project_snapshot)
                 raise
 
         except ProjectNotFoundError:
@@ -123,19 +123,41 @@ class GetProjectUseCase:
 
 @dataclass
 class ListProjectsUseCase:
+    """List projects; with a task repository, a page of projects carries only the first page of each one's tasks."""
+
     project_repository: ProjectRepository
+    task_repository: Optional[TaskRepository] = None
 
-    def execute(self) -> Result[list[ProjectResponse]]:
+    def execute(self, request: Optional[ListProjectsRequest] = None) -> Result[Page[ProjectResponse]]:
 
         try:
-            logger.info("Retrieving all projects")
-            projects = self.project_repository.get_all()
-            logger.info("Projects retrieved successfully", extra={"context": {"count": len(projects)}})
-            return Result.success([ProjectResponse.from_entity(p) for p in projects])
+            params = (request or ListProjectsRequest()).to_execution_params()
+            limit = params["limit"]
+            logger.info("Retrieving projects", extra={"context": {"limit": limit}})
+            if limit is None:
+                page = Page(items=self.project_repository.get_all())
+            else:
+                # One extra row tells whether another page follows.
+                projects = self.project_repository.get_page(limit + 1, params["after"])
+                page = Page.from_lookahead(projects, limit)
+            logger.info("Projects retrieved successfully", extra={"context": {"count": len(page.items)}})
+            if limit is not None and self.task_repository is not None:
+                return Result.success(page.map(self._with_first_task_page))
+            return Result.success(page.map(ProjectResponse.from_entity))
         except Exception as e:
             logger.error("Failed to retrieve projects", extra={"context": {"error": str(e)}})
             return Result.failure(Error.business_rule_violation(str(e)))
 
+    def _with_first_task_page(self, project: Project) -> ProjectResponse:
+
+        tasks = self.task_repository.find_by_project_page(project.id, DEFAULT_PAGE_SIZE + 1)
+        return ProjectResponse.from_task_page(
+            project,
+            Page.from_lookahead(tasks, DEFAULT_PAGE_SIZE).map(TaskResponse.from_entity),
+            task_count=self.task_repository.count_by_project(project.id),
+            completed_task_count=self.task_repository.count_by_project(project.id, TaskStatus.DONE),
+        )
+
 
 @dataclass
 class UpdateProjectUseCase:
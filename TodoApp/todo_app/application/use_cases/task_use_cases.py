@@ -1,15 +1,20 @@
-from copy import deepcopy
 from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 from uuid import UUID
 
 from todo_app.application.dtos.operations import DeletionOutcome
+from todo_app.application.common.pagination import Page
 from todo_app.application.common.result import Result, Error
-from todo_app.application.dtos.task_dtos import CompleteTaskRequest,CreateTaskRequest,TaskResponse,SetTaskPriorityRequest, UpdateTaskRequest
+from todo_app.application.dtos.task_dtos import CompleteTaskRequest,CreateTaskRequest,EffectivePrioritiesResponse,ListProjectTasksRequest,RejectedRecord,TaskResponse,SetTaskPriorityRequest, UpdateTaskRequest
 from todo_app.application.service_ports.notifications import NotificationPort
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.unit_of_work import UnitOfWork, UnitOfWorkFactory
+from todo_app.domain import clock
 from todo_app.domain.entities.task import Task
-from todo_app.domain.exceptions import TaskNotFoundError, ProjectNotFoundError, ValidationError, BusinessRuleViolation
+from todo_app.domain.exceptions import TaskNotFoundError, ValidationError, BusinessRuleViolation
+from todo_app.domain.services.task_priority_calculator import TaskPriorityCalculator
 from todo_app.domain.value_objects import Priority
 
 import logging
@@ -21,6 +26,7 @@ class CompleteTaskUseCase:
     
     task_repository: TaskRepository
     notification_service: NotificationPort
+    unit_of_work: UnitOfWorkFactory = UnitOfWork
     
     def execute(self, request: CompleteTaskRequest) -> Result:
 
@@ -29,11 +35,10 @@ class CompleteTaskUseCase:
             logger.info("Completing task", extra={"context": {"task_id": str(params["task_id"])}})
             task = self.task_repository.get(params["task_id"])
 
-            task_snapshot = deepcopy(task)
-
             try: 
-                task.complete(notes=params["completion_notes"])
-                self.task_repository.save(task)
+                with self.unit_of_work(self.task_repository, None) as uow:
+                    uow.register_dirty(task)
+                    task.complete(notes=params["completion_notes"])
                 self.notification_service.notify_task_completed(task)
 
                 logger.info(
@@ -53,7 +58,6 @@ class CompleteTaskUseCase:
                     "Failed to complete task",
                     extra={"context": {"task_id": str(task.id), "error": str(e)}},
                 )
-                self.task_repository.save(task_snapshot)
                 raise
         
         except TaskNotFoundError:
@@ -82,14 +86,11 @@ class CreateTaskUseCase:
             
             if not project_id:
                 project_id = self.project_repository.get_inbox().id
-            else:
-                try:
-                    self.project_repository.get(project_id)  # Verify exists
-                except ProjectNotFoundError:
-                    logger.error(
-                        "Project not found", extra={"context": {"project_id": str(project_id)}}
-                    )
-                    return Result.failure(Error.not_found("Project", str(project_id)))
+            elif not self.project_repository.exists(project_id):
+                logger.error(
+                    "Project not found", extra={"context": {"project_id": str(project_id)}}
+                )
+                return Result.failure(Error.not_found("Project", str(project_id)))
 
             task = Task(
                 title=params["title"],
@@ -162,11 +163,35 @@ class GetTaskUseCase:
             return Result.failure(Error.not_found("Task", str(task_id)))
 
 
+@dataclass
+class ListProjectTasksUseCase:
+
+    task_repository: TaskRepository
+
+    def execute(self, request: ListProjectTasksRequest) -> Result[Page[TaskResponse]]:
+
+        try:
+            params = request.to_execution_params()
+            logger.info(
+                "Retrieving project tasks",
+                extra={"context": {"project_id": str(params["project_id"]), "limit": params["limit"]}},
+            )
+            tasks = self.task_repository.find_by_project_page(
+                params["project_id"], params["limit"] + 1, params["after"]
+            )
+            page = Page.from_lookahead(tasks, params["limit"])
+            return Result.success(page.map(TaskResponse.from_entity))
+        except Exception as e:
+            logger.error("Failed to retrieve project tasks", extra={"context": {"error": str(e)}})
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+
 @dataclass
 class UpdateTaskUseCase:
 
     task_repository: TaskRepository
     notification_service: NotificationPort
+    unit_of_work: UnitOfWorkFactory = UnitOfWork
 
     def execute(self, request: UpdateTaskRequest) -> Result[TaskResponse]:
         try:
@@ -174,19 +199,18 @@ class UpdateTaskUseCase:
             logger.info("Updating task", extra={"context": {"task_id": str(params["task_id"])}})
             task = self.task_repository.get(params["task_id"])
 
-            task_snapshot = deepcopy(task)
-
             try:
-                if "title" in params:
-                    task.update_title(params["title"])
-                if "description" in params:
-                    task.update_description(params["description"])
-                if "priority" in params:
-                    task.update_priority(Priority(params["priority"]))
-                if "due_date" in params:
-                    task.update_due_date(params["due_date"])
-
-                self.task_repository.save(task)
+                with self.unit_of_work(self.task_repository, None) as uow:
+                    uow.register_dirty(task)
+                    if "title" in params:
+                        task.update_title(params["title"])
+                    if "description" in params:
+                        task.update_description(params["description"])
+                    if "priority" in params:
+                        task.update_priority(Priority(params["priority"]))
+                    if "due_date" in params:
+                        task.update_due_date(params["due_date"])
+
                 logger.info(
                     "Task updated successfully",
                     extra={
@@ -203,7 +227,6 @@ class UpdateTaskUseCase:
                     "Failed to update task",
                     extra={"context": {"task_id": str(task.id), "error": str(e)}},
                 )
-                self.task_repository.save(task_snapshot)
                 raise
 
         except TaskNotFoundError:
@@ -224,10 +247,142 @@ class DeleteTaskUseCase:
 
         try:
             logger.info("Deleting task", extra={"context": {"task_id": str(task_id)}})
-            self.task_repository.get(task_id)
+            if not self.task_repository.exists(task_id):
+                raise TaskNotFoundError(task_id)
             self.task_repository.delete(task_id)
             logger.info("Task deleted successfully", extra={"context": {"task_id": str(task_id)}})
             return Result.success(DeletionOutcome(task_id))
         except TaskNotFoundError:
             logger.error("Task not found", extra={"context": {"task_id": str(task_id)}})
-            return Result.failure(Error.not_found("Task", str(task_id)))
\ No newline at end of file
+            return Result.failure(Error.not_found("Task", str(task_id)))
+
+
+@dataclass
+class RecomputePrioritiesUseCase:
+    """Rank every active task by its effective priority, without saving anything.
+
+    The effective priority is derived from the priority the user chose and the
+    deadline, so it is returned rather than written over ``Task.priority``.
+    """
+
+    task_repository: TaskRepository
+
+    def execute(self) -> Result[EffectivePrioritiesResponse]:
+
+        try:
+            with clock.frozen_now() as now:
+                tasks = list(self.task_repository.iter_active_tasks())
+                priorities = TaskPriorityCalculator.calculate_priorities(tasks, now)
+        except ValidationError as e:
+            logger.error("Priority recompute validation error", extra={"context": {"error": str(e)}})
+            return Result.failure(Error.validation_error(str(e)))
+        except BusinessRuleViolation as e:
+            logger.error(
+                "Priority recompute business rule violation", extra={"context": {"error": str(e)}}
+            )
+            return Result.failure(Error.business_rule_violation(str(e)))
+
+        adjusted = {
+            task.id: priority
+            for task, priority in zip(tasks, priorities)
+            if priority != task.priority
+        }
+        logger.info(
+            "Task priorities recomputed",
+            extra={"context": {"examined": len(tasks), "adjusted": len(adjusted)}},
+        )
+        return Result.success(EffectivePrioritiesResponse(examined=len(tasks), adjusted=adjusted))
+
+
+@dataclass
+class ImportTasksUseCase:
+    """Create tasks from a stream of records, saving them ``chunk_size`` at a time.
+
+    Each record maps ``CreateTaskRequest`` field names to values and is
+    validated by it; a reader that cannot parse a record passes a
+    ``RejectedRecord`` in its place. A record that fails is counted and
+    skipped, with the first ``max_reported_errors`` reasons kept by its
+    1-based position.
+    """
+
+    task_repository: TaskRepository
+    project_repository: ProjectRepository
+    chunk_size: int = 50_000
+    max_reported_errors: int = 100
+
+    def execute(self, records: Iterable[Union[Mapping[str, Any], RejectedRecord]]) -> Result:
+
+        started = perf_counter()
+        known_projects: Dict[UUID, bool] = {}
+        inbox_id: Optional[UUID] = None
+        chunk: List[Task] = []
+        errors: List[Dict[str, Any]] = []
+        imported = rejected = 0
+
+        # One instant for every deadline check in the batch.
+        with clock.frozen_now():
+            for position, record in enumerate(records, start=1):
+                try:
+                    if isinstance(record, RejectedRecord):
+                        raise ValueError(record.reason)
+                    request = CreateTaskRequest(
+                        title=_text(record, "title") or "",
+                        description=_text(record, "description") or "",
+                        due_date=_text(record, "due_date"),
+                        priority=_text(record, "priority"),
+                        project_id=_text(record, "project_id"),
+                    )
+                    params = request.to_execution_params()
+                    if (project_id := params.get("project_id")) is None:
+                        if inbox_id is None:
+                            inbox_id = self.project_repository.get_inbox().id
+                        project_id = inbox_id
+                    else:
+                        if project_id not in known_projects:
+                            known_projects[project_id] = self.project_repository.exists(project_id)
+                        if not known_projects[project_id]:
+                            raise ValueError(f"Project {project_id} not found")
+                except KeyError:
+                    reason = f"Invalid priority: {request.priority}"
+                except ValueError as e:
+                    reason = str(e)
+                else:
+                    chunk.append(
+                        Task(
+                            title=params["title"],
+                            description=params["description"],
+                            project_id=project_id,
+                            due_date=params.get("deadline"),
+                            priority=params.get("priority", Priority.MEDIUM),
+                        )
+                    )
+                    if len(chunk) >= self.chunk_size:
+                        self.task_repository.save_many(chunk)
+                        imported += len(chunk)
+                        chunk = []
+                    continue
+
+                rejected += 1
+                if len(errors) < self.max_reported_errors:
+                    errors.append({"record": position, "error": reason})
+
+        if chunk:
+            self.task_repository.save_many(chunk)
+            imported += len(chunk)
+
+        seconds = perf_counter() - started
+        summary = {
+            "imported": imported,
+            "rejected": rejected,
+            "seconds": seconds,
+            "tasks_per_second": imported / seconds if seconds else 0.0,
+        }
+        logger.info("Tasks imported", extra={"context": summary})
+        return Result.success({**summary, "errors": errors})
+
+
+def _text(record: Mapping[str, Any], name: str) -> Optional[str]:
+    """The field as text, or None when it is absent or empty (CSV cells are never None)."""
+
+    value = record.get(name)
+    return None if value is None or value == "" else str(value)
@@ -0,0 +1,63 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+
+class Clock(ABC):
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """The current instant, timezone-aware UTC."""
+        pass
+
+
+class SystemClock(Clock):
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+
+class FixedClock(Clock):
+
+    def __init__(self, instant: datetime):
+        if not instant.tzinfo:
+            raise ValueError("Clock instant must be timezone-aware")
+        self._instant = instant
+
+    def now(self) -> datetime:
+        return self._instant
+
+
+_clock: ContextVar[Clock] = ContextVar("clock", default=SystemClock())
+
+
+def now() -> datetime:
+    """The instant the domain and presenters should use for "now"."""
+    return _clock.get().now()
+
+
+def use_clock(clock: Clock) -> Token:
+    """Make ``clock`` the current clock for this context; undo with ``reset_clock``."""
+    return _clock.set(clock)
+
+
+def freeze_now(instant: Optional[datetime] = None) -> Token:
+    """Pin "now" for the rest of this context (a request, a sweep) to one clock read."""
+    return _clock.set(FixedClock(instant or now()))
+
+
+def reset_clock(token: Token) -> None:
+    _clock.reset(token)
+
+
+@contextmanager
+def frozen_now(instant: Optional[datetime] = None) -> Iterator[datetime]:
+    """Evaluate a batch against a single instant; nested uses keep the outer one."""
+
+    token = freeze_now(instant)
+    try:
+        yield now()
+    finally:
+        reset_clock(token)
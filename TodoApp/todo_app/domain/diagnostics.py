@@ -0,0 +1,52 @@
+import logging
+import random
+from typing import Any, Callable, Dict, Optional
+
+Context = Callable[[], Dict[str, Any]]
+
+# Event message -> fraction of occurrences to emit, overriding the call site's rate.
+_sample_rates: Dict[str, float] = {}
+
+
+def set_sample_rate(event: str, rate: float) -> None:
+    """Emit only ``rate`` (0..1) of the occurrences of ``event``; 1 restores every one."""
+
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError("Sample rate must be between 0 and 1")
+    if rate == 1.0:
+        _sample_rates.pop(event, None)
+    else:
+        _sample_rates[event] = rate
+
+
+class DomainLogger:
+    """Structured events for hot domain paths.
+
+    The context is passed as a callable and only built once the event is
+    known to be emitted: its level is enabled and it survives sampling. A
+    disabled event therefore costs one level check.
+    """
+
+    __slots__ = ("_logger",)
+
+    def __init__(self, name: str):
+        self._logger = logging.getLogger(name)
+
+    def _emit(self, level: int, message: str, context: Optional[Context], sample_rate: float) -> None:
+
+        if not self._logger.isEnabledFor(level):
+            return
+        rate = _sample_rates.get(message, sample_rate)
+        if rate < 1.0 and random.random() >= rate:
+            return
+        # stacklevel 3 attributes the record to the entity, not to this module.
+        self._logger.log(level, message, extra={"context": context() if context else {}}, stacklevel=3)
+
+    def debug(self, message: str, context: Optional[Context] = None, sample_rate: float = 1.0) -> None:
+        self._emit(logging.DEBUG, message, context, sample_rate)
+
+    def info(self, message: str, context: Optional[Context] = None, sample_rate: float = 1.0) -> None:
+        self._emit(logging.INFO, message, context, sample_rate)
+
+    def warning(self, message: str, context: Optional[Context] = None, sample_rate: float = 1.0) -> None:
+        self._emit(logging.WARNING, message, context, sample_rate)
@@ -1,8 +1,17 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Tuple
 from uuid import UUID, uuid4
 
-@dataclass
+Snapshot = Tuple[Any, ...]
+
+# Entity class -> its dataclass field names, resolved once per class.
+_fields_by_class: Dict[type, Tuple[str, ...]] = {}
+
+
+@dataclass(slots=True)
 class Entity:
+    """Identity by id. Subclasses are slotted too and pass ``eq=False`` so they keep these semantics."""
+
     id: UUID = field(default_factory=uuid4, init=False)
 
     def __eq__(self, other: object) -> bool:
@@ -11,4 +20,27 @@ class Entity:
         return self.id == other.id
     
     def __hash__(self) -> int:
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
+
+    def _field_names(self) -> Tuple[str, ...]:
+        cls = type(self)
+        if (names := _fields_by_class.get(cls)) is None:
+            names = _fields_by_class[cls] = tuple(f.name for f in fields(cls))
+        return names
+
+    def snapshot(self) -> Snapshot:
+        """The current field values, for undoing in-place changes with ``restore``.
+
+        Values are held by reference; only dicts and lists are copied, one level
+        deep. Entities inside them are not captured and need their own snapshot.
+        """
+        return tuple(
+            value.copy() if isinstance(value, (dict, list)) else value
+            for value in (getattr(self, name) for name in self._field_names())
+        )
+
+    def restore(self, snapshot: Snapshot) -> None:
+        """Put back the field values recorded by ``snapshot``, touching only those that changed."""
+        for name, value in zip(self._field_names(), snapshot):
+            if getattr(self, name) is not value:
+                setattr(self, name, value)
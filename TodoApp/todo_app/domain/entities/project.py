@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Optional
 from uuid import UUID
 
+from todo_app.domain.diagnostics import DomainLogger
 from todo_app.domain.entities.entity import Entity
 from todo_app.domain.entities.task import Task
 from todo_app.domain.exceptions import BusinessRuleViolation
@@ -11,8 +12,9 @@ from todo_app.domain.value_objects import ProjectType, TaskStatus,  ProjectStatu
 import logging
 
 logger = logging.getLogger(__name__)
+events = DomainLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Project(Entity):
 
     INBOX_NAME = "INBOX"
@@ -24,6 +26,11 @@ class Project(Entity):
     completed_at: Optional[datetime] = field(default=None, init=False)
     completion_notes: Optional[str] = field(default=None, init=False)
     _tasks: dict[UUID, Task] = field(default_factory=dict, init=False)
+    # The not-done subset of _tasks, kept current as tasks join or change status.
+    _incomplete: dict[UUID, Task] = field(default_factory=dict, init=False, repr=False)
+    _task_loader: Optional[Callable[[], Iterable[Task]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def create_inbox(cls) -> "Project":
@@ -34,7 +41,47 @@ class Project(Entity):
             project_type=ProjectType.INBOX,
         )
 
+    def defer_tasks(self, loader: Callable[[], Iterable[Task]]) -> None:
+        """Fetch the tasks from ``loader`` the first time they are needed rather than now."""
+        self._tasks.clear()
+        self._incomplete.clear()
+        self._task_loader = loader
+
+    def attach_tasks(self, tasks: Iterable[Task]) -> None:
+        """Replace the tasks with ``tasks`` as read from storage, without the checks of ``add_task``."""
+        self._tasks.clear()
+        self._incomplete.clear()
+        self._task_loader = None
+        for task in tasks:
+            self._track(task)
+
+    def _track(self, task: Task) -> None:
+        self._tasks[task.id] = task
+        task._status_observer = self._task_status_changed
+        self._task_status_changed(task)
+
+    def _task_status_changed(self, task: Task) -> None:
+        # Copies of a task carry the observer too; only the instance held here counts.
+        if self._tasks.get(task.id) is not task:
+            return
+        if task.status == TaskStatus.DONE:
+            self._incomplete.pop(task.id, None)
+        else:
+            self._incomplete[task.id] = task
+
+    @property
+    def tasks_loaded(self) -> bool:
+        return self._task_loader is None
+
+    def _ensure_tasks(self) -> None:
+        if self._task_loader is not None:
+            loader, self._task_loader = self._task_loader, None
+            for task in loader():
+                if task.id not in self._tasks:
+                    self._track(task)
+
     def add_task(self, task: Task) -> None:
+        self._ensure_tasks()
         if self.status == ProjectStatus.COMPLETED:
             logger.error(
                 "Attempted to add task to completed project",
@@ -58,54 +105,65 @@ class Project(Entity):
                 }
             },
         )
-        self._tasks[task.id] = task
         task.project_id = self.id
+        self._track(task)
 
     def get_task(self, task_id: UUID) -> Optional[Task]:
         
+        self._ensure_tasks()
         task = self._tasks.get(task_id)
         if task is None:
-            logger.warning(
+            events.warning(
                 "Task not found in project",
-                extra={
-                    "context": {
-                        "project_id": str(self.id),
-                        "project_name": self.name,
-                        "task_id": str(task_id),
-                    }
+                lambda: {
+                    "project_id": str(self.id),
+                    "project_name": self.name,
+                    "task_id": str(task_id),
                 },
             )
         return task
 
     @property
     def tasks(self) -> list[Task]:
-        logger.debug(
+        self._ensure_tasks()
+        events.debug(
             "Retrieving all tasks from project",
-            extra={
-                "context": {
-                    "project_id": str(self.id),
-                    "project_name": self.name,
-                    "task_count": len(self._tasks),
-                }
+            lambda: {
+                "project_id": str(self.id),
+                "project_name": self.name,
+                "task_count": len(self._tasks),
             },
         )
         return list(self._tasks.values())
 
     @property
     def incomplete_tasks(self) -> list[Task]:
-        incomplete = [task for task in self.tasks if task.status != TaskStatus.DONE]
-        logger.debug(
+        self._ensure_tasks()
+        events.debug(
             "Retrieving incomplete tasks from project",
-            extra={
-                "context": {
-                    "project_id": str(self.id),
-                    "project_name": self.name,
-                    "incomplete_count": len(incomplete),
-                    "total_count": len(self._tasks),
-                }
+            lambda: {
+                "project_id": str(self.id),
+                "project_name": self.name,
+                "incomplete_count": len(self._incomplete),
+                "total_count": len(self._tasks),
             },
         )
-        return incomplete
+        return list(self._incomplete.values())
+
+    @property
+    def task_count(self) -> int:
+        self._ensure_tasks()
+        return len(self._tasks)
+
+    @property
+    def incomplete_task_count(self) -> int:
+        self._ensure_tasks()
+        return len(self._incomplete)
+
+    @property
+    def completed_task_count(self) -> int:
+        self._ensure_tasks()
+        return len(self._tasks) - len(self._incomplete)
 
     def mark_completed(self, notes: Optional[str] = None) -> None:
 
@@ -126,7 +184,7 @@ class Project(Entity):
                 "context": {
                     "project_id": str(self.id),
                     "project_name": self.name,
-                    "incomplete_tasks": len(self.incomplete_tasks),
+                    "incomplete_tasks": self.incomplete_task_count,
                 }
             },
         )
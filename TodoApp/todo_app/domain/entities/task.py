@@ -1,17 +1,19 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
 from uuid import UUID
 
-from todo_app.domain.entities.entity import Entity
+from todo_app.domain.diagnostics import DomainLogger
+from todo_app.domain.entities.entity import Entity, Snapshot
 from todo_app.domain.value_objects import Deadline, Priority, TaskStatus
 
 import logging
 
 logger = logging.getLogger(__name__)
+events = DomainLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task(Entity):
 
     title: str
@@ -22,6 +24,21 @@ class Task(Entity):
     status: TaskStatus = field(default=TaskStatus.TODO, init=False)
     completed_at: Optional[datetime] = field(default=None, init=False)
     completion_notes: Optional[str] = field(default=None, init=False)
+    # Set by the owning project so it can keep its counts current.
+    _status_observer: Optional[Callable[["Task"], None]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _set_status(self, status: TaskStatus) -> None:
+        self.status = status
+        if self._status_observer is not None:
+            self._status_observer(self)
+
+    def restore(self, snapshot: Snapshot) -> None:
+        status = self.status
+        Entity.restore(self, snapshot)
+        if self.status != status and self._status_observer is not None:
+            self._status_observer(self)
 
     def start(self) -> None:
         if self.status != TaskStatus.TODO:
@@ -47,7 +64,7 @@ class Task(Entity):
                 }
             },
         )
-        self.status = TaskStatus.IN_PROGRESS
+        self._set_status(TaskStatus.IN_PROGRESS)
 
     def complete(self, notes: Optional[str] = None) -> None:
 
@@ -75,23 +92,21 @@ class Task(Entity):
                 }
             },
         )
-        self.status = TaskStatus.DONE
+        self._set_status(TaskStatus.DONE)
         self.completed_at = datetime.now()
         self.completion_notes = notes
 
-    def is_overdue(self) -> bool:
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
  
-        is_overdue = self.due_date is not None and self.due_date.is_overdue()
+        is_overdue = self.due_date is not None and self.due_date.is_overdue(now)
         if is_overdue:
-            logger.warning(
+            events.warning(
                 "Task is overdue",
-                extra={
-                    "context": {
-                        "task_id": str(self.id),
-                        "task_title": self.title,
-                        "due_date": str(self.due_date),
-                        "days_overdue": self.due_date.days_overdue(),
-                    }
+                lambda: {
+                    "task_id": str(self.id),
+                    "task_title": self.title,
+                    "due_date": str(self.due_date),
+                    "days_overdue": self.due_date.days_overdue(),
                 },
             )
         return is_overdue
\ No newline at end of file
@@ -1,18 +1,59 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from math import isnan, nan
+from typing import Iterable, List, Optional, Sequence
 
+from todo_app.domain import clock
 from todo_app.domain.entities.task import Task
 from todo_app.domain.value_objects import Priority
 
+URGENT_WINDOW = timedelta(hours=12)
+SOON_WINDOW = timedelta(days=2)
+
 
 class TaskPriorityCalculator:
     @staticmethod
     def calculate_priority(task: Task) -> Priority:
         if task.due_date is None:
             return task.priority
-        
-        if task.is_overdue() or task.due_date.time_remaining() <= timedelta(hours=12):
+        now = clock.now()
+        if task.is_overdue(now) or task.due_date.time_remaining(now) <= URGENT_WINDOW:
             return Priority.HIGH
-        elif task.due_date and task.due_date.time_remaining() <= timedelta(days=2):
+        elif task.due_date and task.due_date.time_remaining(now) <= SOON_WINDOW:
             return Priority.MEDIUM
         else:
-            return Priority.LOW
\ No newline at end of file
+            return Priority.LOW
+
+    @staticmethod
+    def calculate_priorities(tasks: Iterable[Task], now: Optional[datetime] = None) -> List[Priority]:
+        """``calculate_priority`` for many tasks at once, all against the same instant."""
+
+        due_timestamps = []
+        base_priorities = []
+        for task in tasks:
+            due_timestamps.append(task.due_date.due_date.timestamp() if task.due_date else nan)
+            base_priorities.append(task.priority)
+        return TaskPriorityCalculator.calculate_from_columns(due_timestamps, base_priorities, now)
+
+    @staticmethod
+    def calculate_from_columns(
+        due_timestamps: Sequence[float],
+        base_priorities: Sequence[Priority],
+        now: Optional[datetime] = None,
+    ) -> List[Priority]:
+        """Effective priorities from parallel columns of POSIX due times and base priorities.
+
+        A task without a due date has NaN as its timestamp and keeps its base
+        priority. Both windows are turned into cut-off timestamps once, so each
+        task costs two float comparisons instead of two ``time_remaining`` calls.
+        """
+
+        if len(due_timestamps) != len(base_priorities):
+            raise ValueError("Column lengths differ")
+        now_ts = (now or clock.now()).timestamp()
+        urgent_until = now_ts + URGENT_WINDOW.total_seconds()
+        soon_until = now_ts + SOON_WINDOW.total_seconds()
+        high, medium, low = Priority.HIGH, Priority.MEDIUM, Priority.LOW
+        return [
+            base if isnan(due) else high if due <= urgent_until else medium if due <= soon_until else low
+            for due, base in zip(due_timestamps, base_priorities)
+        ]
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from enum import Enum
+from typing import Optional
+
+from todo_app.domain import clock
 
 class TaskStatus(Enum):
     TODO = "TODO"
@@ -20,24 +23,34 @@ class Priority(Enum):
     MEDIUM = 2
     HIGH = 3
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Deadline:
     due_date: datetime
 
     def __post_init__(self):
         if not self.due_date.tzinfo:
             raise ValueError("Deadline must use timezone-aware datetime")
-        if self.due_date < datetime.now(timezone.utc):
+        if self.due_date < clock.now():
             raise ValueError("Deadline cannot be in the past")
 
-    def is_overdue(self) -> bool:
-        return datetime.now(timezone.utc) > self.due_date
+    @classmethod
+    def rehydrate(cls, due_date: datetime) -> "Deadline":
+        """A deadline read back from storage, which may have passed since it was set."""
+        if not due_date.tzinfo:
+            raise ValueError("Deadline must use timezone-aware datetime")
+        deadline = object.__new__(cls)
+        object.__setattr__(deadline, "due_date", due_date)
+        return deadline
+
+    def is_overdue(self, now: Optional[datetime] = None) -> bool:
+        return (now or clock.now()) > self.due_date
 
-    def time_remaining(self) -> timedelta:
-        return max(timedelta(0), self.due_date - datetime.now(timezone.utc))
+    def time_remaining(self, now: Optional[datetime] = None) -> timedelta:
+        return max(timedelta(0), self.due_date - (now or clock.now()))
 
     def is_approaching(
         self,
-        warning_threshold: timedelta = timedelta(days=1)
+        warning_threshold: timedelta = timedelta(days=1),
+        now: Optional[datetime] = None,
     ) -> bool:
-        return timedelta(0) < self.time_remaining() <= warning_threshold
\ No newline at end of file
+        return timedelta(0) < self.time_remaining(now) <= warning_threshold
\ No newline at end of file
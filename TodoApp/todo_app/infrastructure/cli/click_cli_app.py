@@ -1,11 +1,17 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional
 import click
+import logging
 
 from todo_app.interfaces.view_models.task_vm import TaskViewModel
 from todo_app.interfaces.view_models.project_vm import ProjectViewModel
 from todo_app.infrastructure.configuration.container import Application
+from todo_app.infrastructure.persistence.identity_map import identity_map_scope
+from todo_app.domain import clock
 from todo_app.domain.value_objects import Priority
 
+logger = logging.getLogger(__name__)
+
 class ClickCli:
 
     def __init__(self, app: Application):
@@ -17,12 +23,24 @@ class ClickCli:
 
         try:
             while True:
-                self._display_projects()
+                with clock.frozen_now(), self._command("project list"):
+                    self._display_projects()
                 self._handle_selection()
         except KeyboardInterrupt:
             click.echo("\nGoodbye!", err=True)
             return 0
         
+    @contextmanager
+    def _command(self, name: str) -> Iterator[None]:
+        """One screen of the CLI: entities loaded by id are reused until it is done."""
+
+        with identity_map_scope() as identity_map:
+            yield
+        logger.debug(
+            "Identity map statistics",
+            extra={"context": {"command": name, **identity_map.stats()}},
+        )
+
     def _display_projects(self) -> None:
 
         click.clear()
@@ -33,7 +51,7 @@ class ClickCli:
             click.secho(result.error.message, fg="red", err=True)
             return
         
-        self.curreny_projects = result.success
+        self.curreny_projects = result.success.items
         for i, project in enumerate(self.current_projects, 1):
             click.echo(f"[{i}] Project: {project.name}")
             for j, task, in enumerate(project.tasks):
@@ -45,43 +63,43 @@ class ClickCli:
     def _handle_project_menu(self, project: ProjectViewModel) -> None:
         
         while True:
+            with self._command("project menu"):
+                result = self.app.project_controller.handle_get(project.id)
+                if not result.is_success:
+                    click.secho(result.error.message, fg="red", err=True)
+                    return
+                project = result.success
+
+                click.clear()
+                click.echo(f"\nProject: {project.name}")
+                click.echo(f"Status: {project.status_display}")
+                click.echo(f"Description: {project.description}")
+                click.echo(f"\nTasks: {project.task_count} total, {project.completed_task_count} completed")
+
+                click.echo("\nActions:")
+                if project.project_type != "INBOX":
+                    click.echo("[1] Edit Project")
+                    click.echo("[2] Add Task to Project")
+                    click.echo("[3] Return to main menu")
+                else:
+                    click.echo("[1] Add Task to Project")
+                    click.echo("[2] Return to main menu")
+
+                if project.project_type != "INBOX":
+                    choice = click.prompt("Select an action", type=str, default="3")
+                    if choice == "1":
+                        self._edit_project(project)
+                    elif choice == "2":
+                        self._add_task_to_project(project)
+                    elif choice == "3":
+                        break
 
-            result = self.app.project_controller.handle_get(project.id)
-            if not result.is_success:
-                click.secho(result.error.message, fg="red", err=True)
-                return
-            project = result.success
-
-            click.clear()
-            click.echo(f"\nProject: {project.name}")
-            click.echo(f"Status: {project.status_display}")
-            click.echo(f"Description: {project.description}")
-            click.echo(f"\nTasks: {project.task_count} total, {project.completed_task_count} completed")
-
-            click.echo("\nActions:")
-            if project.project_type != "INBOX":
-                click.echo("[1] Edit Project")
-                click.echo("[2] Add Task to Project")
-                click.echo("[3] Return to main menu")
-            else:
-                click.echo("[1] Add Task to Project")
-                click.echo("[2] Return to main menu")
-
-            if project.project_type != "INBOX":
-                choice = click.prompt("Select an action", type=str, default="3")
-                if choice == "1":
-                    self._edit_project(project)
-                elif choice == "2":
-                    self._add_task_to_project(project)
-                elif choice == "3":
-                    break
-
-            else:
-                choice = click.prompt("Select an action", type=str, default="2")
-                if choice == "1":
-                    self._add_task_to_project(project)
-                elif choice == "2":
-                    break
+                else:
+                    choice = click.prompt("Select an action", type=str, default="2")
+                    if choice == "1":
+                        self._add_task_to_project(project)
+                    elif choice == "2":
+                        break
 
     def _create_task(self, project_id: str) -> Optional[TaskViewModel]:
         click.echo("\n Add New Task")
@@ -116,7 +134,7 @@ class ClickCli:
         if task:
             refresh_result = self.app.project_controller.handle_list()
             if refresh_result.is_success:
-                self.current_projects = refresh_result.success
+                self.current_projects = refresh_result.success.items
         click.pause()
 
     
@@ -202,64 +220,65 @@ class ClickCli:
 
     def _display_task_menu(self, task_id: str) -> None:
         while True:
-            result = self.app.task_controller.handle_get(task_id)
-            if not result.is_success:
-                click.secho(result.error.message, fg="red", err=True)
-                return
-
-            task = result.success
-            click.clear()
-
-            click.echo("\nTASK DETAILS")
-            click.echo("=" * 40)
-            click.echo(f"Title:       {task.title}")
-            click.echo(f"Description: {task.description}")
-            click.echo(f"Status:      {task.status_display}")
-            click.echo(f"Priority:    {task.priority_display}")
-            if task.completion_info:
-                click.echo(f"Completion:  {task.completion_info}")
-            click.echo("=" * 40)
-
-            click.echo("\nActions:")
-            click.echo("[1] Edit title")
-            click.echo("[2] Edit description")
-            click.echo("[3] Edit priority")
-            click.echo("[4] Complete task")
-            click.echo("[5] Delete task")
-            click.echo("[Enter] Return to main menu")
-
-            choice = click.prompt("Choose an action", type=str, default="")
-
-            if choice == "1":
-                new_title = click.prompt("New title", type=str)
-                result = self.app.task_controller.handle_update(task_id, title=new_title)
+            with self._command("task menu"):
+                result = self.app.task_controller.handle_get(task_id)
                 if not result.is_success:
                     click.secho(result.error.message, fg="red", err=True)
-                    click.pause()
-            elif choice == "2":
-                new_description = click.prompt("New description", type=str)
-                result = self.app.task_controller.handle_update(
-                    task_id, description=new_description
-                )
-                if not result.is_success:
-                    click.secho(result.error.message, fg="red", err=True)
-                    click.pause()
-            elif choice == "3":
-                self._update_task_priority(task_id)
-                break
-            elif choice == "4":
-                self._complete_task(task_id)
-            elif choice == "5":
-                if click.confirm("Are you sure you want to delete this task?"):
-                    result = self.app.task_controller.handle_delete(task_id)
-                    if result.is_success:
-                        click.echo("Task deleted successfully")
-                        break
-                    else:
+                    return
+
+                task = result.success
+                click.clear()
+
+                click.echo("\nTASK DETAILS")
+                click.echo("=" * 40)
+                click.echo(f"Title:       {task.title}")
+                click.echo(f"Description: {task.description}")
+                click.echo(f"Status:      {task.status_display}")
+                click.echo(f"Priority:    {task.priority_display}")
+                if task.completion_info:
+                    click.echo(f"Completion:  {task.completion_info}")
+                click.echo("=" * 40)
+
+                click.echo("\nActions:")
+                click.echo("[1] Edit title")
+                click.echo("[2] Edit description")
+                click.echo("[3] Edit priority")
+                click.echo("[4] Complete task")
+                click.echo("[5] Delete task")
+                click.echo("[Enter] Return to main menu")
+
+                choice = click.prompt("Choose an action", type=str, default="")
+
+                if choice == "1":
+                    new_title = click.prompt("New title", type=str)
+                    result = self.app.task_controller.handle_update(task_id, title=new_title)
+                    if not result.is_success:
+                        click.secho(result.error.message, fg="red", err=True)
+                        click.pause()
+                elif choice == "2":
+                    new_description = click.prompt("New description", type=str)
+                    result = self.app.task_controller.handle_update(
+                        task_id, description=new_description
+                    )
+                    if not result.is_success:
                         click.secho(result.error.message, fg="red", err=True)
                         click.pause()
-            elif choice == "":
-                break
+                elif choice == "3":
+                    self._update_task_priority(task_id)
+                    break
+                elif choice == "4":
+                    self._complete_task(task_id)
+                elif choice == "5":
+                    if click.confirm("Are you sure you want to delete this task?"):
+                        result = self.app.task_controller.handle_delete(task_id)
+                        if result.is_success:
+                            click.echo("Task deleted successfully")
+                            break
+                        else:
+                            click.secho(result.error.message, fg="red", err=True)
+                            click.pause()
+                elif choice == "":
+                    break
 
     def _update_task_priority(self, task_id: str) -> None:
         priorities = {"1": Priority.LOW, "2": Priority.MEDIUM, "3": Priority.HIGH}
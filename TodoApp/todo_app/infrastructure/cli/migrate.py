@@ -0,0 +1,35 @@
+"""Move a file-backend data directory from the single tasks.json to per-project shards.
+
+    python -m todo_app.infrastructure.cli.migrate [--data-dir repo_data]
+
+Set TODO_FILE_LAYOUT=sharded afterwards so the application reads the shards.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+from todo_app.infrastructure.config import Config
+from todo_app.infrastructure.persistence.codecs import get_codec
+from todo_app.infrastructure.persistence.sharded import migrate_to_shards
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", type=Path, default=None, help="defaults to TODO_DATA_DIR")
+    args = parser.parse_args(argv)
+
+    data_dir = args.data_dir or Config.get_data_directory()
+    if not (data_dir / "tasks.json").exists():
+        print(f"Nothing to migrate: {data_dir / 'tasks.json'} does not exist")
+        return 0
+
+    moved = migrate_to_shards(data_dir, get_codec(Config.get_file_codec()))
+    print(f"Moved {moved} tasks into {data_dir / 'tasks'}; the old file is kept as tasks.json.migrated")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,11 +10,18 @@ load_dotenv()
 class RepositoryType(Enum):
     MEMORY = "memory"
     FILE = "file"
+    JOURNAL = "journal"
+    SQLITE = "sqlite"
 
 class Config:
 
     DEFAULT_REPOSITORY_TYPE: RepositoryType = RepositoryType.MEMORY
     DEFAULT_DATA_DIR = "repo_data"
+    DEFAULT_JOURNAL_COMPACTION_THRESHOLD = 1000
+    DEFAULT_SQLITE_FILENAME = "todo.db"
+    DEFAULT_FILE_CODEC = "compact"
+    DEFAULT_FILE_GROUP_COMMIT_MS = 0
+    DEFAULT_FILE_LAYOUT = "single"
 
     @classmethod
     def get_repository_type(cls) -> RepositoryType:
@@ -30,9 +37,39 @@ class Config:
 
         data_dir = os.getenv("TODO_DATA_DIR", cls.DEFAULT_DATA_DIR)
         path = Path(data_dir)
-        path.mkdor(parents=True, exist_ok=True)
+        path.mkdir(parents=True, exist_ok=True)
         return path
     
+    @classmethod
+    def get_journal_compaction_threshold(cls) -> int:
+
+        return int(os.getenv("TODO_JOURNAL_COMPACTION_THRESHOLD", cls.DEFAULT_JOURNAL_COMPACTION_THRESHOLD))
+
+    @classmethod
+    def get_sqlite_path(cls) -> Path:
+
+        return cls.get_data_directory() / os.getenv("TODO_SQLITE_FILENAME", cls.DEFAULT_SQLITE_FILENAME)
+
+    @classmethod
+    def get_file_codec(cls) -> str:
+
+        return os.getenv("TODO_FILE_CODEC", cls.DEFAULT_FILE_CODEC)
+
+    @classmethod
+    def get_file_layout(cls) -> str:
+
+        return os.getenv("TODO_FILE_LAYOUT", cls.DEFAULT_FILE_LAYOUT).lower()
+
+    @classmethod
+    def get_file_group_commit_window(cls) -> float:
+
+        return int(os.getenv("TODO_FILE_GROUP_COMMIT_MS", cls.DEFAULT_FILE_GROUP_COMMIT_MS)) / 1000
+
+    @classmethod
+    def get_lazy_project_tasks(cls) -> bool:
+
+        return os.getenv("TODO_LAZY_PROJECT_TASKS", "false").lower() in ("1", "true", "yes")
+
     @classmethod
     def get_sendgrid_api_key(cls) -> str:
 
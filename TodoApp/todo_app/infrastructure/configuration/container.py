@@ -1,15 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from todo_app.infrastructure.notifications.factory import create_notification_service
 from todo_app.application.service_ports.notifications import NotificationPort
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from todo_app.interfaces.presenters.base import ProjectPresenter, TaskPresenter
 from todo_app.application.use_cases.project_use_cases import CompleteProjectUseCase, CreateProjectUseCase, GetProjectUseCase, ListProjectsUseCase, UpdateProjectUseCase
-from todo_app.application.use_cases.task_use_cases import CompleteTaskUseCase, CreateTaskUseCase, DeleteTaskUseCase, GetTaskUseCase, UpdateTaskUseCase
+from todo_app.application.use_cases.task_use_cases import CompleteTaskUseCase, CreateTaskUseCase, DeleteTaskUseCase, GetTaskUseCase, ImportTasksUseCase, ListProjectTasksUseCase, RecomputePrioritiesUseCase, UpdateTaskUseCase
 from todo_app.interfaces.controllers.project_controller import ProjectController
 from todo_app.interfaces.controllers.task_controller import TaskController
-from todo_app.infrastructure.repository_factory import create_repositories
+from todo_app.infrastructure.persistence.identity_map import IdentityMapProjectRepository, IdentityMapTaskRepository
+from todo_app.infrastructure.repository_factory import create_repositories, get_unit_of_work_factory
 
 
 import logging
@@ -25,6 +27,10 @@ def create_application(
 ) -> "Application":
 
     task_repository, project_repository = create_repositories()
+    unit_of_work = get_unit_of_work_factory(task_repository)
+    # Repeated loads by id within a request or CLI command come from its identity map.
+    task_repository = IdentityMapTaskRepository(task_repository)
+    project_repository = IdentityMapProjectRepository(project_repository)
 
     notification_service = create_notification_service()
 
@@ -34,6 +40,7 @@ def create_application(
         notification_service=notification_service,
         task_presenter=task_presenter,
         project_presenter=project_presenter,
+        unit_of_work=unit_of_work,
     )
 
 
@@ -45,6 +52,7 @@ class Application:
     notification_service: NotificationPort
     task_presenter: TaskPresenter
     project_presenter: ProjectPresenter
+    unit_of_work: UnitOfWorkFactory = field(default=UnitOfWork)
     # logger: ApplicationLogger
 
     def __post_init__(self):
@@ -52,28 +60,34 @@ class Application:
         self.create_task_use_case = CreateTaskUseCase(self.task_repository, self.project_repository)
 
         self.complete_task_use_case = CompleteTaskUseCase(
-            self.task_repository, self.notification_service
+            self.task_repository, self.notification_service, self.unit_of_work
         )
 
         self.get_task_use_case = GetTaskUseCase(self.task_repository)
 
+        self.list_project_tasks_use_case = ListProjectTasksUseCase(self.task_repository)
+
         self.create_project_use_case = CreateProjectUseCase(self.project_repository)
 
         self.complete_project_use_case = CompleteProjectUseCase(
-            self.project_repository, self.task_repository, self.notification_service
+            self.project_repository, self.task_repository, self.notification_service, self.unit_of_work
         )
 
         self.get_project_use_case = GetProjectUseCase(self.project_repository)
 
-        self.list_projects_use_case = ListProjectsUseCase(self.project_repository)
+        self.list_projects_use_case = ListProjectsUseCase(self.project_repository, self.task_repository)
 
         self.delete_task_use_case = DeleteTaskUseCase(self.task_repository)
         self.update_task_use_case = UpdateTaskUseCase(
-            self.task_repository, self.notification_service
+            self.task_repository, self.notification_service, self.unit_of_work
         )
 
         self.update_project_use_case = UpdateProjectUseCase(self.project_repository)
 
+        self.recompute_priorities_use_case = RecomputePrioritiesUseCase(self.task_repository)
+
+        self.import_tasks_use_case = ImportTasksUseCase(self.task_repository, self.project_repository)
+
 
         self.task_controller = TaskController(
             create_use_case=self.create_task_use_case,
@@ -81,6 +95,7 @@ class Application:
             update_use_case=self.update_task_use_case,
             delete_use_case=self.delete_task_use_case,
             get_use_case=self.get_task_use_case,
+            list_use_case=self.list_project_tasks_use_case,
             presenter=self.task_presenter,
         )
 
@@ -0,0 +1,48 @@
+import os
+import stat
+import uuid
+from pathlib import Path
+
+
+def _create_temp(path: Path) -> tuple[int, str]:
+    """Create an empty temporary file beside ``path``.
+
+    It is opened with mode 0666 so the kernel applies the umask, as it does
+    for any new file; mkstemp would force 0600.
+    """
+
+    tmp_name = str(path.parent / f".{path.name}.{uuid.uuid4().hex}.tmp")
+    return os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), tmp_name
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """Replace ``path`` with ``text`` so readers see the old or new file, never a partial one.
+
+    The data goes to a temporary file in the same directory, is fsync'd and
+    then renamed over the target; the directory is fsync'd as well so the
+    rename itself survives a crash. The replacement keeps the target's mode.
+    """
+
+    fd, tmp_name = _create_temp(path)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+            try:
+                os.chmod(tmp_name, stat.S_IMODE(os.stat(path).st_mode))
+            except FileNotFoundError:
+                pass
+            tmp.write(text)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+    dir_fd = os.open(path.parent, os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
@@ -0,0 +1,68 @@
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+Signature = Tuple[int, ...]
+
+
+class FileSignatureCache(Generic[T]):
+    """Keeps a value built from a file until the file changes.
+
+    A change is detected by the file's (mtime, size, inode), so a write from
+    another process sharing the data directory (the CLI next to the web app)
+    is picked up on the next lookup. File timestamps are coarse, so writers
+    in this process also call ``invalidate`` rather than rely on the mtime.
+    A ``version`` callable (a change sequence bumped by every writer) is
+    added to the signature to catch writes the file metadata cannot show.
+    """
+
+    def __init__(self, path: Path, version: Optional[Callable[[], int]] = None):
+        self._path = path
+        self._version = version
+        self._signature: Optional[Signature] = None
+        self._value: Optional[T] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _stat(self) -> Optional[Signature]:
+
+        try:
+            st = os.stat(self._path)
+        except FileNotFoundError:
+            return None
+        if self._version:
+            return st.st_mtime_ns, st.st_size, st.st_ino, self._version()
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def fresh(self) -> Optional[T]:
+        """The cached value if the file is unchanged, without rebuilding it."""
+
+        signature = self._stat()
+        with self._lock:
+            if signature is not None and signature == self._signature:
+                return self._value
+        return None
+
+    def get(self, build: Callable[[], T]) -> T:
+
+        signature = self._stat()
+        with self._lock:
+            if signature is not None and signature == self._signature:
+                return self._value
+            generation = self._generation
+
+        value = build()
+        with self._lock:
+            # An invalidate() while building means the value may predate a write.
+            if generation == self._generation:
+                self._signature, self._value = signature, value
+        return value
+
+    def invalidate(self) -> None:
+
+        with self._lock:
+            self._generation += 1
+            self._signature, self._value = None, None
@@ -0,0 +1,387 @@
+import heapq
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.entities.project import Project
+from todo_app.domain.value_objects import ProjectType, TaskStatus, ProjectStatus, Priority, Deadline
+
+
+class JsonEncoder(json.JSONEncoder):
+
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        if isinstance(obj, (TaskStatus, ProjectStatus, Priority)):
+            return obj.name
+        return super().default(obj)
+
+
+# Tasks of a store share a small set of project ids, so parse each once; the
+# tasks then also share one UUID object per project. Accepts either id form.
+@lru_cache(maxsize=4096)
+def _project_uuid(text: str) -> UUID:
+    return UUID(text)
+
+
+def task_to_dict(task: Task) -> Dict[str, Any]:
+
+    return {
+        "id": str(task.id),
+        "title": task.title,
+        "description": task.description,
+        "project_id": str(task.project_id),
+        "due_date": task.due_date.due_date.isoformat() if task.due_date else None,
+        "priority": task.priority.name,
+        "status": task.status.name,
+        "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "completion_notes": task.completion_notes,
+    }
+
+
+def dict_to_task(data: Dict[str, Any]) -> Task:
+
+    task = Task(
+        title=data["title"],
+        description=data["description"],
+        project_id=_project_uuid(data["project_id"]),
+        priority=Priority[data["priority"]],
+    )
+
+    if data["due_date"]:
+        task.due_date = Deadline.rehydrate(datetime.fromisoformat(data["due_date"]))
+    task.status = TaskStatus[data["status"]]
+    if data["completed_at"]:
+        task.completed_at = datetime.fromisoformat(data["completed_at"])
+    task.completion_notes = data["completion_notes"]
+
+    task.id = UUID(data["id"])
+
+    return task
+
+
+def project_to_dict(project: Project) -> Dict[str, Any]:
+
+    return {
+        "id": str(project.id),
+        "name": project.name,
+        "description": project.description,
+        "project_type": project.project_type.name,
+        "status": project.status.name,
+        "completed_at": project.completed_at.isoformat() if project.completed_at else None,
+        "completion_notes": project.completion_notes,
+    }
+
+
+def dict_to_project(data: Dict[str, Any]) -> Project:
+
+    if data.get("project_type") == ProjectType.INBOX.name:
+        project = Project.create_inbox()
+    else:
+        project = Project(name=data["name"], description=data["description"])
+
+    project.status = ProjectStatus[data["status"]]
+    if data["completed_at"]:
+        project.completed_at = datetime.fromisoformat(data["completed_at"])
+    project.completion_notes = data["completion_notes"]
+
+    project.id = UUID(data["id"])
+
+    return project
+
+
+class RecordCodec(ABC):
+    """How the file backend lays out task and project records.
+
+    Repositories only touch stored records through a codec: to convert them
+    to and from entities, and through the accessors below to filter without
+    building entities. Records written by another codec are converted on
+    read, so switching codecs migrates a store the next time it is written.
+    """
+
+    name: str
+
+    @abstractmethod
+    def encode_task(self, task: Task) -> Any:
+        pass
+
+    @abstractmethod
+    def decode_task(self, record: Any) -> Task:
+        pass
+
+    @abstractmethod
+    def encode_project(self, project: Project) -> Any:
+        pass
+
+    @abstractmethod
+    def decode_project(self, record: Any) -> Project:
+        pass
+
+    @abstractmethod
+    def dumps(self, records: List[Any]) -> str:
+        pass
+
+    @abstractmethod
+    def is_native(self, record: Any) -> bool:
+        pass
+
+    @abstractmethod
+    def key(self, entity_id: UUID) -> str:
+        """The form ids take inside records; sorts in the same order as the UUIDs."""
+        pass
+
+    @abstractmethod
+    def record_id(self, record: Any) -> str:
+        pass
+
+    @abstractmethod
+    def task_project_id(self, record: Any) -> str:
+        pass
+
+    @abstractmethod
+    def task_is_active(self, record: Any) -> bool:
+        pass
+
+    @abstractmethod
+    def task_status(self, record: Any) -> TaskStatus:
+        pass
+
+    @abstractmethod
+    def task_due_date(self, record: Any) -> Optional[datetime]:
+        pass
+
+    @abstractmethod
+    def project_is_inbox(self, record: Any) -> bool:
+        pass
+
+    def loads(self, text: str) -> List[Any]:
+        return json.loads(text)
+
+    def upgrade_task(self, record: Any) -> Any:
+
+        if self.is_native(record):
+            return record
+        return self.encode_task(codec_for_record(record).decode_task(record))
+
+    def upgrade_project(self, record: Any) -> Any:
+
+        if self.is_native(record):
+            return record
+        return self.encode_project(codec_for_record(record).decode_project(record))
+
+    def due_between(self, records: Iterable[Any], start: datetime, end: datetime) -> List[Any]:
+        """Active task records due in (start, end], earliest first, without building entities."""
+
+        due = []
+        for record in records:
+            if self.task_is_active(record):
+                due_date = self.task_due_date(record)
+                if due_date and start < due_date <= end:
+                    due.append((due_date, record))
+        due.sort(key=lambda item: item[0])
+        return [record for _, record in due]
+
+    def page(self, records: Iterable[Any], limit: int, after: Optional[UUID] = None) -> List[Any]:
+        """The ``limit`` records with the smallest ids after ``after``, in id order."""
+
+        key = self.key(after) if after else ""
+        record_id = self.record_id
+        return heapq.nsmallest(limit, (r for r in records if record_id(r) > key), key=record_id)
+
+
+class JsonCodec(RecordCodec):
+    """The original layout: one indented object per record, readable by hand."""
+
+    name = "json"
+
+    def encode_task(self, task: Task) -> Dict[str, Any]:
+        return task_to_dict(task)
+
+    def decode_task(self, record: Dict[str, Any]) -> Task:
+        return dict_to_task(record)
+
+    def encode_project(self, project: Project) -> Dict[str, Any]:
+        return project_to_dict(project)
+
+    def decode_project(self, record: Dict[str, Any]) -> Project:
+        return dict_to_project(record)
+
+    def dumps(self, records: List[Any]) -> str:
+        return json.dumps(records, indent=2, cls=JsonEncoder)
+
+    def is_native(self, record: Any) -> bool:
+        return isinstance(record, dict)
+
+    def key(self, entity_id: UUID) -> str:
+        return str(entity_id)
+
+    def record_id(self, record: Dict[str, Any]) -> str:
+        return record["id"]
+
+    def task_project_id(self, record: Dict[str, Any]) -> str:
+        return record["project_id"]
+
+    def task_is_active(self, record: Dict[str, Any]) -> bool:
+        return record["status"] != TaskStatus.DONE.name
+
+    def task_status(self, record: Dict[str, Any]) -> TaskStatus:
+        return TaskStatus[record["status"]]
+
+    def task_due_date(self, record: Dict[str, Any]) -> Optional[datetime]:
+        return datetime.fromisoformat(record["due_date"]) if record["due_date"] else None
+
+    def project_is_inbox(self, record: Dict[str, Any]) -> bool:
+        return record.get("project_type") == ProjectType.INBOX.name
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+TASK_STATUS_CODES = {TaskStatus.TODO: 0, TaskStatus.IN_PROGRESS: 1, TaskStatus.DONE: 2}
+PROJECT_STATUS_CODES = {ProjectStatus.ACTIVE: 0, ProjectStatus.COMPLETED: 1}
+PROJECT_TYPE_CODES = {ProjectType.REGULAR: 0, ProjectType.INBOX: 1}
+
+TASK_STATUSES = {code: status for status, code in TASK_STATUS_CODES.items()}
+PROJECT_STATUSES = {code: status for status, code in PROJECT_STATUS_CODES.items()}
+PRIORITIES = {priority.value: priority for priority in Priority}
+DONE_CODE = TASK_STATUS_CODES[TaskStatus.DONE]
+INBOX_CODE = PROJECT_TYPE_CODES[ProjectType.INBOX]
+
+
+def _to_micros(value: datetime) -> int:
+
+    # Naive values (completed_at comes from datetime.now()) are local time.
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (value - EPOCH) // MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    return EPOCH + timedelta(microseconds=micros)
+
+
+def _local_from_micros(micros: int) -> datetime:
+    return _from_micros(micros).astimezone().replace(tzinfo=None)
+
+
+class CompactCodec(RecordCodec):
+    """Positional records with no indentation.
+
+    A task is ``[id, title, description, project_id, due, priority, status,
+    completed_at, notes]`` and a project ``[id, name, description, type,
+    status, completed_at, notes]``. Ids are 32-digit hex, enums small ints
+    and timestamps integer microseconds since the epoch (due dates come back
+    in UTC, completion times as naive local time like the entities set them).
+    """
+
+    name = "compact"
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, check_circular=False)
+
+    def encode_task(self, task: Task) -> List[Any]:
+
+        return [
+            task.id.hex,
+            task.title,
+            task.description,
+            task.project_id.hex,
+            _to_micros(task.due_date.due_date) if task.due_date else None,
+            task.priority.value,
+            TASK_STATUS_CODES[task.status],
+            _to_micros(task.completed_at) if task.completed_at else None,
+            task.completion_notes,
+        ]
+
+    def decode_task(self, record: List[Any]) -> Task:
+
+        task_id, title, description, project_id, due, priority, status, completed_at, notes = record
+        task = Task(
+            title=title,
+            description=description,
+            project_id=_project_uuid(project_id),
+            priority=PRIORITIES[priority],
+        )
+        if due is not None:
+            task.due_date = Deadline.rehydrate(_from_micros(due))
+        task.status = TASK_STATUSES[status]
+        if completed_at is not None:
+            task.completed_at = _local_from_micros(completed_at)
+        task.completion_notes = notes
+        task.id = UUID(hex=task_id)
+        return task
+
+    def encode_project(self, project: Project) -> List[Any]:
+
+        return [
+            project.id.hex,
+            project.name,
+            project.description,
+            PROJECT_TYPE_CODES[project.project_type],
+            PROJECT_STATUS_CODES[project.status],
+            _to_micros(project.completed_at) if project.completed_at else None,
+            project.completion_notes,
+        ]
+
+    def decode_project(self, record: List[Any]) -> Project:
+
+        project_id, name, description, project_type, status, completed_at, notes = record
+        if project_type == INBOX_CODE:
+            project = Project.create_inbox()
+        else:
+            project = Project(name=name, description=description)
+        project.status = PROJECT_STATUSES[status]
+        if completed_at is not None:
+            project.completed_at = _local_from_micros(completed_at)
+        project.completion_notes = notes
+        project.id = UUID(hex=project_id)
+        return project
+
+    def dumps(self, records: List[Any]) -> str:
+        return self._encoder.encode(records)
+
+    def is_native(self, record: Any) -> bool:
+        return isinstance(record, list)
+
+    def key(self, entity_id: UUID) -> str:
+        return entity_id.hex
+
+    def record_id(self, record: List[Any]) -> str:
+        return record[0]
+
+    def task_project_id(self, record: List[Any]) -> str:
+        return record[3]
+
+    def task_is_active(self, record: List[Any]) -> bool:
+        return record[6] != DONE_CODE
+
+    def task_status(self, record: List[Any]) -> TaskStatus:
+        return TASK_STATUSES[record[6]]
+
+    def task_due_date(self, record: List[Any]) -> Optional[datetime]:
+        return _from_micros(record[4]) if record[4] is not None else None
+
+    def project_is_inbox(self, record: List[Any]) -> bool:
+        return record[3] == INBOX_CODE
+
+
+CODECS: Dict[str, RecordCodec] = {codec.name: codec for codec in (JsonCodec(), CompactCodec())}
+
+
+def get_codec(name: str) -> RecordCodec:
+
+    try:
+        return CODECS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Invalid file codec: {name}")
+
+
+def codec_for_record(record: Any) -> RecordCodec:
+    """The codec that wrote ``record``, judged by its shape."""
+    return CODECS["compact"] if isinstance(record, list) else CODECS["json"]
@@ -1,230 +1,471 @@
+import heapq
 import json 
+import threading
+from copy import copy
 from datetime import datetime
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set
 from uuid import UUID
 
 from todo_app.domain.entities.task import Task
 from todo_app.domain.entities.project import Project
 from todo_app.domain.exceptions import TaskNotFoundError, ProjectNotFoundError, InboxNotFoundError
-from todo_app.domain.value_objects import ProjectType, TaskStatus, ProjectStatus, Priority, Deadline
+from todo_app.domain.value_objects import ProjectType, TaskStatus
 from todo_app.application.repositories.task_repository import TaskRepository
 from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.infrastructure.persistence.atomic import atomic_write_text
+from todo_app.infrastructure.persistence.cache import FileSignatureCache
+from todo_app.infrastructure.persistence.codecs import RecordCodec, get_codec
+from todo_app.infrastructure.persistence.group_commit import GroupCommitter
+from todo_app.infrastructure.persistence.locking import StoreLock
+
+DEFAULT_CODEC = "compact"
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Yield the elements of a JSON array file one at a time.
+
+    Only the current chunk and the element being decoded are held in memory,
+    so a store can be scanned without loading the whole document.
+    """
+
+    decoder = json.JSONDecoder()
+    with path.open("r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size)
+        eof = not buffer
+        pos = _skip_whitespace(buffer, 0)
+        if buffer[pos:pos + 1] != "[":
+            raise ValueError(f"{path} does not contain a JSON array")
+        pos += 1
+
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+                end = _skip_whitespace(buffer, end)
+            except json.JSONDecodeError:
+                end = len(buffer)
+            # A value only counts once the delimiter after it has been read;
+            # until then it may be cut short (``3.`` decodes as ``3``).
+            if end == len(buffer) or buffer[end] not in ",]":
+                if eof:
+                    raise ValueError(f"{path} is not a well-formed JSON array")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+            yield value
+            pos = end + 1 if buffer[end] == "," else end
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+
+    while pos < len(text) and text[pos] in " \t\n\r":
+        pos += 1
+    return pos
+
+
+def _copy_project(project: Project) -> Project:
+
+    clone = copy(project)
+    clone._tasks, clone._incomplete = {}, {}
+    return clone
+
+
+# Record key -> new record, or None to delete the record.
+Changes = Dict[str, Optional[Any]]
+
+
+def _merge_changes(codec: RecordCodec, stored: List[Any], batches: Iterable[Changes]) -> List[Any]:
+    """Apply change sets, oldest first, to the stored records in a single pass."""
+
+    changes: Changes = {}
+    for batch in batches:
+        changes.update(batch)
+
+    merged = []
+    for record in stored:
+        key = codec.record_id(record)
+        if key in changes:
+            if (record := changes.pop(key)) is None:
+                continue
+        merged.append(record)
+    merged.extend(record for record in changes.values() if record is not None)
+    return merged
+
+
+class _FileWriter:
+    """Serialises the read-modify-write of one store file.
+
+    The store lock is held exclusively from the read to the write, so writers
+    in other processes cannot slip in between and have their changes lost.
+    With a ``group_commit_window`` the change sets of concurrent callers that
+    arrive within the window are merged and written (and fsync'd) once.
+    """
+
+    def __init__(
+        self, load, save, codec: RecordCodec, store_lock: StoreLock, group_commit_window: float = 0.0
+    ):
+        self._load = load
+        self._save = save
+        self._codec = codec
+        self._store_lock = store_lock
+        self._lock = threading.Lock()
+        self._committer = (
+            GroupCommitter(self._apply, group_commit_window) if group_commit_window > 0 else None
+        )
 
-class JsonEncoder(json.JSONDecoder):
+    def commit(self, changes: Changes) -> None:
 
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, UUID):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        if isinstance(obj, (TaskStatus, ProjectStatus, Priority)):
-            return obj.name
-        return super().default(obj)
-    
-class FileTaskRepository(TaskRepository):
+        if not changes:
+            return
+        if self._committer:
+            self._committer.submit(changes)
+        else:
+            self._apply([changes])
 
-    def __init__(self, data_dir: Path):
-        self.tasks_file = data_dir / "tasks.json"
-        self._ensure_file_exists()
+    def _apply(self, batches: List[Changes]) -> None:
 
-    def _ensure_file_exists(self) -> None:
-        if not self.tasks_file.exists():
-            self.tasks_file.write_text("[]")
-    
-    def _load_tasks(self) -> list[Dict[str, Any]]:
-        return json.loads(self.tasks_file.read_text())
-    
-    def _save_tasks(self, tasks: list[Dict[str, Any]]) -> None:
-        self.tasks_file.write_text(json.dumps(tasks, indent=2, cls=JsonEncoder))
+        with self._lock, self._store_lock.exclusive():
+            self._save(_merge_changes(self._codec, self._load(), batches))
 
-    def _task_to_dict(self, task: Task) -> Dict[str, Any]:
 
-        return {
-            "id": task.id,
-            "title": task.title,
-            "description": task.description,
-            "project_id": task.project_id,
-            "due_date": task.due_date.due_date if task.due_date else None,
-            "priority": task.priority.name,
-            "status": task.status.name,
-            "completed_at": task.completed_at,
-            "completion_notes": task.completion_notes,
-        }
-    
+class _TaskIndex:
+    """Decoded tasks of one version of tasks.json."""
+
+    def __init__(self, tasks: Iterable[Task]):
+        self.by_id: Dict[UUID, Task] = {}
+        self.by_project: Dict[UUID, List[Task]] = {}
+        for task in tasks:
+            self.by_id[task.id] = task
+            self.by_project.setdefault(task.project_id, []).append(task)
+
+
+class _RecordIndex:
+    """Raw task records of one version of tasks.json by id key and by project key, none decoded."""
 
-    def _dict_to_task(self, data: Dict[str, Any]) -> Task:
+    def __init__(self, codec: RecordCodec, records: Iterable[Any]):
+        self.keys: Set[str] = set()
+        self.by_project: Dict[str, List[Any]] = {}
+        for record in records:
+            self.keys.add(codec.record_id(record))
+            self.by_project.setdefault(codec.task_project_id(record), []).append(record)
 
-        task = Task(
-            title=data["title"],
-            description=data["description"],
-            project_id=UUID(data["project_id"]),
-            priority=Priority[data["priority"]],
+
+class FileTaskRepository(TaskRepository):
+    """Task store backed by a single JSON array file.
+
+    Reads go through a cache of decoded tasks that is dropped whenever the
+    file changes, so repeated queries are dictionary lookups. Callers always
+    get copies; the cached entities are never handed out.
+
+    Writes replace the file atomically, so a crash leaves either the old or
+    the new store on disk. Processes sharing the data directory coordinate
+    through a ``StoreLock``: reads hold it shared, writes exclusively.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        codec: Optional[RecordCodec] = None,
+        group_commit_window: float = 0.0,
+        filename: str = "tasks.json",
+    ):
+        self.tasks_file = data_dir / filename
+        self.codec = codec or get_codec(DEFAULT_CODEC)
+        self._store_lock = StoreLock(self.tasks_file)
+        self._cache: FileSignatureCache[_TaskIndex] = FileSignatureCache(
+            self.tasks_file, self._store_lock.sequence
+        )
+        self._record_cache: FileSignatureCache[_RecordIndex] = FileSignatureCache(
+            self.tasks_file, self._store_lock.sequence
+        )
+        self._writer = _FileWriter(
+            lambda: self._load_tasks(),
+            lambda tasks: self._save_tasks(tasks),
+            self.codec,
+            self._store_lock,
+            group_commit_window,
         )
+        self._ensure_file_exists()
 
-        if data["due_date"]:
-            task.due_date = Deadline(datetime.fromisoformat(data["due_date"]))
-        task.status = TaskStatus[data["status"]]
-        if data["completed_at"]:
-            task.completed_at = datetime.fromisoformat(data["completed_at"])
-        task.completion_notes = data["completion_notes"]
+    def _ensure_file_exists(self) -> None:
+        with self._store_lock.exclusive():
+            if not self.tasks_file.exists():
+                self.tasks_file.write_text("[]")
+    
+    def _load_tasks(self) -> list[Any]:
+        upgrade = self.codec.upgrade_task
+        with self._store_lock.shared():
+            text = self.tasks_file.read_text()
+        return [upgrade(t) for t in self.codec.loads(text)]
+    
+    def _save_tasks(self, tasks: list[Any]) -> None:
+        with self._store_lock.exclusive():
+            atomic_write_text(self.tasks_file, self.codec.dumps(tasks))
+            self._store_lock.bump()
+        self._cache.invalidate()
+        self._record_cache.invalidate()
 
-        task.id = UUID(data["id"])
+    def _iter_tasks(self) -> Iterator[Any]:
+        # No lock while streaming: writers rename a new file into place, so the
+        # open file stays a consistent snapshot.
+        return map(self.codec.upgrade_task, iter_json_array(self.tasks_file))
 
-        return task
+    def _index(self) -> _TaskIndex:
+        return self._cache.get(lambda: _TaskIndex(map(self.codec.decode_task, self._load_tasks())))
 
     def get(self, task_id: UUID) -> Task:
 
-        tasks = self._load_tasks()
-        for task_data in tasks:
-            if UUID(task_data["id"]) == task_id:
-                return self._dict_to_task(task_data)
+        if task := self._index().by_id.get(task_id):
+            return copy(task)
         raise TaskNotFoundError(task_id)
 
     def save(self, task: Task) -> None:
-        tasks = self._load_tasks()
 
-        updated = False
-        for i, task_data in enumerate(tasks):
-            if UUID(task_data["id"]) == task.id:
-                tasks[i] = self._task_to_dict(task)
-                updated = True
-                break
+        self.save_many([task])
 
-        if not updated:
-            tasks.append(self._task_to_dict(task))
+    def save_many(self, tasks: Iterable[Task]) -> None:
 
-        self._save_tasks(tasks)
+        codec = self.codec
+        self._writer.commit({codec.key(task.id): codec.encode_task(task) for task in tasks})
 
     def delete(self, task_id: UUID) -> None:
 
-        tasks = self._load_tasks()
-        tasks = [t for t in tasks if UUID(t["id"]) != task_id]
-        self._save_tasks(tasks)
+        self._writer.commit({self.codec.key(task_id): None})
+
+    def delete_many(self, task_ids: Iterable[UUID]) -> None:
+
+        self._writer.commit({self.codec.key(task_id): None for task_id in task_ids})
+
+    def _records(self) -> _RecordIndex:
+        return self._record_cache.get(lambda: _RecordIndex(self.codec, self._load_tasks()))
+
+    # Existence and counts come from the decoded tasks when they are current,
+    # otherwise from the raw records, so answering them never decodes a task.
+
+    def exists(self, task_id: UUID) -> bool:
+
+        if (index := self._cache.fresh()) is not None:
+            return task_id in index.by_id
+        return self.codec.key(task_id) in self._records().keys
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+
+        if (index := self._cache.fresh()) is not None:
+            tasks = index.by_project.get(project_id, ())
+            if status is None:
+                return len(tasks)
+            return sum(1 for task in tasks if task.status == status)
+        records = self._records().by_project.get(self.codec.key(project_id), ())
+        if status is None:
+            return len(records)
+        task_status = self.codec.task_status
+        return sum(1 for record in records if task_status(record) == status)
 
     def find_by_project(self, project_id: UUID) -> Sequence[Task]:
 
-        tasks = self._load_tasks()
-        return [self._dict_to_task(t) for t in tasks if UUID(t["project_id"]) == project_id]
+        return [copy(task) for task in self._index().by_project.get(project_id, ())]
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+
+        tasks = self._index().by_project.get(project_id, ())
+        page = heapq.nsmallest(
+            limit, (t for t in tasks if after is None or t.id > after), key=attrgetter("id")
+        )
+        return [copy(task) for task in page]
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Dict[UUID, List[Task]]:
+
+        by_project = self._index().by_project
+        return {
+            project_id: [copy(task) for task in by_project.get(project_id, ())]
+            for project_id in project_ids
+        }
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+
+        if (index := self._cache.fresh()) is not None:
+            return [
+                copy(task)
+                for task in sorted(
+                    (
+                        t
+                        for t in index.by_id.values()
+                        if t.status != TaskStatus.DONE and t.due_date and start < t.due_date.due_date <= end
+                    ),
+                    key=lambda t: t.due_date.due_date,
+                )
+            ]
+        codec = self.codec
+        return [codec.decode_task(t) for t in codec.due_between(self._iter_tasks(), start, end)]
 
     def get_active_tasks(self) -> Sequence[Task]:
 
-        tasks = self._load_tasks()
-        return [self._dict_to_task(t) for t in tasks if t["status"] != TaskStatus.DONE.name]
+        return [copy(t) for t in self._index().by_id.values() if t.status != TaskStatus.DONE]
+
+    # The iterators use the cache when it is current but never fill it, so a
+    # cold scan still runs in constant memory.
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+
+        if (index := self._cache.fresh()) is not None:
+            yield from map(copy, index.by_project.get(project_id, ()))
+            return
+        codec, key = self.codec, self.codec.key(project_id)
+        for t in self._iter_tasks():
+            if codec.task_project_id(t) == key:
+                yield codec.decode_task(t)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+
+        if (index := self._cache.fresh()) is not None:
+            yield from (copy(t) for t in index.by_id.values() if t.status != TaskStatus.DONE)
+            return
+        codec = self.codec
+        for t in self._iter_tasks():
+            if codec.task_is_active(t):
+                yield codec.decode_task(t)
 
 
 class FileProjectRepository(ProjectRepository):
 
-    def __init__(self, data_dir: Path):
+    def __init__(
+        self, data_dir: Path, codec: Optional[RecordCodec] = None, group_commit_window: float = 0.0
+    ):
         self.projects_file = data_dir / "projects.json"
+        self.codec = codec or get_codec(DEFAULT_CODEC)
+        self._store_lock = StoreLock(self.projects_file)
+        self._cache: FileSignatureCache[Dict[UUID, Project]] = FileSignatureCache(
+            self.projects_file, self._store_lock.sequence
+        )
+        self._writer = _FileWriter(
+            lambda: self._load_projects(),
+            lambda projects: self._save_projects(projects),
+            self.codec,
+            self._store_lock,
+            group_commit_window,
+        )
         self._ensure_file_exists()
         self._task_repo = None
+        self._lazy_tasks = False
+        self._inbox_id: Optional[UUID] = None
 
-        inbox = self._fetch_inbox()
-        if not inbox:
-            inbox = Project.create_inbox()
-            self.save(inbox)
+        # Held across the check so two processes starting together create one Inbox.
+        with self._store_lock.exclusive():
+            inbox = self._fetch_inbox()
+            if not inbox:
+                inbox = Project.create_inbox()
+                self.save(inbox)
+
+    def set_task_repository(self, task_repo: TaskRepository, lazy_tasks: bool = False) -> None:
 
-    def set_task_repository(self, task_repo: TaskRepository) -> None:
         self._task_repo = task_repo
+        self._lazy_tasks = lazy_tasks
 
     def _ensure_file_exists(self) -> None:
 
-        if not self.projects_file.exists():
-            self.projects_file.write_text("[]")
+        with self._store_lock.exclusive():
+            if not self.projects_file.exists():
+                self.projects_file.write_text("[]")
 
-    def _load_projects(self) -> list[Dict[str, Any]]:
+    def _load_projects(self) -> list[Any]:
 
-        return json.loads(self.projects_file.read_text())
+        upgrade = self.codec.upgrade_project
+        with self._store_lock.shared():
+            text = self.projects_file.read_text()
+        return [upgrade(p) for p in self.codec.loads(text)]
 
-    def _save_projects(self, projects: list[Dict[str, Any]]) -> None:
+    def _save_projects(self, projects: list[Any]) -> None:
 
-        self.projects_file.write_text(json.dumps(projects, indent=2, cls=JsonEncoder))
+        with self._store_lock.exclusive():
+            atomic_write_text(self.projects_file, self.codec.dumps(projects))
+            self._store_lock.bump()
+        self._cache.invalidate()
 
-    def _project_to_dict(self, project: Project) -> Dict[str, Any]:
+    def _projects(self) -> Dict[UUID, Project]:
 
-        return {
-            "id": project.id,
-            "name": project.name,
-            "description": project.description,
-            "project_type": project.project_type.name,
-            "status": project.status.name,
-            "completed_at": project.completed_at,
-            "completion_notes": project.completion_notes,
-        }
-
-    def _dict_to_project(self, data: Dict[str, Any]) -> Project:
+        return self._cache.get(
+            lambda: {p.id: p for p in map(self.codec.decode_project, self._load_projects())}
+        )
 
-        if data.get("project_type") == ProjectType.INBOX.name:
-            project = Project.create_inbox()
-        else:
-            project = Project(name=data["name"], description=data["description"])
+    def get(self, project_id: UUID) -> Project:
 
-        project.status = ProjectStatus[data["status"]]
-        if data["completed_at"]:
-            project.completed_at = datetime.fromisoformat(data["completed_at"])
-        project.completion_notes = data["completion_notes"]
+        if cached := self._projects().get(project_id):
+            project = _copy_project(cached)
+            if self._task_repo:
+                self._load_project_tasks(project)
+            return project
+        raise ProjectNotFoundError(project_id)
 
-        project.id = UUID(data["id"])
+    def exists(self, project_id: UUID) -> bool:
 
-        return project
+        return project_id in self._projects()
 
-    def get(self, project_id: UUID) -> Project:
+    def get_all(self) -> List[Project]:
 
-        projects = self._load_projects()
-        for project_data in projects:
-            if UUID(project_data["id"]) == project_id:
-                project = self._dict_to_project(project_data)
+        return self._build_projects(self._projects().values())
 
-                if self._task_repo:
-                    self._load_project_tasks(project)
-                return project
-        raise ProjectNotFoundError(project_id)
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> List[Project]:
 
-    def get_all(self) -> List[Project]:
+        projects = self._projects().values()
+        return self._build_projects(
+            heapq.nsmallest(
+                limit, (p for p in projects if after is None or p.id > after), key=attrgetter("id")
+            )
+        )
 
-        projects = [self._dict_to_project(p) for p in self._load_projects()]
+    def _build_projects(self, cached: Iterable[Project]) -> List[Project]:
 
-        if self._task_repo:
+        projects = [_copy_project(p) for p in cached]
+        if self._task_repo and self._lazy_tasks:
             for project in projects:
                 self._load_project_tasks(project)
+        elif self._task_repo:
+            tasks_by_project = self._task_repo.find_by_projects(p.id for p in projects)
+            for project in projects:
+                self._attach_tasks(project, tasks_by_project[project.id])
         return projects
 
     def save(self, project: Project) -> None:
 
-        projects = self._load_projects()
+        self.save_many([project])
 
-        updated = False
-        for i, project_data in enumerate(projects):
-            if UUID(project_data["id"]) == project.id:
-                projects[i] = self._project_to_dict(project)
-                updated = True
-                break
+    def save_many(self, projects: Iterable[Project]) -> None:
 
-        if not updated:
-            projects.append(self._project_to_dict(project))
+        projects = list(projects)
+        codec = self.codec
+        self._writer.commit({codec.key(project.id): codec.encode_project(project) for project in projects})
 
-        self._save_projects(projects)
-
-        for task in project.tasks:
-            self._task_repo.save(task)
+        if self._task_repo:
+            self._task_repo.save_many(
+                task for project in projects if project.tasks_loaded for task in project.tasks
+            )
 
     def delete(self, project_id: UUID) -> None:
 
         for task in self._task_repo.find_by_project(project_id):
             self._task_repo.delete(task.id)
 
-        projects = self._load_projects()
-        projects = [p for p in projects if UUID(p["id"]) != project_id]
-        self._save_projects(projects)
+        self._writer.commit({self.codec.key(project_id): None})
 
     def _fetch_inbox(self) -> Optional[Project]:
 
-        projects = self._load_projects()
-        for project_data in projects:
-            if project_data.get("project_type") == ProjectType.INBOX.name:
-                return self._dict_to_project(project_data)
-        return None
+        # The id is pinned after one scan. It is checked against the current
+        # store on every call, so a change by another process is noticed.
+        projects = self._projects()
+        inbox = projects.get(self._inbox_id)
+        if inbox is None or inbox.project_type != ProjectType.INBOX:
+            inbox = next((p for p in projects.values() if p.project_type == ProjectType.INBOX), None)
+            self._inbox_id = inbox.id if inbox else None
+        return _copy_project(inbox) if inbox else None
 
     def get_inbox(self) -> Project:
 
@@ -235,15 +476,15 @@ class FileProjectRepository(ProjectRepository):
 
     def _load_project_tasks(self, project: Project) -> None:
 
+        if self._lazy_tasks:
+            project.defer_tasks(partial(self._task_repo.find_by_project, project.id))
+            return
         try:
-
-            project._tasks.clear()
-
-
-            tasks = self._task_repo.find_by_project(project.id)
-
-            for task in tasks:
-                project._tasks[task.id] = task
+            self._attach_tasks(project, self._task_repo.find_by_project(project.id))
         except Exception as e:
             
-            print(f"Error loading tasks for project {project.id}: {str(e)}")
\ No newline at end of file
+            print(f"Error loading tasks for project {project.id}: {str(e)}")
+
+    def _attach_tasks(self, project: Project, tasks: Iterable[Task]) -> None:
+
+        project.attach_tasks(tasks)
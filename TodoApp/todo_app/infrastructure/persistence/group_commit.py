@@ -0,0 +1,55 @@
+import threading
+import time
+from typing import Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Batch(Generic[T]):
+
+    def __init__(self) -> None:
+        self.ops: List[T] = []
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class GroupCommitter(Generic[T]):
+    """Coalesces mutations that arrive within ``window`` seconds into one write.
+
+    The first caller to find no open batch becomes its leader: it waits out the
+    window, closes the batch and applies every queued operation in one call to
+    ``apply``. The other callers only wait for that write, so each ``submit``
+    still returns once its change is on disk (or raises what the write raised).
+    """
+
+    def __init__(self, apply: Callable[[List[T]], None], window: float):
+        self._apply = apply
+        self._window = window
+        self._pending: Optional[_Batch[T]] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+    def submit(self, op: T) -> None:
+
+        with self._lock:
+            batch = self._pending
+            leader = batch is None
+            if leader:
+                batch = self._pending = _Batch()
+            batch.ops.append(op)
+
+        if leader:
+            time.sleep(self._window)
+            with self._lock:
+                self._pending = None
+            with self._write_lock:
+                try:
+                    self._apply(batch.ops)
+                except BaseException as e:
+                    batch.error = e
+            batch.done.set()
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
@@ -0,0 +1,233 @@
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+from uuid import UUID
+
+from todo_app.domain.entities.entity import Entity
+from todo_app.domain.entities.project import Project
+from todo_app.domain.entities.task import Task
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.application.repositories.task_repository import TaskRepository
+
+
+class IdentityMap:
+    """The entities loaded by id during one request or command, one instance per id."""
+
+    def __init__(self) -> None:
+        self._entities: Dict[type, Dict[UUID, Entity]] = {Task: {}, Project: {}}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: type, entity_id: UUID) -> Optional[Entity]:
+
+        entity = self._entities[kind].get(entity_id)
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entity
+
+    def put(self, kind: type, entity: Entity) -> Entity:
+        """Keep ``entity`` unless another instance with its id is already kept; return the kept one."""
+        return self._entities[kind].setdefault(entity.id, entity)
+
+    def replace(self, kind: type, entity: Entity) -> None:
+        self._entities[kind][entity.id] = entity
+
+    def discard(self, kind: type, entity_id: UUID) -> None:
+        self._entities[kind].pop(entity_id, None)
+
+    def clear(self, kind: type) -> None:
+        self._entities[kind].clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entities": sum(len(entities) for entities in self._entities.values()),
+        }
+
+
+_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar("identity_map", default=None)
+
+
+def current_identity_map() -> Optional[IdentityMap]:
+    return _identity_map.get()
+
+
+def begin_identity_map() -> Token:
+    """Start a fresh identity map for the current context; pass the token to ``end_identity_map``."""
+    return _identity_map.set(IdentityMap())
+
+
+def end_identity_map(token: Token) -> IdentityMap:
+    """Drop the identity map started with ``token`` and return it, e.g. for its counters."""
+    identity_map = _identity_map.get()
+    _identity_map.reset(token)
+    return identity_map
+
+
+@contextmanager
+def identity_map_scope() -> Iterator[IdentityMap]:
+    token = begin_identity_map()
+    try:
+        yield current_identity_map()
+    finally:
+        end_identity_map(token)
+
+
+class IdentityMapTaskRepository(TaskRepository):
+    """Serves repeated ``get``s of a task from the current identity map.
+
+    Outside a scope every call goes straight to the wrapped repository.
+    Queries other than by id are passed through untouched.
+    """
+
+    def __init__(self, inner: TaskRepository):
+        self.inner = inner
+
+    def get(self, task_id: UUID) -> Task:
+
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return self.inner.get(task_id)
+        if (task := identity_map.get(Task, task_id)) is None:
+            task = identity_map.put(Task, self.inner.get(task_id))
+        return task
+
+    def save(self, task: Task) -> None:
+
+        self.inner.save(task)
+        if identity_map := current_identity_map():
+            identity_map.replace(Task, task)
+
+    def save_many(self, tasks: Iterable[Task]) -> None:
+
+        tasks = list(tasks)
+        self.inner.save_many(tasks)
+        if identity_map := current_identity_map():
+            for task in tasks:
+                identity_map.replace(Task, task)
+
+    def delete(self, task_id: UUID) -> None:
+
+        self.inner.delete(task_id)
+        if identity_map := current_identity_map():
+            identity_map.discard(Task, task_id)
+
+    def delete_many(self, task_ids: Iterable[UUID]) -> None:
+
+        task_ids = list(task_ids)
+        self.inner.delete_many(task_ids)
+        if identity_map := current_identity_map():
+            for task_id in task_ids:
+                identity_map.discard(Task, task_id)
+
+    def exists(self, task_id: UUID) -> bool:
+
+        identity_map = current_identity_map()
+        if identity_map is not None and identity_map.get(Task, task_id) is not None:
+            return True
+        return self.inner.exists(task_id)
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+        return self.inner.count_by_project(project_id, status)
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+        return self.inner.find_by_project(project_id)
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+        return self.inner.find_by_project_page(project_id, limit, after)
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Mapping[UUID, Sequence[Task]]:
+        return self.inner.find_by_projects(project_ids)
+
+    def get_active_tasks(self) -> Sequence[Task]:
+        return self.inner.get_active_tasks()
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+        return self.inner.find_due_between(start, end)
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+        return self.inner.iter_by_project(project_id)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+        return self.inner.iter_active_tasks()
+
+
+class IdentityMapProjectRepository(ProjectRepository):
+    """Serves repeated ``get``s and ``get_inbox``es of a project from the current identity map.
+
+    The loaded tasks of a project joining the map are swapped for the task
+    instances already in it, or join it themselves, so the project and a
+    task fetched by id share one instance.
+    """
+
+    def __init__(self, inner: ProjectRepository):
+        self.inner = inner
+        self._inbox_id: Optional[UUID] = None
+
+    def _adopt(self, identity_map: IdentityMap, project: Project) -> Project:
+
+        if project.tasks_loaded:
+            project.attach_tasks([identity_map.put(Task, task) for task in project.tasks])
+        return identity_map.put(Project, project)
+
+    def get(self, project_id: UUID) -> Project:
+
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return self.inner.get(project_id)
+        if (project := identity_map.get(Project, project_id)) is None:
+            project = self._adopt(identity_map, self.inner.get(project_id))
+        return project
+
+    def get_inbox(self) -> Project:
+
+        identity_map = current_identity_map()
+        if identity_map is None:
+            return self.inner.get_inbox()
+        if self._inbox_id is not None and (inbox := identity_map.get(Project, self._inbox_id)) is not None:
+            return inbox
+        inbox = self._adopt(identity_map, self.inner.get_inbox())
+        self._inbox_id = inbox.id
+        return inbox
+
+    def exists(self, project_id: UUID) -> bool:
+
+        identity_map = current_identity_map()
+        if identity_map is not None and identity_map.get(Project, project_id) is not None:
+            return True
+        return self.inner.exists(project_id)
+
+    def get_all(self) -> List[Project]:
+        return list(self.inner.get_all())
+
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> Sequence[Project]:
+        return self.inner.get_page(limit, after)
+
+    def save(self, project: Project) -> None:
+        self.save_many([project])
+
+    def save_many(self, projects: Iterable[Project]) -> None:
+
+        projects = list(projects)
+        self.inner.save_many(projects)
+        if identity_map := current_identity_map():
+            for project in projects:
+                identity_map.replace(Project, project)
+                if project.tasks_loaded:
+                    for task in project.tasks:
+                        identity_map.replace(Task, task)
+
+    def delete(self, project_id: UUID) -> None:
+
+        self.inner.delete(project_id)
+        if identity_map := current_identity_map():
+            identity_map.discard(Project, project_id)
+            # The project's tasks went with it; they are not tracked by project here.
+            identity_map.clear(Task)
@@ -0,0 +1,381 @@
+import json
+import threading
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.entities.project import Project
+from todo_app.domain.exceptions import TaskNotFoundError, ProjectNotFoundError, InboxNotFoundError
+from todo_app.domain.value_objects import ProjectType, TaskStatus
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.infrastructure.persistence.atomic import atomic_write_text
+from todo_app.infrastructure.persistence.codecs import (
+    JsonCodec,
+    dict_to_project,
+    dict_to_task,
+    project_to_dict,
+    task_to_dict,
+)
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Journal entries and snapshots hold records in the original dict layout.
+RECORDS = JsonCodec()
+
+
+class JournalStore:
+    """Log-structured record store.
+
+    Mutations are appended as one JSON line each to ``<name>.journal``; the full
+    record set lives in an in-memory index that is rebuilt on open by loading
+    ``<name>.snapshot.json`` and replaying the journal over it. Compaction folds
+    the index back into a fresh snapshot and truncates the journal.
+    """
+
+    def __init__(
+        self,
+        data_dir: Path,
+        name: str,
+        compaction_threshold: int = 1000,
+        background_compaction: bool = False,
+    ):
+        self.snapshot_file = data_dir / f"{name}.snapshot.json"
+        self.journal_file = data_dir / f"{name}.journal"
+        self.compaction_threshold = compaction_threshold
+        self.background_compaction = background_compaction
+
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._journal_entries = 0
+        self._lock = threading.RLock()
+        self._compaction_thread: Optional[threading.Thread] = None
+
+        self._replay()
+        self._journal = self.journal_file.open("a", encoding="utf-8")
+
+    def _replay(self) -> None:
+
+        if self.snapshot_file.exists():
+            for record in json.loads(self.snapshot_file.read_text(encoding="utf-8")):
+                self._records[record["id"]] = record
+
+        if not self.journal_file.exists():
+            return
+
+        valid_bytes = 0
+        with self.journal_file.open("rb") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A torn write from a crash can only affect the tail; drop it.
+                    logger.warning(
+                        "Discarding corrupt journal tail",
+                        extra={"context": {"journal": str(self.journal_file), "offset": valid_bytes}},
+                    )
+                    break
+                self._apply(entry)
+                self._journal_entries += 1
+                valid_bytes += len(line)
+
+        if valid_bytes != self.journal_file.stat().st_size:
+            with self.journal_file.open("r+b") as journal:
+                journal.truncate(valid_bytes)
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+
+        if entry["op"] == "put":
+            record = entry["record"]
+            self._records[record["id"]] = record
+        elif entry["op"] == "del":
+            self._records.pop(entry["id"], None)
+
+    def _append(self, entries: List[Dict[str, Any]]) -> None:
+
+        with self._lock:
+            self._journal.write(
+                "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+            )
+            self._journal.flush()
+            for entry in entries:
+                self._apply(entry)
+            self._journal_entries += len(entries)
+
+            if self._journal_entries >= self.compaction_threshold:
+                self._schedule_compaction()
+
+    def _schedule_compaction(self) -> None:
+
+        if not self.background_compaction:
+            self.compact()
+            return
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+        self._compaction_thread = threading.Thread(target=self.compact, daemon=True)
+        self._compaction_thread.start()
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+
+        with self._lock:
+            return self._records.get(record_id)
+
+    def values(self) -> List[Dict[str, Any]]:
+
+        with self._lock:
+            return list(self._records.values())
+
+    def put(self, record: Dict[str, Any]) -> None:
+
+        self._append([{"op": "put", "record": record}])
+
+    def put_many(self, records: Iterable[Dict[str, Any]]) -> None:
+
+        entries = [{"op": "put", "record": record} for record in records]
+        if entries:
+            self._append(entries)
+
+    def delete(self, record_id: str) -> None:
+
+        self._append([{"op": "del", "id": record_id}])
+
+    @property
+    def journal_entries(self) -> int:
+
+        return self._journal_entries
+
+    def compact(self) -> None:
+
+        with self._lock:
+            if not self._journal_entries and self.snapshot_file.exists():
+                return
+
+            atomic_write_text(
+                self.snapshot_file, json.dumps(list(self._records.values()), separators=(",", ":"))
+            )
+
+            # The snapshot now holds everything the journal did, so start it afresh.
+            self._journal.close()
+            self._journal = self.journal_file.open("w", encoding="utf-8")
+            self._journal_entries = 0
+
+            logger.debug(
+                "Compacted journal",
+                extra={"context": {"snapshot": str(self.snapshot_file), "records": len(self._records)}},
+            )
+
+    def close(self) -> None:
+
+        if self._compaction_thread:
+            self._compaction_thread.join()
+        with self._lock:
+            self._journal.close()
+
+
+class JournalTaskRepository(TaskRepository):
+
+    def __init__(
+        self,
+        data_dir: Path,
+        compaction_threshold: int = 1000,
+        background_compaction: bool = False,
+    ):
+        self._store = JournalStore(data_dir, "tasks", compaction_threshold, background_compaction)
+
+    def get(self, task_id: UUID) -> Task:
+
+        if record := self._store.get(str(task_id)):
+            return dict_to_task(record)
+        raise TaskNotFoundError(task_id)
+
+    def save(self, task: Task) -> None:
+
+        self._store.put(task_to_dict(task))
+
+    def save_many(self, tasks: Iterable[Task]) -> None:
+
+        self._store.put_many(task_to_dict(task) for task in tasks)
+
+    def delete(self, task_id: UUID) -> None:
+
+        if self._store.get(str(task_id)) is not None:
+            self._store.delete(str(task_id))
+
+    def exists(self, task_id: UUID) -> bool:
+
+        return self._store.get(str(task_id)) is not None
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+
+        key = str(project_id)
+        return sum(
+            1
+            for t in self._store.values()
+            if t["project_id"] == key and (status is None or t["status"] == status.name)
+        )
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+
+        key = str(project_id)
+        return [dict_to_task(t) for t in self._store.values() if t["project_id"] == key]
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+
+        key = str(project_id)
+        records = (t for t in self._store.values() if t["project_id"] == key)
+        return [dict_to_task(t) for t in RECORDS.page(records, limit, after)]
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Dict[UUID, List[Task]]:
+
+        grouped: Dict[str, List[Task]] = {str(project_id): [] for project_id in project_ids}
+        for t in self._store.values():
+            if (bucket := grouped.get(t["project_id"])) is not None:
+                bucket.append(dict_to_task(t))
+        return {UUID(project_id): tasks for project_id, tasks in grouped.items()}
+
+    def get_active_tasks(self) -> Sequence[Task]:
+
+        return [dict_to_task(t) for t in self._store.values() if t["status"] != TaskStatus.DONE.name]
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+
+        key = str(project_id)
+        for t in self._store.values():
+            if t["project_id"] == key:
+                yield dict_to_task(t)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+
+        for t in self._store.values():
+            if t["status"] != TaskStatus.DONE.name:
+                yield dict_to_task(t)
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+
+        return [dict_to_task(t) for t in RECORDS.due_between(self._store.values(), start, end)]
+
+    def compact(self) -> None:
+
+        self._store.compact()
+
+    def close(self) -> None:
+
+        self._store.close()
+
+
+class JournalProjectRepository(ProjectRepository):
+
+    def __init__(
+        self,
+        data_dir: Path,
+        compaction_threshold: int = 1000,
+        background_compaction: bool = False,
+    ):
+        self._store = JournalStore(data_dir, "projects", compaction_threshold, background_compaction)
+        self._task_repo: Optional[TaskRepository] = None
+        self._lazy_tasks = False
+        self._inbox_key: Optional[str] = None
+
+        inbox = self._fetch_inbox()
+        if not inbox:
+            inbox = Project.create_inbox()
+            self.save(inbox)
+
+    def set_task_repository(self, task_repo: TaskRepository, lazy_tasks: bool = False) -> None:
+
+        self._task_repo = task_repo
+        self._lazy_tasks = lazy_tasks
+
+    def get(self, project_id: UUID) -> Project:
+
+        if record := self._store.get(str(project_id)):
+            project = dict_to_project(record)
+            self._load_project_tasks(project)
+            return project
+        raise ProjectNotFoundError(project_id)
+
+    def exists(self, project_id: UUID) -> bool:
+
+        return self._store.get(str(project_id)) is not None
+
+    def get_all(self) -> List[Project]:
+
+        return self._build_projects(self._store.values())
+
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> List[Project]:
+
+        return self._build_projects(RECORDS.page(self._store.values(), limit, after))
+
+    def _build_projects(self, records: Iterable[dict]) -> List[Project]:
+
+        projects = [dict_to_project(p) for p in records]
+        if self._task_repo and self._lazy_tasks:
+            for project in projects:
+                self._load_project_tasks(project)
+        elif self._task_repo:
+            tasks_by_project = self._task_repo.find_by_projects(p.id for p in projects)
+            for project in projects:
+                self._attach_tasks(project, tasks_by_project[project.id])
+        return projects
+
+    def save(self, project: Project) -> None:
+
+        self._store.put(project_to_dict(project))
+
+        if self._task_repo and project.tasks_loaded:
+            self._task_repo.save_many(project.tasks)
+
+    def delete(self, project_id: UUID) -> None:
+
+        if self._task_repo:
+            for task in self._task_repo.find_by_project(project_id):
+                self._task_repo.delete(task.id)
+
+        if self._store.get(str(project_id)) is not None:
+            self._store.delete(str(project_id))
+
+    def _fetch_inbox(self) -> Optional[Project]:
+
+        # The id is pinned after one scan; a pin that no longer leads to the Inbox is dropped.
+        record = self._store.get(self._inbox_key) if self._inbox_key else None
+        if record is None or record.get("project_type") != ProjectType.INBOX.name:
+            record = next(
+                (r for r in self._store.values() if r.get("project_type") == ProjectType.INBOX.name), None
+            )
+            self._inbox_key = record["id"] if record else None
+        return dict_to_project(record) if record else None
+
+    def get_inbox(self) -> Project:
+
+        inbox = self._fetch_inbox()
+        if not inbox:
+            raise InboxNotFoundError("The Inbox project was not found")
+        return inbox
+
+    def _load_project_tasks(self, project: Project) -> None:
+
+        if not self._task_repo:
+            return
+
+        if self._lazy_tasks:
+            project.defer_tasks(partial(self._task_repo.find_by_project, project.id))
+            return
+        self._attach_tasks(project, self._task_repo.find_by_project(project.id))
+
+    def _attach_tasks(self, project: Project, tasks: Iterable[Task]) -> None:
+
+        project.attach_tasks(tasks)
+
+    def compact(self) -> None:
+
+        self._store.compact()
+
+    def close(self) -> None:
+
+        self._store.close()
@@ -0,0 +1,78 @@
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, the sequence still counts writes.
+    fcntl = None
+
+SHARED = fcntl.LOCK_SH if fcntl else 1
+EXCLUSIVE = fcntl.LOCK_EX if fcntl else 2
+
+
+class StoreLock:
+    """Advisory lock and change sequence for one store file, shared across processes.
+
+    Both live in a ``<store>.seq`` sidecar: readers hold it shared, writers
+    exclusively, and every write bumps the number it contains. A reader that
+    sees the same sequence as last time can keep what it parsed then.
+
+    Each acquisition opens its own descriptor, so threads of one process
+    exclude each other just like separate processes do. Nested acquisitions
+    in the same thread reuse the outer one; a shared hold cannot be upgraded.
+    """
+
+    def __init__(self, store_path: Path):
+        self.path = store_path.with_name(store_path.name + ".seq")
+        self._held = threading.local()
+
+    def shared(self):
+        return self._acquire(SHARED)
+
+    def exclusive(self):
+        return self._acquire(EXCLUSIVE)
+
+    @contextmanager
+    def _acquire(self, mode: int) -> Iterator[BinaryIO]:
+
+        held = getattr(self._held, "file", None)
+        if held is not None:
+            if mode == EXCLUSIVE and self._held.mode != EXCLUSIVE:
+                raise RuntimeError(f"Cannot upgrade a shared lock on {self.path}")
+            yield held
+            return
+
+        # Closing the file releases the lock.
+        with os.fdopen(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644), "r+b", buffering=0) as file:
+            if fcntl:
+                fcntl.flock(file.fileno(), mode)
+            self._held.file, self._held.mode = file, mode
+            try:
+                yield file
+            finally:
+                self._held.file = None
+
+    @staticmethod
+    def _read_sequence(file: BinaryIO) -> int:
+        # Plain seek and read rather than os.pread, which Windows lacks.
+        file.seek(0)
+        return int(file.read(32) or 0)
+
+    def sequence(self) -> int:
+
+        with self.shared() as file:
+            return self._read_sequence(file)
+
+    def bump(self) -> int:
+        """Record a write; call while holding the lock exclusively."""
+
+        with self.exclusive() as file:
+            sequence = self._read_sequence(file) + 1
+            data = str(sequence).encode()
+            file.seek(0)
+            file.write(data)
+            file.truncate(len(data))
+            return sequence
@@ -1,4 +1,8 @@
-from typing import Dict, Optional, Sequence
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from functools import partial
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from uuid import UUID
 from logging import getLogger
 
@@ -13,9 +17,55 @@ logger = getLogger(__name__)
 
 
 class InMemoryTaskRepository(TaskRepository):
+    """Dict-backed task store with project, status and due-date secondary indexes.
+
+    The indexes are maintained on save/delete, including moving a task between
+    buckets when its project or status changed since it was last saved. Each
+    bucket maps task id to task, so reading one never goes back to ``_tasks``.
+    Active tasks with a deadline are also kept in a list sorted by due
+    timestamp, which turns deadline-window queries into two bisections.
+    """
 
     def __init__(self) -> None:
         self._tasks: Dict[UUID, Task] = {}
+        self._by_project: Dict[UUID, Dict[UUID, Task]] = {}
+        self._by_status: Dict[TaskStatus, Dict[UUID, Task]] = {status: {} for status in TaskStatus}
+        self._due_index: List[Tuple[float, UUID]] = []
+        self._index_keys: Dict[UUID, Tuple[UUID, TaskStatus, Optional[float]]] = {}
+
+    def _index(self, task: Task) -> None:
+
+        due_key = (
+            task.due_date.due_date.timestamp()
+            if task.due_date and task.status != TaskStatus.DONE
+            else None
+        )
+        keys = (task.project_id, task.status, due_key)
+        previous = self._index_keys.get(task.id)
+        if previous == keys:
+            # Same buckets and due slot: refresh the objects, leave the sorted list alone.
+            self._by_project[task.project_id][task.id] = task
+            self._by_status[task.status][task.id] = task
+            return
+        if previous is not None:
+            self._unindex(task.id, previous)
+
+        self._by_project.setdefault(task.project_id, {})[task.id] = task
+        self._by_status[task.status][task.id] = task
+        if due_key is not None:
+            insort(self._due_index, (due_key, task.id))
+        self._index_keys[task.id] = keys
+
+    def _unindex(self, task_id: UUID, keys: Tuple[UUID, TaskStatus, Optional[float]]) -> None:
+
+        project_id, status, due_key = keys
+        project_bucket = self._by_project[project_id]
+        del project_bucket[task_id]
+        if not project_bucket:
+            del self._by_project[project_id]
+        del self._by_status[status][task_id]
+        if due_key is not None:
+            del self._due_index[bisect_left(self._due_index, (due_key, task_id))]
 
     def get(self, task_id: UUID) -> Task:
 
@@ -27,25 +77,107 @@ class InMemoryTaskRepository(TaskRepository):
 
         logger.debug(f"Saving task {task.id} for project {task.project_id}")
         self._tasks[task.id] = task
+        self._index(task)
+
+    def save_many(self, tasks: Iterable[Task]) -> None:
+
+        for task in tasks:
+            self._tasks[task.id] = task
+            self._index(task)
 
     def delete(self, task_id: UUID) -> None:
 
-        self._tasks.pop(task_id, None)
+        if self._tasks.pop(task_id, None) is not None:
+            self._unindex(task_id, self._index_keys.pop(task_id))
+
+    def exists(self, task_id: UUID) -> bool:
+
+        return task_id in self._tasks
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+
+        return sum(
+            1
+            for task in self._by_project.get(project_id, {}).values()
+            if task.project_id == project_id and (status is None or task.status == status)
+        )
 
     def find_by_project(self, project_id: UUID) -> Sequence[Task]:
 
-        return [task for task in self._tasks.values() if task.project_id == project_id]
+        # Entities are shared with callers, so re-check fields they may have
+        # changed without saving yet.
+        return [
+            task
+            for task in self._by_project.get(project_id, {}).values()
+            if task.project_id == project_id
+        ]
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+
+        bucket = self._by_project.get(project_id, {})
+        task_ids = sorted(task_id for task_id in bucket if after is None or task_id > after)
+        page = []
+        for task_id in task_ids:
+            if len(page) == limit:
+                break
+            if (task := bucket[task_id]).project_id == project_id:
+                page.append(task)
+        return page
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Dict[UUID, List[Task]]:
+
+        return {project_id: self.find_by_project(project_id) for project_id in project_ids}
 
     def get_active_tasks(self) -> Sequence[Task]:
 
-        return [task for task in self._tasks.values() if task.status != TaskStatus.DONE]
+        return [
+            task
+            for status, bucket in self._by_status.items()
+            if status != TaskStatus.DONE
+            for task in bucket.values()
+            if task.status != TaskStatus.DONE
+        ]
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+
+        # Iterate over a copy of the bucket so callers can save while consuming.
+        for task in list(self._by_project.get(project_id, {}).values()):
+            if task.project_id == project_id:
+                yield task
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+
+        for status, bucket in self._by_status.items():
+            if status == TaskStatus.DONE:
+                continue
+            for task in list(bucket.values()):
+                if task.status != TaskStatus.DONE:
+                    yield task
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+
+        lo = bisect_right(self._due_index, start.timestamp(), key=itemgetter(0))
+        hi = bisect_right(self._due_index, end.timestamp(), key=itemgetter(0), lo=lo)
+        return [
+            task
+            for _, task_id in self._due_index[lo:hi]
+            if (task := self._tasks[task_id]).status != TaskStatus.DONE
+            and task.due_date
+            and start < task.due_date.due_date <= end
+        ]
 
 
 class InMemoryProjectRepository(ProjectRepository):
 
     def __init__(self) -> None:
         self._projects: Dict[UUID, Project] = {}
+        # Project ids kept sorted so a page is a bisection plus a slice.
+        self._ordered_ids: List[UUID] = []
         self._task_repo: Optional[TaskRepository] = None
+        self._lazy_tasks = False
+        self._inbox_id: Optional[UUID] = None
         self._initialize_inbox()
 
     def _initialize_inbox(self) -> None:
@@ -57,22 +189,33 @@ class InMemoryProjectRepository(ProjectRepository):
 
     def _fetch_inbox(self) -> Optional[Project]:
 
-        return next(
-            (p for p in self._projects.values() if p.project_type == ProjectType.INBOX), None
-        )
+        # The id is pinned after one scan; a pin that no longer leads to the Inbox is dropped.
+        inbox = self._projects.get(self._inbox_id)
+        if inbox is None or inbox.project_type != ProjectType.INBOX:
+            inbox = next(
+                (p for p in self._projects.values() if p.project_type == ProjectType.INBOX), None
+            )
+            self._inbox_id = inbox.id if inbox else None
+        return inbox
 
-    def set_task_repository(self, task_repo: TaskRepository) -> None:
+    def set_task_repository(self, task_repo: TaskRepository, lazy_tasks: bool = False) -> None:
 
         self._task_repo = task_repo
+        self._lazy_tasks = lazy_tasks
 
     def _load_project_tasks(self, project: Project) -> None:
 
         if not self._task_repo:
             return
 
-        project._tasks.clear()
-        for task in self._task_repo.find_by_project(project.id):
-            project._tasks[task.id] = task
+        if self._lazy_tasks:
+            project.defer_tasks(partial(self._task_repo.find_by_project, project.id))
+            return
+        self._attach_tasks(project, self._task_repo.find_by_project(project.id))
+
+    def _attach_tasks(self, project: Project, tasks: Iterable[Task]) -> None:
+
+        project.attach_tasks(tasks)
 
     def get(self, project_id: UUID) -> Project:
 
@@ -81,20 +224,45 @@ class InMemoryProjectRepository(ProjectRepository):
             return project
         raise ProjectNotFoundError(project_id)
 
+    def exists(self, project_id: UUID) -> bool:
+
+        return project_id in self._projects
+
     def get_all(self) -> list[Project]:
 
-        projects = list(self._projects.values())
-        for project in projects:
-            self._load_project_tasks(project)
+        return self._with_tasks(list(self._projects.values()))
+
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> list[Project]:
+
+        start = bisect_right(self._ordered_ids, after) if after else 0
+        return self._with_tasks(
+            [self._projects[project_id] for project_id in self._ordered_ids[start:start + limit]]
+        )
+
+    def _with_tasks(self, projects: list[Project]) -> list[Project]:
+
+        if self._task_repo and self._lazy_tasks:
+            for project in projects:
+                self._load_project_tasks(project)
+        elif self._task_repo:
+            tasks_by_project = self._task_repo.find_by_projects(p.id for p in projects)
+            for project in projects:
+                self._attach_tasks(project, tasks_by_project[project.id])
         return projects
 
     def save(self, project: Project) -> None:
 
+        if project.id not in self._projects:
+            insort(self._ordered_ids, project.id)
         self._projects[project.id] = project
 
+        if self._task_repo and project.tasks_loaded:
+            self._task_repo.save_many(project.tasks)
+
     def delete(self, project_id: UUID) -> None:
 
-        self._projects.pop(project_id, None)
+        if self._projects.pop(project_id, None) is not None:
+            del self._ordered_ids[bisect_left(self._ordered_ids, project_id)]
 
     def get_inbox(self) -> Project:
 
@@ -0,0 +1,327 @@
+import heapq
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.exceptions import TaskNotFoundError
+from todo_app.domain.value_objects import TaskStatus
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.infrastructure.persistence.atomic import atomic_write_text
+from todo_app.infrastructure.persistence.codecs import RecordCodec, get_codec
+from todo_app.infrastructure.persistence.file import DEFAULT_CODEC, FileTaskRepository, iter_json_array
+from todo_app.infrastructure.persistence.locking import StoreLock
+
+logger = logging.getLogger(__name__)
+
+SHARD_DIR = "tasks"
+DIRECTORY_FILE = "task_directory.log"
+# The whole-file JSON directory earlier versions kept; converted on first use.
+LEGACY_DIRECTORY_FILE = "task_directory.json"
+# Rewrite the log once it holds this many lines per live entry.
+COMPACT_RATIO = 2
+COMPACT_MIN_LINES = 1024
+
+
+class _ShardDirectory:
+    """Which shard holds each task, as an append-only log of ``<task hex> <project hex>`` lines.
+
+    An insert, move or delete appends one line per task (``-`` as the project
+    for a delete) and the latest line for a task wins, so a write costs the
+    size of the change rather than of the store. Each process replays only the
+    lines appended since it last looked. The first line names the log; a
+    compaction rewrites it under a new name once it is mostly superseded lines.
+    Updating a task in place does not touch the directory.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._store_lock = StoreLock(path)
+        self._mutex = threading.Lock()
+        self._entries: Dict[str, str] = {}
+        self._log_name: Optional[bytes] = None
+        self._offset = 0
+        self._lines = 0
+        self._sequence: Optional[int] = None
+        legacy = path.with_name(LEGACY_DIRECTORY_FILE)
+        if legacy.exists():
+            with self._store_lock.exclusive(), self._mutex:
+                if legacy.exists() and not path.exists():
+                    self._compact(json.loads(legacy.read_text()))
+                legacy.unlink(missing_ok=True)
+                Path(str(legacy) + ".seq").unlink(missing_ok=True)
+
+    def _apply(self, line: bytes) -> None:
+
+        parts = line.split()
+        if len(parts) != 2:
+            return
+        task_key, shard_key = parts[0].decode(), parts[1].decode()
+        if shard_key == "-":
+            self._entries.pop(task_key, None)
+        else:
+            self._entries[task_key] = shard_key
+        self._lines += 1
+
+    def _refresh(self) -> None:
+        """Catch up with the log; call holding the store lock and the mutex."""
+
+        sequence = self._store_lock.sequence()
+        if sequence == self._sequence:
+            return
+        try:
+            with self.path.open("rb") as file:
+                name = file.readline()
+                if name != self._log_name:
+                    self._entries, self._log_name, self._offset, self._lines = {}, name, len(name), 0
+                file.seek(self._offset)
+                data = file.read()
+        except FileNotFoundError:
+            self._entries, self._log_name, self._offset, self._lines = {}, None, 0, 0
+            data = b""
+        # Whole lines only: a crash mid-append can leave a torn last line.
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self._apply(line)
+        self._offset += end
+        self._sequence = sequence
+
+    def _compact(self, entries: Dict[str, str]) -> None:
+
+        name = f"# {uuid4().hex}\n"
+        atomic_write_text(
+            self.path, name + "".join(f"{task_key} {shard_key}\n" for task_key, shard_key in entries.items())
+        )
+        self._entries, self._log_name, self._lines = dict(entries), name.encode(), len(entries)
+        self._offset = self.path.stat().st_size
+        self._sequence = self._store_lock.bump()
+
+    def entries(self) -> Dict[str, str]:
+
+        with self._store_lock.shared(), self._mutex:
+            self._refresh()
+            return self._entries
+
+    def update(self, changes: Dict[str, Optional[str]]) -> None:
+
+        if not changes:
+            return
+        with self._store_lock.exclusive(), self._mutex:
+            self._refresh()
+            live = len(self._entries) + sum(1 for shard_key in changes.values() if shard_key)
+            if self._log_name is None or self._lines + len(changes) > max(
+                COMPACT_RATIO * live, COMPACT_MIN_LINES
+            ):
+                entries = dict(self._entries)
+                for task_key, shard_key in changes.items():
+                    if shard_key is None:
+                        entries.pop(task_key, None)
+                    else:
+                        entries[task_key] = shard_key
+                self._compact(entries)
+                return
+
+            data = "".join(
+                f"{task_key} {shard_key or '-'}\n" for task_key, shard_key in changes.items()
+            ).encode()
+            with self.path.open("r+b") as file:
+                # Drop a torn line left by a crashed append before adding to the log.
+                file.truncate(self._offset)
+                file.seek(self._offset)
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            for line in data.splitlines():
+                self._apply(line)
+            self._offset += len(data)
+            self._sequence = self._store_lock.bump()
+
+
+class ShardedTaskRepository(TaskRepository):
+    """Task store split into one file per project under ``tasks/``.
+
+    Each shard is a ``FileTaskRepository`` of its own, with the same caching,
+    locking and atomic writes, so a project query reads one small file and a
+    save rewrites only the shards it touches. Lookups by task id go through a
+    directory of task id -> project id.
+
+    The directory is updated before a task enters a shard and after it leaves
+    one, and a lookup that misses in the recorded shard searches the others,
+    so a crash can leave a stale entry but never an unreachable task.
+    """
+
+    def __init__(
+        self, data_dir: Path, codec: Optional[RecordCodec] = None, group_commit_window: float = 0.0
+    ):
+        self.shard_dir = data_dir / SHARD_DIR
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self.codec = codec or get_codec(DEFAULT_CODEC)
+        self._group_commit_window = group_commit_window
+        self._directory = _ShardDirectory(data_dir / DIRECTORY_FILE)
+        self._shards: Dict[str, FileTaskRepository] = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self, project_key: str) -> FileTaskRepository:
+
+        with self._shards_lock:
+            if (shard := self._shards.get(project_key)) is None:
+                shard = self._shards[project_key] = FileTaskRepository(
+                    self.shard_dir, self.codec, self._group_commit_window, filename=f"{project_key}.json"
+                )
+            return shard
+
+    def _existing_shard(self, project_id: UUID) -> Optional[FileTaskRepository]:
+
+        # Reading a project that has no tasks must not create an empty shard.
+        key = project_id.hex
+        if key in self._shards or (self.shard_dir / f"{key}.json").exists():
+            return self._shard(key)
+        return None
+
+    def _all_shards(self) -> List[FileTaskRepository]:
+
+        names = sorted(os.listdir(self.shard_dir))
+        return [self._shard(name[:-len(".json")]) for name in names if name.endswith(".json")]
+
+    def _locate(self, task_id: UUID) -> Optional[FileTaskRepository]:
+
+        if (project_key := self._directory.entries().get(task_id.hex)) is None:
+            return None
+        shard = self._shard(project_key)
+        if shard.exists(task_id):
+            return shard
+        # A move interrupted between the directory and the shards; repair the entry.
+        for shard in self._all_shards():
+            if shard.exists(task_id):
+                self._directory.update({task_id.hex: shard.tasks_file.stem})
+                return shard
+        return None
+
+    def get(self, task_id: UUID) -> Task:
+
+        if (shard := self._locate(task_id)) is None:
+            raise TaskNotFoundError(task_id)
+        return shard.get(task_id)
+
+    def save(self, task: Task) -> None:
+
+        self.save_many([task])
+
+    def save_many(self, tasks: Iterable[Task]) -> None:
+
+        by_shard: Dict[str, List[Task]] = {}
+        for task in tasks:
+            by_shard.setdefault(task.project_id.hex, []).append(task)
+        if not by_shard:
+            return
+
+        entries = self._directory.entries()
+        moved: Dict[str, List[UUID]] = {}
+        changes: Dict[str, Optional[str]] = {}
+        for shard_key, shard_tasks in by_shard.items():
+            for task in shard_tasks:
+                previous = entries.get(task.id.hex)
+                if previous != shard_key:
+                    changes[task.id.hex] = shard_key
+                    if previous is not None:
+                        moved.setdefault(previous, []).append(task.id)
+
+        self._directory.update(changes)
+        for shard_key, shard_tasks in by_shard.items():
+            self._shard(shard_key).save_many(shard_tasks)
+        for shard_key, task_ids in moved.items():
+            self._shard(shard_key).delete_many(task_ids)
+
+    def delete(self, task_id: UUID) -> None:
+
+        self.delete_many([task_id])
+
+    def delete_many(self, task_ids: Iterable[UUID]) -> None:
+
+        by_shard: Dict[FileTaskRepository, List[UUID]] = {}
+        for task_id in task_ids:
+            if (shard := self._locate(task_id)) is not None:
+                by_shard.setdefault(shard, []).append(task_id)
+        for shard, shard_task_ids in by_shard.items():
+            shard.delete_many(shard_task_ids)
+        self._directory.update(
+            {task_id.hex: None for shard_task_ids in by_shard.values() for task_id in shard_task_ids}
+        )
+
+    def exists(self, task_id: UUID) -> bool:
+
+        return self._locate(task_id) is not None
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+
+        shard = self._existing_shard(project_id)
+        return shard.count_by_project(project_id, status) if shard else 0
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+
+        shard = self._existing_shard(project_id)
+        return shard.find_by_project(project_id) if shard else []
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+
+        shard = self._existing_shard(project_id)
+        return shard.find_by_project_page(project_id, limit, after) if shard else []
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Dict[UUID, List[Task]]:
+
+        return {project_id: list(self.find_by_project(project_id)) for project_id in project_ids}
+
+    def get_active_tasks(self) -> Sequence[Task]:
+
+        return [task for shard in self._all_shards() for task in shard.get_active_tasks()]
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+
+        # Each shard answers in due-date order, so merging keeps the overall order.
+        return list(
+            heapq.merge(
+                *(shard.find_due_between(start, end) for shard in self._all_shards()),
+                key=lambda t: t.due_date.due_date,
+            )
+        )
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+
+        shard = self._existing_shard(project_id)
+        return shard.iter_by_project(project_id) if shard else iter(())
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+
+        return chain.from_iterable(shard.iter_active_tasks() for shard in self._all_shards())
+
+
+def migrate_to_shards(data_dir: Path, codec: Optional[RecordCodec] = None) -> int:
+    """Move ``tasks.json`` into per-project shards; returns the number of tasks moved.
+
+    The single file is kept as ``tasks.json.migrated`` so the move can be undone
+    by renaming it back. Running it again after a completed migration does nothing.
+    """
+
+    source = data_dir / "tasks.json"
+    if not source.exists():
+        return 0
+
+    codec = codec or get_codec(DEFAULT_CODEC)
+    tasks = [codec.decode_task(codec.upgrade_task(record)) for record in iter_json_array(source)]
+    ShardedTaskRepository(data_dir, codec).save_many(tasks)
+
+    os.replace(source, data_dir / "tasks.json.migrated")
+    Path(str(source) + ".seq").unlink(missing_ok=True)
+    logger.info(
+        "Migrated task store to shards",
+        extra={"context": {"data_dir": str(data_dir), "tasks": len(tasks)}},
+    )
+    return len(tasks)
@@ -0,0 +1,451 @@
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+from operator import itemgetter
+from pathlib import Path
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from todo_app.domain.entities.task import Task
+from todo_app.domain.entities.project import Project
+from todo_app.domain.exceptions import TaskNotFoundError, ProjectNotFoundError, InboxNotFoundError
+from todo_app.domain.value_objects import ProjectType, TaskStatus
+from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.project_repository import ProjectRepository
+from todo_app.application.repositories.unit_of_work import UnitOfWork
+from todo_app.infrastructure.persistence.codecs import dict_to_project, dict_to_task, project_to_dict
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    project_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed_at TEXT,
+    completion_notes TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_projects_project_type ON projects (project_type);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    project_id TEXT NOT NULL,
+    due_date TEXT,
+    priority TEXT NOT NULL,
+    status TEXT NOT NULL,
+    completed_at TEXT,
+    completion_notes TEXT
+);
+-- (project_id, id) serves both project lookups and keyset pages of a project.
+DROP INDEX IF EXISTS idx_tasks_project_id;
+CREATE INDEX IF NOT EXISTS idx_tasks_project_id_id ON tasks (project_id, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+"""
+
+TASK_COLUMNS = (
+    "id", "title", "description", "project_id", "due_date",
+    "priority", "status", "completed_at", "completion_notes",
+)
+PROJECT_COLUMNS = (
+    "id", "name", "description", "project_type", "status", "completed_at", "completion_notes",
+)
+ACTIVE_STATUSES = tuple(s.name for s in TaskStatus if s != TaskStatus.DONE)
+# Stays well below SQLITE_MAX_VARIABLE_NUMBER on every SQLite build.
+MAX_QUERY_PARAMS = 500
+
+
+def _upsert_sql(table: str, columns: Sequence[str]) -> str:
+
+    updates = ", ".join(f"{c} = excluded.{c}" for c in columns if c != "id")
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT (id) DO UPDATE SET {updates}"
+    )
+
+
+class SqliteDatabase:
+    """Connection pool for a single SQLite file.
+
+    Each thread gets its own connection (SQLite connections must not be shared
+    across concurrent requests), and the database runs in WAL mode so readers in
+    one Flask worker thread are never blocked by a writer in another. When a
+    thread goes away its connection returns to an idle list for the next thread,
+    so a thread-per-request server does not open a connection per request.
+    Each connection gets a ``cache_size_kib`` page cache, enough to keep the
+    task indexes' hot pages in memory through a bulk import.
+    """
+
+    def __init__(self, path: Path, busy_timeout_ms: int = 5000, cache_size_kib: int = 65536):
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cache_size_kib = cache_size_kib
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._idle: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+        self.connection().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(f"PRAGMA busy_timeout = {self.busy_timeout_ms}")
+        # A negative cache_size is in KiB rather than pages.
+        conn.execute(f"PRAGMA cache_size = -{self.cache_size_kib}")
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                conn = self._connect()
+            self._local.conn = conn
+            self._local.depth = 0
+            weakref.finalize(threading.current_thread(), self._release, conn)
+        return conn
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+
+        with self._lock:
+            if conn in self._connections:
+                self._idle.append(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the block in a transaction; nested calls join the outermost one."""
+
+        conn = self.connection()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    def close(self) -> None:
+
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._idle.clear()
+        self._local = threading.local()
+
+
+def _utc_text(value: datetime) -> str:
+
+    # Due dates are stored normalized to UTC so the due_date index orders
+    # lexicographically in time order.
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _task_to_row(task: Task) -> tuple:
+
+    # Built directly in TASK_COLUMNS order; this is the per-task cost of every bulk save.
+    return (
+        str(task.id),
+        task.title,
+        task.description,
+        str(task.project_id),
+        _utc_text(task.due_date.due_date) if task.due_date else None,
+        task.priority.name,
+        task.status.name,
+        task.completed_at.isoformat() if task.completed_at else None,
+        task.completion_notes,
+    )
+
+
+def _row_to_task(row: sqlite3.Row) -> Task:
+
+    return dict_to_task(dict(row))
+
+
+def _project_to_row(project: Project) -> tuple:
+
+    data = project_to_dict(project)
+    return tuple(data[c] for c in PROJECT_COLUMNS)
+
+
+class SqliteTaskRepository(TaskRepository):
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        self._upsert = _upsert_sql("tasks", TASK_COLUMNS)
+
+    @property
+    def database(self) -> SqliteDatabase:
+        return self._db
+
+    def get(self, task_id: UUID) -> Task:
+
+        row = self._db.connection().execute(
+            "SELECT * FROM tasks WHERE id = ?", (str(task_id),)
+        ).fetchone()
+        if row is None:
+            raise TaskNotFoundError(task_id)
+        return _row_to_task(row)
+
+    def save(self, task: Task) -> None:
+
+        with self._db.transaction() as conn:
+            conn.execute(self._upsert, _task_to_row(task))
+
+    def save_many(self, tasks: Iterable[Task]) -> None:
+
+        # In id order the primary key and (project_id, id) index pages are each
+        # visited once per batch instead of once per row.
+        rows = sorted(map(_task_to_row, tasks), key=itemgetter(0))
+        with self._db.transaction() as conn:
+            conn.executemany(self._upsert, rows)
+
+    def delete(self, task_id: UUID) -> None:
+
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM tasks WHERE id = ?", (str(task_id),))
+
+    def delete_many(self, task_ids: Iterable[UUID]) -> None:
+
+        with self._db.transaction() as conn:
+            conn.executemany("DELETE FROM tasks WHERE id = ?", ((str(task_id),) for task_id in task_ids))
+
+    def exists(self, task_id: UUID) -> bool:
+
+        row = self._db.connection().execute(
+            "SELECT 1 FROM tasks WHERE id = ?", (str(task_id),)
+        ).fetchone()
+        return row is not None
+
+    def count_by_project(self, project_id: UUID, status: Optional[TaskStatus] = None) -> int:
+
+        if status is None:
+            sql, params = "SELECT COUNT(*) FROM tasks WHERE project_id = ?", (str(project_id),)
+        else:
+            sql = "SELECT COUNT(*) FROM tasks WHERE project_id = ? AND status = ?"
+            params = (str(project_id), status.name)
+        return self._db.connection().execute(sql, params).fetchone()[0]
+
+    def find_by_project(self, project_id: UUID) -> Sequence[Task]:
+
+        rows = self._db.connection().execute(
+            "SELECT * FROM tasks WHERE project_id = ?", (str(project_id),)
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def find_by_project_page(
+        self, project_id: UUID, limit: int, after: Optional[UUID] = None
+    ) -> Sequence[Task]:
+
+        rows = self._db.connection().execute(
+            "SELECT * FROM tasks WHERE project_id = ? AND id > ? ORDER BY id LIMIT ?",
+            (str(project_id), str(after) if after else "", limit),
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def find_by_projects(self, project_ids: Iterable[UUID]) -> Dict[UUID, List[Task]]:
+
+        grouped: Dict[UUID, List[Task]] = {project_id: [] for project_id in project_ids}
+        keys = [str(project_id) for project_id in grouped]
+        conn = self._db.connection()
+        for start in range(0, len(keys), MAX_QUERY_PARAMS):
+            chunk = keys[start:start + MAX_QUERY_PARAMS]
+            rows = conn.execute(
+                f"SELECT * FROM tasks WHERE project_id IN ({', '.join('?' for _ in chunk)})",
+                chunk,
+            )
+            for row in rows:
+                task = _row_to_task(row)
+                grouped[task.project_id].append(task)
+        return grouped
+
+    def get_active_tasks(self) -> Sequence[Task]:
+
+        rows = self._db.connection().execute(
+            f"SELECT * FROM tasks WHERE status IN ({', '.join('?' for _ in ACTIVE_STATUSES)})",
+            ACTIVE_STATUSES,
+        )
+        return [_row_to_task(row) for row in rows]
+
+    def iter_by_project(self, project_id: UUID) -> Iterator[Task]:
+
+        rows = self._db.connection().execute(
+            "SELECT * FROM tasks WHERE project_id = ?", (str(project_id),)
+        )
+        for row in rows:
+            yield _row_to_task(row)
+
+    def iter_active_tasks(self) -> Iterator[Task]:
+
+        rows = self._db.connection().execute(
+            f"SELECT * FROM tasks WHERE status IN ({', '.join('?' for _ in ACTIVE_STATUSES)})",
+            ACTIVE_STATUSES,
+        )
+        for row in rows:
+            yield _row_to_task(row)
+
+    def find_due_between(self, start: datetime, end: datetime) -> Sequence[Task]:
+
+        rows = self._db.connection().execute(
+            "SELECT * FROM tasks WHERE due_date > ? AND due_date <= ? "
+            f"AND status IN ({', '.join('?' for _ in ACTIVE_STATUSES)}) ORDER BY due_date",
+            (_utc_text(start), _utc_text(end), *ACTIVE_STATUSES),
+        )
+        return [_row_to_task(row) for row in rows]
+
+
+class SqliteProjectRepository(ProjectRepository):
+
+    def __init__(self, database: SqliteDatabase):
+        self._db = database
+        self._task_repo: Optional[TaskRepository] = None
+        self._lazy_tasks = False
+        self._upsert = _upsert_sql("projects", PROJECT_COLUMNS)
+
+        inbox = self._fetch_inbox()
+        if not inbox:
+            inbox = Project.create_inbox()
+            self.save(inbox)
+
+    def set_task_repository(self, task_repo: TaskRepository, lazy_tasks: bool = False) -> None:
+
+        self._task_repo = task_repo
+        self._lazy_tasks = lazy_tasks
+
+    def get(self, project_id: UUID) -> Project:
+
+        row = self._db.connection().execute(
+            "SELECT * FROM projects WHERE id = ?", (str(project_id),)
+        ).fetchone()
+        if row is None:
+            raise ProjectNotFoundError(project_id)
+        project = dict_to_project(dict(row))
+        self._load_project_tasks(project)
+        return project
+
+    def exists(self, project_id: UUID) -> bool:
+
+        row = self._db.connection().execute(
+            "SELECT 1 FROM projects WHERE id = ?", (str(project_id),)
+        ).fetchone()
+        return row is not None
+
+    def get_all(self) -> List[Project]:
+
+        rows = self._db.connection().execute("SELECT * FROM projects")
+        return self._build_projects(rows)
+
+    def get_page(self, limit: int, after: Optional[UUID] = None) -> List[Project]:
+
+        rows = self._db.connection().execute(
+            "SELECT * FROM projects WHERE id > ? ORDER BY id LIMIT ?",
+            (str(after) if after else "", limit),
+        )
+        return self._build_projects(rows)
+
+    def _build_projects(self, rows: Iterable[sqlite3.Row]) -> List[Project]:
+
+        projects = [dict_to_project(dict(row)) for row in rows]
+        if self._task_repo and self._lazy_tasks:
+            for project in projects:
+                self._load_project_tasks(project)
+        elif self._task_repo:
+            tasks_by_project = self._task_repo.find_by_projects(p.id for p in projects)
+            for project in projects:
+                self._attach_tasks(project, tasks_by_project[project.id])
+        return projects
+
+    def save(self, project: Project) -> None:
+
+        self.save_many([project])
+
+    def save_many(self, projects: Iterable[Project]) -> None:
+
+        projects = list(projects)
+        with self._db.transaction() as conn:
+            conn.executemany(self._upsert, (_project_to_row(project) for project in projects))
+            if self._task_repo:
+                self._task_repo.save_many(
+                    task for project in projects if project.tasks_loaded for task in project.tasks
+                )
+
+    def delete(self, project_id: UUID) -> None:
+
+        with self._db.transaction() as conn:
+            if self._task_repo:
+                for task in self._task_repo.find_by_project(project_id):
+                    self._task_repo.delete(task.id)
+            conn.execute("DELETE FROM projects WHERE id = ?", (str(project_id),))
+
+    def _fetch_inbox(self) -> Optional[Project]:
+
+        row = self._db.connection().execute(
+            "SELECT * FROM projects WHERE project_type = ? LIMIT 1", (ProjectType.INBOX.name,)
+        ).fetchone()
+        return dict_to_project(dict(row)) if row else None
+
+    def get_inbox(self) -> Project:
+
+        inbox = self._fetch_inbox()
+        if not inbox:
+            raise InboxNotFoundError("The Inbox project was not found")
+        return inbox
+
+    def _load_project_tasks(self, project: Project) -> None:
+
+        if not self._task_repo:
+            return
+
+        if self._lazy_tasks:
+            project.defer_tasks(partial(self._task_repo.find_by_project, project.id))
+            return
+        self._attach_tasks(project, self._task_repo.find_by_project(project.id))
+
+    def _attach_tasks(self, project: Project, tasks: Iterable[Task]) -> None:
+
+        project.attach_tasks(tasks)
+
+
+class SqliteUnitOfWork(UnitOfWork):
+    """Flushes the unit of work inside one SQLite transaction."""
+
+    atomic = True
+
+    def __init__(
+        self,
+        task_repository: TaskRepository,
+        project_repository: Optional[ProjectRepository] = None,
+        *,
+        database: SqliteDatabase,
+    ):
+        super().__init__(task_repository, project_repository)
+        self._db = database
+
+    def transaction(self) -> ContextManager:
+        return self._db.transaction()
@@ -1,12 +1,21 @@
+import logging
+from functools import partial
 from pathlib import Path
 from typing import Tuple
 
 from todo_app.application.repositories.project_repository import ProjectRepository
 from todo_app.application.repositories.task_repository import TaskRepository
+from todo_app.application.repositories.unit_of_work import UnitOfWork, UnitOfWorkFactory
 from todo_app.infrastructure.persistence.memory import InMemoryTaskRepository, InMemoryProjectRepository
+from todo_app.infrastructure.persistence.codecs import get_codec
 from todo_app.infrastructure.persistence.file import FileTaskRepository, FileProjectRepository
+from todo_app.infrastructure.persistence.sharded import ShardedTaskRepository
+from todo_app.infrastructure.persistence.journal import JournalTaskRepository, JournalProjectRepository
+from todo_app.infrastructure.persistence.sqlite import SqliteDatabase, SqliteTaskRepository, SqliteProjectRepository, SqliteUnitOfWork
 from todo_app.infrastructure.config import Config, RepositoryType
 
+logger = logging.getLogger(__name__)
+
 
 def create_repositories() -> Tuple[TaskRepository, ProjectRepository]:
 
@@ -14,16 +23,50 @@ def create_repositories() -> Tuple[TaskRepository, ProjectRepository]:
 
     if repo_type == RepositoryType.FILE:
         data_dir = Config.get_data_directory()
-        task_repo = FileTaskRepository(data_dir)
-        project_repo = FileProjectRepository(data_dir)
-        project_repo.set_task_repository(task_repo)
+        codec = get_codec(Config.get_file_codec())
+        window = Config.get_file_group_commit_window()
+        layout = Config.get_file_layout()
+        if layout == "single":
+            task_repo = FileTaskRepository(data_dir, codec, window)
+        elif layout == "sharded":
+            if (data_dir / "tasks.json").exists():
+                logger.warning(
+                    "Single-file task store found; run the migration to move it into shards",
+                    extra={"context": {"data_dir": str(data_dir)}},
+                )
+            task_repo = ShardedTaskRepository(data_dir, codec, window)
+        else:
+            raise ValueError(f"Invalid file layout: {layout}")
+        project_repo = FileProjectRepository(data_dir, codec, window)
+        project_repo.set_task_repository(task_repo, Config.get_lazy_project_tasks())
+        return task_repo, project_repo
+    elif repo_type == RepositoryType.JOURNAL:
+        data_dir = Config.get_data_directory()
+        threshold = Config.get_journal_compaction_threshold()
+        task_repo = JournalTaskRepository(data_dir, threshold, background_compaction=True)
+        project_repo = JournalProjectRepository(data_dir, threshold, background_compaction=True)
+        project_repo.set_task_repository(task_repo, Config.get_lazy_project_tasks())
+        return task_repo, project_repo
+    elif repo_type == RepositoryType.SQLITE:
+        database = SqliteDatabase(Config.get_sqlite_path())
+        task_repo = SqliteTaskRepository(database)
+        project_repo = SqliteProjectRepository(database)
+        project_repo.set_task_repository(task_repo, Config.get_lazy_project_tasks())
         return task_repo, project_repo
     elif repo_type == RepositoryType.MEMORY:
 
         task_repo = InMemoryTaskRepository()
         project_repo = InMemoryProjectRepository()
 
-        project_repo.set_task_repository(task_repo)
+        project_repo.set_task_repository(task_repo, Config.get_lazy_project_tasks())
         return task_repo, project_repo
     else:
-        raise ValueError(f"Invalid repository type: {repo_type}")
\ No newline at end of file
+        raise ValueError(f"Invalid repository type: {repo_type}")
+
+
+def get_unit_of_work_factory(task_repository: TaskRepository) -> UnitOfWorkFactory:
+    """The unit of work suited to the backend of ``task_repository``."""
+
+    if isinstance(task_repository, SqliteTaskRepository):
+        return partial(SqliteUnitOfWork, database=task_repository.database)
+    return UnitOfWork
@@ -1,6 +1,6 @@
 from flask import Flask
 from todo_app.infrastructure.configuration.container import Application
-from todo_app.infrastructure.web.middleware import trace_requests
+from todo_app.infrastructure.web.middleware import freeze_clock_per_request, identity_map_per_request, trace_requests
 
 
 def create_web_app(app_container: Application) -> Flask:
@@ -10,6 +10,8 @@ def create_web_app(app_container: Application) -> Flask:
     flask_app.config["APP_CONTAINER"] = app_container
 
     trace_requests(flask_app)
+    freeze_clock_per_request(flask_app)
+    identity_map_per_request(flask_app)
 
     from . import routes
 
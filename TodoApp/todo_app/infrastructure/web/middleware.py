@@ -1,8 +1,12 @@
 from functools import wraps
 from flask import request, g
 from ..logging.trace import set_trace_id, get_trace_id
+from ..persistence.identity_map import begin_identity_map, end_identity_map
+from todo_app.domain import clock
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 def trace_requests(flask_app):
 
@@ -18,4 +22,34 @@ def trace_requests(flask_app):
 
     logging.getLogger("werkzeug").addFilter(
         lambda record: setattr(record, "trace_id", get_trace_id()) or True
-    )
\ No newline at end of file
+    )
+
+
+def freeze_clock_per_request(flask_app):
+    """Evaluate every deadline and due-date label of a request against one instant."""
+
+    @flask_app.before_request
+    def freeze_clock():
+        g.clock_token = clock.freeze_now()
+
+    @flask_app.teardown_request
+    def reset_clock(exc):
+        if (token := g.pop("clock_token", None)) is not None:
+            clock.reset_clock(token)
+
+
+def identity_map_per_request(flask_app):
+    """Give each request its own identity map and log its hit and miss counts."""
+
+    @flask_app.before_request
+    def begin_map():
+        g.identity_map_token = begin_identity_map()
+
+    @flask_app.teardown_request
+    def end_map(exc):
+        if (token := g.pop("identity_map_token", None)) is not None:
+            identity_map = end_identity_map(token)
+            logger.debug(
+                "Identity map statistics",
+                extra={"context": {"path": request.path, **identity_map.stats()}},
+            )
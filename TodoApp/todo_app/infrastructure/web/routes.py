@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, current_app, flash
 from todo_app.domain.value_objects import Priority
+from todo_app.application.common.pagination import DEFAULT_PAGE_SIZE
 from todo_app.interfaces.presenters.web import WebProjectPresenter, WebTaskPresenter
 
 bp = Blueprint("todo", __name__)
@@ -12,14 +13,48 @@ def index():
 
     app = current_app.config["APP_CONTAINER"]
     show_completed = request.args.get("show_completed", "false").lower() == "true"
+    cursor = request.args.get("cursor")
+    limit = request.args.get("limit", DEFAULT_PAGE_SIZE, type=int)
 
-    result = app.project_controller.handle_list()
+    result = app.project_controller.handle_list(limit=limit, cursor=cursor)
     if not result.is_success:
         error = project_presenter.present_error(result.error.message)
         flash(error.message, "error")
         return redirect(url_for("todo.index"))
 
-    return render_template("index.html", projects=result.success, show_completed=show_completed)
+    page = result.success
+    return render_template(
+        "index.html",
+        projects=page.items,
+        next_cursor=page.next_cursor,
+        is_first_page=not cursor,
+        limit=limit,
+        show_completed=show_completed,
+    )
+
+
+@bp.route("/projects/<project_id>/tasks")
+def project_tasks(project_id):
+
+    app = current_app.config["APP_CONTAINER"]
+    show_completed = request.args.get("show_completed", "false").lower() == "true"
+    cursor = request.args.get("cursor")
+
+    result = app.task_controller.handle_list(project_id, cursor=cursor)
+    if not result.is_success:
+        error = task_presenter.present_error(result.error.message)
+        flash(error.message, "error")
+        return redirect(url_for("todo.index"))
+
+    page = result.success
+    return render_template(
+        "project_tasks.html",
+        project_id=project_id,
+        tasks=page.items,
+        next_cursor=page.next_cursor,
+        is_first_page=not cursor,
+        show_completed=show_completed,
+    )
 
 
 @bp.route("/projects/new", methods=["GET", "POST"])
@@ -4,8 +4,8 @@ from uuid import UUID
 
 from todo_app.interfaces.view_models.project_vm import ProjectViewModel
 from todo_app.interfaces.presenters.base import ProjectPresenter
-from todo_app.interfaces.view_models.base import OperationResult
-from todo_app.application.dtos.project_dtos import CompleteProjectRequest, CreateProjectRequest, UpdateProjectRequest
+from todo_app.interfaces.view_models.base import OperationResult, PageViewModel
+from todo_app.application.dtos.project_dtos import CompleteProjectRequest, CreateProjectRequest, ListProjectsRequest, UpdateProjectRequest
 from todo_app.application.use_cases.project_use_cases import CompleteProjectUseCase, CreateProjectUseCase, GetProjectUseCase, ListProjectsUseCase, UpdateProjectUseCase
 
 @dataclass
@@ -72,16 +72,24 @@ class ProjectController:
             error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
             return OperationResult.fail(error_vm.message, error_vm.code)
 
-    def handle_list(self) -> OperationResult[list[ProjectViewModel]]:
+    def handle_list(
+        self, limit: Optional[int] = None, cursor: Optional[str] = None
+    ) -> OperationResult[PageViewModel[ProjectViewModel]]:
 
-        result = self.list_use_case.execute()
+        try:
+            result = self.list_use_case.execute(ListProjectsRequest(limit=limit, cursor=cursor))
+
+            if result.is_success:
+                page = result.value
+                view_models = [self.presenter.present_project(proj) for proj in page.items]
+                return OperationResult.succeed(PageViewModel(view_models, page.next_cursor))
 
-        if result.is_success:
-            view_models = [self.presenter.present_project(proj) for proj in result.value]
-            return OperationResult.succeed(view_models)
+            error_vm = self.presenter.present_error(result.error.message, str(result.error.code.name))
+            return OperationResult.fail(error_vm.message, error_vm.code)
 
-        error_vm = self.presenter.present_error(result.error.message, str(result.error.code.name))
-        return OperationResult.fail(error_vm.message, error_vm.code)
+        except ValueError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
 
     def handle_update(
         self, 
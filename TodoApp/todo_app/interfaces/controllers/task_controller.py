@@ -5,9 +5,10 @@ from uuid import UUID
 from todo_app.application.dtos.operations import DeletionOutcome
 from todo_app.interfaces.presenters.base import TaskPresenter
 from todo_app.interfaces.view_models.task_vm import TaskViewModel
-from todo_app.interfaces.view_models.base import OperationResult
-from todo_app.application.dtos.task_dtos import CompleteTaskRequest, CreateTaskRequest, UpdateTaskRequest
-from todo_app.application.use_cases.task_use_cases import CompleteTaskUseCase, CreateTaskUseCase, GetTaskUseCase, UpdateTaskUseCase, DeleteTaskUseCase
+from todo_app.interfaces.view_models.base import OperationResult, PageViewModel
+from todo_app.application.common.pagination import DEFAULT_PAGE_SIZE
+from todo_app.application.dtos.task_dtos import CompleteTaskRequest, CreateTaskRequest, ListProjectTasksRequest, UpdateTaskRequest
+from todo_app.application.use_cases.task_use_cases import CompleteTaskUseCase, CreateTaskUseCase, GetTaskUseCase, ListProjectTasksUseCase, UpdateTaskUseCase, DeleteTaskUseCase
 from todo_app.domain.value_objects import TaskStatus
 from todo_app.domain.value_objects import Priority
 
@@ -19,6 +20,7 @@ class TaskController:
     complete_use_case: CompleteTaskUseCase
     update_use_case: UpdateTaskUseCase
     delete_use_case: DeleteTaskUseCase
+    list_use_case: ListProjectTasksUseCase
     presenter: TaskPresenter
 
     def handle_create(
@@ -134,4 +136,24 @@ class TaskController:
             return OperationResult.fail(error_vm.message, error_vm.code)
         except ValueError as e:
             error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
-            return OperationResult.fail(error_vm.message, error_vm.code)
\ No newline at end of file
+            return OperationResult.fail(error_vm.message, error_vm.code)
+
+    def handle_list(
+        self, project_id: str, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None
+    ) -> OperationResult[PageViewModel[TaskViewModel]]:
+
+        try:
+            request = ListProjectTasksRequest(project_id=project_id, limit=limit, cursor=cursor)
+            result = self.list_use_case.execute(request)
+            if result.is_success:
+                page = result.value
+                view_models = [self.presenter.present_task(task) for task in page.items]
+                return OperationResult.succeed(PageViewModel(view_models, page.next_cursor))
+
+            error_vm = self.presenter.present_error(
+                result.error.message, str(result.error.code.name)
+            )
+            return OperationResult.fail(error_vm.message, error_vm.code)
+        except ValueError as e:
+            error_vm = self.presenter.present_error(str(e), "VALIDATION_ERROR")
+            return OperationResult.fail(error_vm.message, error_vm.code)
@@ -1,6 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
-from todo_app.domain.value_objects import Priority, TaskStatus
+from todo_app.domain import clock
+from todo_app.domain.value_objects import Priority
 from todo_app.interfaces.view_models.base import ErrorViewModel
 from todo_app.application.dtos.project_dtos import CompleteProjectResponse, ProjectResponse
 from todo_app.interfaces.view_models.project_vm import ProjectCompletionViewModel, ProjectViewModel
@@ -32,7 +33,7 @@ class CliTaskPresenter(TaskPresenter):
         if not due_date:
             return "No due date"
         
-        is_overdue = due_date < datetime.now(timezone.utc)
+        is_overdue = due_date < clock.now()
         date_str = due_date.strftime("%Y-%m-%d")
         return f"OVERDUE - Due: {date_str}" if is_overdue else f" Due: {date_str}"
     
@@ -67,17 +68,14 @@ class CliProjectPresenter(ProjectPresenter):
         # Convert tasks to view models
         task_vms = [self.task_presenter.present_task(task) for task in project_response.tasks]
 
-        # Count completed tasks
-        completed = sum(1 for task in project_response.tasks if task.status == TaskStatus.DONE)
-
         return ProjectViewModel(
             id=str(project_response.id),
             name=project_response.name,
             description=project_response.description,
             project_type=project_response.project_type.name,
             status_display=f"[{project_response.status.name}]",
-            task_count=len(project_response.tasks),
-            completed_task_count=completed,
+            task_count=project_response.task_count,
+            completed_task_count=project_response.completed_task_count,
             completion_info=self._format_completion_info(project_response.completion_date),
             tasks=task_vms,
         )
@@ -1,7 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from todo_app.domain.value_objects import TaskStatus
+from todo_app.domain import clock
 from todo_app.application.dtos.project_dtos import CompleteProjectResponse, ProjectResponse
 from todo_app.application.dtos.task_dtos import TaskResponse
 from todo_app.interfaces.presenters.base import ProjectPresenter, TaskPresenter
@@ -36,7 +36,7 @@ class WebTaskPresenter(TaskPresenter):
         if not due_date:
             return ""
 
-        is_overdue = due_date < datetime.now(timezone.utc)
+        is_overdue = due_date < clock.now()
         date_str = due_date.strftime("%Y-%m-%d")
         return f"Overdue: {date_str}" if is_overdue else date_str
 
@@ -67,12 +67,11 @@ class WebProjectPresenter(ProjectPresenter):
             description=project_response.description or "",
             project_type=project_response.project_type.name,
             status_display=project_response.status.value,
-            task_count=len(project_response.tasks),
-            completed_task_count=sum(
-                1 for task in project_response.tasks if task.status == TaskStatus.DONE
-            ),
+            task_count=project_response.task_count,
+            completed_task_count=project_response.completed_task_count,
             completion_info=self._format_completion_info(project_response.completion_date),
             tasks=[self.task_presenter.present_task(task) for task in project_response.tasks],
+            next_task_cursor=project_response.next_task_cursor,
         )
 
     def present_completion(
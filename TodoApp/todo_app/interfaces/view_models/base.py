@@ -9,6 +9,12 @@ class ErrorViewModel:
     message: str
     code: Optional[str] = None
 
+@dataclass(frozen=True)
+class PageViewModel(Generic[T]):
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+
 @dataclass
 class OperationResult(Generic[T]):
     
@@ -16,6 +16,7 @@ class ProjectViewModel:
     completed_task_count: int
     completion_info: Optional[str]
     tasks: list[TaskViewModel]
+    next_task_cursor: Optional[str] = None
 
 
 @dataclass(frozen=True)